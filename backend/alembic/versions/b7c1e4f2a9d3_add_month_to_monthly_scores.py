@@ -0,0 +1,44 @@
+"""add month to monthly_scores
+
+Revision ID: b7c1e4f2a9d3
+Revises: e389a7b38f3d
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7c1e4f2a9d3'
+down_revision = 'e389a7b38f3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('monthly_scores', sa.Column('month', sa.Date(), nullable=True))
+
+    # created_at 기준으로 월 backfill
+    op.execute("UPDATE monthly_scores SET month = date_trunc('month', created_at)::date")
+
+    # 같은 (user_id, month) 중복 행은 최고 점수(동점이면 최신 id) 하나만 남김
+    op.execute("""
+        DELETE FROM monthly_scores a
+        USING monthly_scores b
+        WHERE a.user_id = b.user_id
+          AND a.month = b.month
+          AND (a.score < b.score OR (a.score = b.score AND a.id < b.id))
+    """)
+
+    op.alter_column(
+        'monthly_scores', 'month',
+        nullable=False,
+        server_default=sa.text("(date_trunc('month', now()))::date"),
+    )
+    op.create_unique_constraint('uq_monthly_score_user_month', 'monthly_scores', ['user_id', 'month'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_monthly_score_user_month', 'monthly_scores', type_='unique')
+    op.drop_column('monthly_scores', 'month')
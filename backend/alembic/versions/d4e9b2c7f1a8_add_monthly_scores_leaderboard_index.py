@@ -0,0 +1,33 @@
+"""add covering leaderboard index to monthly_scores
+
+Revision ID: d4e9b2c7f1a8
+Revises: c3d8a1f5e6b2
+Create Date: 2026-10-18 11:20:05.384412
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4e9b2c7f1a8'
+down_revision = 'c3d8a1f5e6b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 운영 중 쓰기를 막지 않도록 CONCURRENTLY (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_monthly_scores_month_score_user
+            ON monthly_scores (month, score DESC, user_id DESC)
+            INCLUDE (nickname, created_at)
+        """)
+        # score 단일 컬럼 인덱스는 위 인덱스로 대체
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_monthly_scores_score")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_monthly_scores_score ON monthly_scores (score)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_monthly_scores_month_score_user")
@@ -0,0 +1,90 @@
+"""partition monthly_scores by month
+
+Revision ID: e7a3c5d9b4f1
+Revises: d4e9b2c7f1a8
+Create Date: 2026-10-18 12:41:52.906127
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a3c5d9b4f1'
+down_revision = 'd4e9b2c7f1a8'
+branch_labels = None
+depends_on = None
+
+PARTITION_MONTHS_AHEAD = 2
+
+COLUMNS = """
+    id INTEGER NOT NULL DEFAULT nextval('monthly_scores_id_seq'),
+    user_id INTEGER NOT NULL,
+    nickname VARCHAR(100) NOT NULL,
+    score INTEGER NOT NULL,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+    month DATE NOT NULL DEFAULT (date_trunc('month', now()))::date
+"""
+
+
+def _add_months(month_start: date, months: int) -> date:
+    index = month_start.year * 12 + month_start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes(pk_columns: str) -> None:
+    # 기존 테이블 삭제 후 같은 이름으로 생성 (인덱스/제약 이름은 스키마 전역)
+    op.execute(f"ALTER TABLE monthly_scores ADD CONSTRAINT monthly_scores_pkey PRIMARY KEY ({pk_columns})")
+    op.execute("""
+        ALTER TABLE monthly_scores ADD CONSTRAINT monthly_scores_user_id_fkey
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    """)
+    op.execute("ALTER TABLE monthly_scores ADD CONSTRAINT uq_monthly_score_user_month UNIQUE (user_id, month)")
+    op.execute("CREATE INDEX ix_monthly_scores_id ON monthly_scores (id)")
+    op.execute("CREATE INDEX ix_monthly_scores_user_id ON monthly_scores (user_id)")
+    op.execute("CREATE INDEX ix_monthly_scores_created_at ON monthly_scores (created_at)")
+    op.execute("""
+        CREATE INDEX ix_monthly_scores_month_score_user
+        ON monthly_scores (month, score DESC, user_id DESC)
+        INCLUDE (nickname, created_at)
+    """)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    op.execute("ALTER TABLE monthly_scores RENAME TO monthly_scores_legacy")
+    op.execute(f"CREATE TABLE monthly_scores ({COLUMNS}) PARTITION BY RANGE (month)")
+    op.execute("ALTER SEQUENCE monthly_scores_id_seq OWNED BY monthly_scores.id")
+
+    # 기존 데이터가 있는 달 + 이번 달부터 PARTITION_MONTHS_AHEAD개월 뒤까지 월 파티션, 나머지는 기본 파티션
+    current = date.today().replace(day=1)
+    months = set(conn.execute(sa.text("SELECT DISTINCT month FROM monthly_scores_legacy")).scalars())
+    months.update(_add_months(current, i) for i in range(PARTITION_MONTHS_AHEAD + 1))
+    for month_start in sorted(months):
+        op.execute(
+            f"CREATE TABLE monthly_scores_y{month_start.year}m{month_start.month:02d} "
+            f"PARTITION OF monthly_scores "
+            f"FOR VALUES FROM ('{month_start}') TO ('{_add_months(month_start, 1)}')"
+        )
+    op.execute("CREATE TABLE monthly_scores_default PARTITION OF monthly_scores DEFAULT")
+
+    op.execute("""
+        INSERT INTO monthly_scores (id, user_id, nickname, score, created_at, month)
+        SELECT id, user_id, nickname, score, created_at, month FROM monthly_scores_legacy
+    """)
+    op.execute("DROP TABLE monthly_scores_legacy")
+    _create_indexes("id, month")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE monthly_scores RENAME TO monthly_scores_partitioned")
+    op.execute(f"CREATE TABLE monthly_scores ({COLUMNS})")
+    op.execute("ALTER SEQUENCE monthly_scores_id_seq OWNED BY monthly_scores.id")
+    op.execute("""
+        INSERT INTO monthly_scores (id, user_id, nickname, score, created_at, month)
+        SELECT id, user_id, nickname, score, created_at, month FROM monthly_scores_partitioned
+    """)
+    op.execute("DROP TABLE monthly_scores_partitioned CASCADE")
+    _create_indexes("id")
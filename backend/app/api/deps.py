@@ -1,14 +1,21 @@
 # backend/app/api/deps.py
+import hashlib
+import time
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
 from app.core.config import settings
+from app.lru_cache import LRUCache
 
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# 검증을 통과한 Access Token payload 캐시 (key = 토큰 SHA-256, value = (payload, exp))
+token_cache = LRUCache(settings.JWT_CACHE_SIZE)
+
 
 def get_db():
     """DB 세션 의존성 - 모든 라우터에서 재사용"""
@@ -22,18 +29,31 @@ def get_db():
 def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
 ) -> dict:
-    """JWT 서명 검증 의존성 — DB 조회 없음(Stateless)"""
+    """JWT 서명 검증 의존성 — DB 조회 없음(Stateless)
+
+    한 번 검증한 토큰은 exp까지 token_cache에서 payload를 꺼내 서명 검증을 생략한다.
+    """
     if credentials is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    digest = hashlib.sha256(credentials.credentials.encode()).digest()
+    cached = token_cache.get(digest)
+    if cached is not None:
+        payload, exp = cached
+        if time.time() < exp:
+            return dict(payload)
+        token_cache.pop(digest)
     try:
         payload = jwt.decode(
             credentials.credentials,
             settings.JWT_SECRET_KEY,
             algorithms=[settings.JWT_ALGORITHM],
         )
-        return payload  # {"sub": "1", "email": "...", "role": "...", "nickname": "...", "exp": ...}
     except (JWTError, TypeError, ValueError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    # exp 없는 토큰은 만료 시점을 알 수 없으므로 캐시하지 않음
+    if isinstance(payload.get("exp"), (int, float)):
+        token_cache.set(digest, (dict(payload), payload["exp"]))
+    return payload  # {"sub": "1", "email": "...", "role": "...", "nickname": "...", "exp": ...}
 
     # [비활성화] DB 조회 방식 — JWT 설계 의도(Stateless)와 맞지 않아 제거
     # user_id = int(payload.get("sub"))
@@ -9,6 +9,8 @@ from app.api.v1 import (
     users,
     friends,
     monthly_scores,
+    leaderboards,
+    events,
     game_visits,
 )
 
@@ -17,5 +19,7 @@ __all__ = [
     "users",
     "friends",
     "monthly_scores",
+    "leaderboards",
+    "events",
     "game_visits",
 ]
@@ -1,13 +1,17 @@
 # backend/app/api/v1/auth.py
+import hashlib
+import time
 import uuid
-from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, status, Response, Cookie
+from datetime import date, datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, Response, Cookie
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from authlib.integrations.httpx_client import AsyncOAuth2Client
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_current_user, require_admin
+from app.api.v1.game_visits import get_client_ip
 from app.core.config import settings
-from app.core.security import hash_password, verify_password, create_access_token, create_refresh_token
+from app.core.security import password_hasher, create_access_token, create_refresh_token
 from app.redis_client import redis_client
 from app.schemas.user import (
     UserRegisterRequest,
@@ -15,6 +19,11 @@ from app.schemas.user import (
     LoginRequest,
     LoginResponse,
     GoogleLoginRequest,
+    LoginThrottleCounter,
+    LoginThrottleCountersResponse,
+    RefreshSessionResponse,
+    RefreshSessionListResponse,
+    LogoutAllResponse,
 )
 
 # 기존 models.py 사용 (아직 이동하지 않음)
@@ -25,13 +34,170 @@ from models import User
 router = APIRouter()
 
 REFRESH_TTL = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
+REFRESH_SESSION_PREFIX = "refresh_session:"
+
+# 사용자의 모든 refresh 세션 HASH에 클레임 반영 (만료됐거나 사라진 세션은 인덱스에서 제거)
+# KEYS[1]=사용자 세션 인덱스 ZSET, ARGV[1]=세션 key prefix, ARGV[2]=현재 시각(unix 초), ARGV[3..]=field, value 쌍
+# 세션 key는 인덱스 member(세션 ID)로 만들어지므로 단일 Redis 인스턴스 전제
+SYNC_REFRESH_SESSIONS_SCRIPT = redis_client.register_script("""
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[2])
+local fields = {}
+for i = 3, #ARGV do
+    fields[#fields + 1] = ARGV[i]
+end
+for _, sid in ipairs(redis.call('ZRANGE', KEYS[1], 0, -1)) do
+    local key = ARGV[1] .. sid
+    if redis.call('EXISTS', key) == 1 then
+        redis.call('HSET', key, unpack(fields))
+    else
+        redis.call('ZREM', KEYS[1], sid)
+    end
+end
+return redis.call('ZCARD', KEYS[1])
+""")
+
+# 사용자의 모든 refresh 세션 폐기 (SCAN 없이 인덱스만 따라감) + 폐기 시각 기록, 폐기한 세션 수 반환
+# KEYS[1]=사용자 세션 인덱스 ZSET, KEYS[2]=폐기 시각 key
+# ARGV[1]=세션 key prefix, ARGV[2]=현재 시각(unix 초), ARGV[3]=폐기 시각 보관 기간(초)
+# 폐기 시각은 인덱스에 없는 구 형식 `refresh:{token}` 토큰을 거부하는 데 쓴다 (_legacy_refresh_claims)
+REVOKE_REFRESH_SESSIONS_SCRIPT = redis_client.register_script("""
+local revoked = 0
+for _, sid in ipairs(redis.call('ZRANGE', KEYS[1], 0, -1)) do
+    revoked = revoked + redis.call('DEL', ARGV[1] .. sid)
+end
+redis.call('DEL', KEYS[1])
+redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+return revoked
+""")
+
+# 로그인 시도 슬라이딩 윈도우 검사 + 기록 (email/IP 두 key를 1회 왕복으로 원자적 처리)
+# KEYS[1]=email 시도 ZSET, KEYS[2]=IP 시도 ZSET, KEYS[3]=카운터 인덱스 ZSET (member = key, score = 만료 시각 ms)
+# ARGV[1]=현재 시각(ms), ARGV[2]=윈도우(ms), ARGV[3]=시도 member, ARGV[4]=email 한도, ARGV[5]=IP 한도
+# 한도를 넘은 key가 있으면 기록하지 않고 {0, 재시도까지 남은 ms}, 통과하면 두 key에 시도를 기록하고 {1, 0}
+LOGIN_THROTTLE_SCRIPT = redis_client.register_script("""
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local retry_after = 0
+for i = 1, 2 do
+    redis.call('ZREMRANGEBYSCORE', KEYS[i], '-inf', now - window)
+    if redis.call('ZCARD', KEYS[i]) >= tonumber(ARGV[3 + i]) then
+        local oldest = redis.call('ZRANGE', KEYS[i], 0, 0, 'WITHSCORES')
+        retry_after = math.max(retry_after, tonumber(oldest[2]) + window - now)
+    end
+end
+if retry_after > 0 then
+    return {0, retry_after}
+end
+for i = 1, 2 do
+    redis.call('ZADD', KEYS[i], now, ARGV[3])
+    redis.call('PEXPIRE', KEYS[i], window)
+    redis.call('ZADD', KEYS[3], now + window, KEYS[i])
+end
+redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', now)
+return {1, 0}
+""")
+
+
+def get_login_throttle_key(kind: str, subject: str) -> str:
+    """로그인 시도 ZSET (member = 시도 ID, score = 시도 시각 ms)"""
+    return f"login_throttle:{kind}:{subject}"
+
+
+def get_login_throttle_index_key() -> str:
+    """관리자 조회용 활성 카운터 key 인덱스 (만료 시각 지난 항목은 기록/조회 시 정리)"""
+    return "login_throttle:index"
+
+
+def _login_throttle_limit(kind: str) -> int:
+    return settings.LOGIN_THROTTLE_EMAIL_LIMIT if kind == "email" else settings.LOGIN_THROTTLE_IP_LIMIT
+
+
+def check_login_throttle(email: str, client_ip: str):
+    """email/IP별 로그인 시도 한도 확인 후 시도 기록 — 한도를 넘으면 429 + Retry-After
+
+    비밀번호 검증(bcrypt)보다 먼저 호출해 거절되는 시도는 Redis 1회 왕복만 쓰게 한다.
+    로그인 자체가 refresh 토큰 저장에 Redis를 쓰므로 Redis 장애 시에는 예외를 그대로 올려 503.
+    """
+    allowed, retry_after_ms = LOGIN_THROTTLE_SCRIPT(
+        keys=[
+            get_login_throttle_key("email", email.strip().lower()),
+            get_login_throttle_key("ip", client_ip),
+            get_login_throttle_index_key(),
+        ],
+        args=[
+            int(time.time() * 1000),
+            settings.LOGIN_THROTTLE_WINDOW_SECONDS * 1000,
+            uuid.uuid4().hex,
+            settings.LOGIN_THROTTLE_EMAIL_LIMIT,
+            settings.LOGIN_THROTTLE_IP_LIMIT,
+        ],
+    )
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, please retry later",
+            headers={"Retry-After": str(max(1, -(-int(retry_after_ms) // 1000)))},
+        )
+
+
+def get_refresh_session_id(refresh_token: str) -> str:
+    """refresh 토큰 원문 대신 key에 쓰는 세션 ID (SHA-256)"""
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+def get_refresh_session_key(session_id: str) -> str:
+    """refresh 세션 HASH (user_id, email, role, nickname — Access Token 재발급에 필요한 클레임)"""
+    return f"{REFRESH_SESSION_PREFIX}{session_id}"
+
+
+def get_user_sessions_key(user_id: int) -> str:
+    """사용자별 refresh 세션 인덱스 ZSET (member = 세션 ID, score = 만료 시각 unix 초)
+
+    클레임 동기화/세션 목록/일괄 폐기가 SCAN 없이 이 인덱스만 따라가며, 만료된 항목은 기록/조회 때 정리된다.
+    """
+    return f"refresh_sessions:user:{user_id}"
+
+
+def get_sessions_revoked_key(user_id: int) -> str:
+    """사용자 세션을 마지막으로 일괄 폐기한 시각 (이전에 발급된 구 형식 토큰 거부용, TTL = refresh 수명)"""
+    return f"refresh_sessions:revoked:{user_id}"
+
+
+def _session_claims(user) -> dict:
+    return {"email": user.email, "role": user.role, "nickname": user.nickname}
+
+
+def sync_refresh_sessions(user) -> int:
+    """사용자 정보 변경을 모든 refresh 세션 클레임에 반영 (1회 왕복), 남아 있는 세션 수 반환"""
+    args = [REFRESH_SESSION_PREFIX, int(time.time())]
+    for field, value in _session_claims(user).items():
+        args += [field, value]
+    return SYNC_REFRESH_SESSIONS_SCRIPT(keys=[get_user_sessions_key(user.id)], args=args)
+
+
+def revoke_refresh_sessions(user_id: int) -> int:
+    """사용자의 모든 refresh 세션 폐기 (1회 왕복), 폐기한 세션 수 반환"""
+    return REVOKE_REFRESH_SESSIONS_SCRIPT(
+        keys=[get_user_sessions_key(user_id), get_sessions_revoked_key(user_id)],
+        args=[REFRESH_SESSION_PREFIX, int(time.time()), REFRESH_TTL],
+    )
 
 
 def _create_login_response(user, response: Response) -> LoginResponse:
-    access_token = create_access_token({"sub": str(user.id), "email": user.email, "role": user.role, "nickname": user.nickname})
+    access_token = create_access_token({"sub": str(user.id), **_session_claims(user)})
 
     refresh_token = create_refresh_token()
-    redis_client.setex(f"refresh:{refresh_token}", REFRESH_TTL, str(user.id))
+    session_id = get_refresh_session_id(refresh_token)
+    session_key = get_refresh_session_key(session_id)
+    sessions_key = get_user_sessions_key(user.id)
+    now = int(time.time())
+    pipe = redis_client.pipeline()
+    pipe.hset(session_key, mapping={"user_id": user.id, **_session_claims(user)})
+    pipe.expire(session_key, REFRESH_TTL)
+    pipe.zremrangebyscore(sessions_key, "-inf", now)
+    pipe.zadd(sessions_key, {session_id: now + REFRESH_TTL})
+    pipe.expire(sessions_key, REFRESH_TTL)
+    pipe.execute()
 
     response.set_cookie(
         key="refresh_token",
@@ -53,27 +219,92 @@ def _create_login_response(user, response: Response) -> LoginResponse:
     )
 
 
+def get_user_by_email(db: Session, email: str):
+    """email로 사용자 조회 (async 엔드포인트에서 run_in_threadpool로 호출)"""
+    return db.query(User).filter(User.email == email).first()
+
+
+def save_user(db: Session, user):
+    """새 사용자 저장 후 갱신된 객체 반환 (async 엔드포인트에서 run_in_threadpool로 호출)"""
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
 @router.post("/login", response_model=LoginResponse)
-def login(
+async def login(
     login_request: LoginRequest,
+    request: Request,
     response: Response,
     db: Session = Depends(get_db)
 ):
-    """로그인 엔드포인트 (API Key 불필요)"""
-    user = db.query(User).filter(User.email == login_request.email).first()
+    """로그인 엔드포인트 (API Key 불필요)
+
+    email/IP별 시도 한도를 먼저 확인해 초과 시 비밀번호 검증 없이 429.
+    비밀번호 검증은 해싱 프로세스 풀에서 await하고(대기열이 가득 차면 즉시 503),
+    동기 DB/Redis 호출만 run_in_threadpool로 실행해 해싱 대기가 threadpool 스레드를 잡지 않는다.
+    """
+    await run_in_threadpool(check_login_throttle, login_request.email, get_client_ip(request))
+
+    user = await run_in_threadpool(get_user_by_email, db, login_request.email)
     if user is None or user.auth_provider != "local":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
 
-    if not verify_password(login_request.password, user.password):
+    if not await password_hasher.verify(login_request.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
 
-    return _create_login_response(user, response)
+    return await run_in_threadpool(_create_login_response, user, response)
+
+
+@router.get("/auth/login-throttle", response_model=LoginThrottleCountersResponse)
+def get_login_throttle_counters(
+    limit: int = Query(100, ge=1, le=1000),
+    _: dict = Depends(require_admin),
+):
+    """현재 윈도우 안에 시도가 남아 있는 로그인 카운터 조회 (admin 전용, 최근 시도 순)"""
+    now_ms = int(time.time() * 1000)
+    window_ms = settings.LOGIN_THROTTLE_WINDOW_SECONDS * 1000
+    index_key = get_login_throttle_index_key()
+
+    pipe = redis_client.pipeline()
+    pipe.zremrangebyscore(index_key, "-inf", now_ms)
+    pipe.zrevrange(index_key, 0, limit - 1)
+    pipe.zcard(index_key)
+    _, keys, total = pipe.execute()
+
+    pipe = redis_client.pipeline()
+    for key in keys:
+        pipe.zcount(key, now_ms - window_ms + 1, "+inf")
+        pipe.zrangebyscore(key, now_ms - window_ms + 1, "+inf", start=0, num=1, withscores=True)
+    results = pipe.execute()
+
+    counters = []
+    for i, key in enumerate(keys):
+        attempts, oldest = results[2 * i], results[2 * i + 1]
+        if not attempts:
+            continue
+        _, kind, subject = key.split(":", 2)
+        limit_for_kind = _login_throttle_limit(kind)
+        counters.append(LoginThrottleCounter(
+            kind=kind,
+            subject=subject,
+            attempts=attempts,
+            limit=limit_for_kind,
+            blocked=attempts >= limit_for_kind,
+            reset_in=max(0, -(-(int(oldest[0][1]) + window_ms - now_ms) // 1000)),
+        ))
+    return LoginThrottleCountersResponse(
+        window_seconds=settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+        counters=counters,
+        total=total,
+    )
 
 
 @router.post("/auth/google", response_model=LoginResponse)
@@ -131,13 +362,13 @@ async def google_login(data: GoogleLoginRequest, response: Response, db: Session
 
 
 @router.post("/register", response_model=LoginResponse, status_code=status.HTTP_201_CREATED)
-def register_user(
+async def register_user(
     user: UserRegisterRequest,
     response: Response,
     db: Session = Depends(get_db)
 ):
     """일반 회원가입 엔드포인트 (API Key 불필요)"""
-    existing_user = db.query(User).filter(User.email == user.email).first()
+    existing_user = await run_in_threadpool(get_user_by_email, db, user.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -147,15 +378,51 @@ def register_user(
     db_user = User(
         email=user.email,
         nickname=user.nickname,
-        password=hash_password(user.password),
+        password=await password_hasher.hash(user.password),
         birth_date=user.birth_date,
         role="user"
     )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    db_user = await run_in_threadpool(save_user, db, db_user)
+
+    return await run_in_threadpool(_create_login_response, db_user, response)
+
+
+def _legacy_refresh_claims(db: Session, refresh_token: str) -> dict | None:
+    """배포 전에 발급된 `refresh:{token}` (값 = user_id) 토큰의 클레임을 DB에서 조회 — 만료되면 제거 가능
 
-    return _create_login_response(db_user, response)
+    구 형식 토큰은 세션 인덱스에 없으므로, 남은 TTL로 계산한 발급 시각이 마지막 일괄 폐기(비밀번호 변경,
+    전체 로그아웃, 탈퇴)보다 이르면 거부한다. 통과한 토큰은 세션 HASH로 옮겨 인덱스에 올린다.
+    """
+    legacy_key = f"refresh:{refresh_token}"
+    pipe = redis_client.pipeline()
+    pipe.get(legacy_key)
+    pipe.ttl(legacy_key)
+    user_id, ttl = pipe.execute()
+    if not user_id or ttl <= 0:
+        return None
+
+    now = int(time.time())
+    revoked_at = redis_client.get(get_sessions_revoked_key(int(user_id)))
+    if revoked_at is not None and now - (REFRESH_TTL - ttl) <= int(revoked_at):
+        redis_client.delete(legacy_key)
+        return None
+
+    user = db.query(User).filter(User.id == int(user_id)).first()
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+
+    claims = {"user_id": str(user.id), **_session_claims(user)}
+    session_id = get_refresh_session_id(refresh_token)
+    session_key = get_refresh_session_key(session_id)
+    sessions_key = get_user_sessions_key(user.id)
+    pipe = redis_client.pipeline()
+    pipe.hset(session_key, mapping=claims)
+    pipe.expire(session_key, ttl)
+    pipe.zadd(sessions_key, {session_id: now + ttl})
+    pipe.expire(sessions_key, REFRESH_TTL)
+    pipe.delete(legacy_key)
+    pipe.execute()
+    return claims
 
 
 @router.post("/auth/refresh")
@@ -163,18 +430,22 @@ def refresh_access_token(
     refresh_token: str = Cookie(default=None),
     db: Session = Depends(get_db),
 ):
+    """Access Token 재발급 — 세션 HASH에 저장된 클레임으로 만들어 Redis 1회 왕복, DB 조회 없음
+
+    세션은 첫 쿼리 때 연결을 가져오므로 구 형식 토큰이 아니면 Postgres 연결을 쓰지 않는다.
+    """
     if not refresh_token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token missing")
 
-    user_id = redis_client.get(f"refresh:{refresh_token}")
-    if not user_id:
+    claims = redis_client.hgetall(get_refresh_session_key(get_refresh_session_id(refresh_token)))
+    if not claims:
+        claims = _legacy_refresh_claims(db, refresh_token)
+    if not claims:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired refresh token")
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if not user:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-
-    new_access = create_access_token({"sub": str(user.id), "email": user.email, "role": user.role, "nickname": user.nickname})
+    new_access = create_access_token({
+        "sub": claims["user_id"], "email": claims["email"], "role": claims["role"], "nickname": claims["nickname"],
+    })
     return {"access_token": new_access, "token_type": "bearer"}
 
 
@@ -186,7 +457,50 @@ def logout(
     import logging
     logging.warning(f"[logout] refresh_token received: {refresh_token}")
     if refresh_token:
-        redis_client.delete(f"refresh:{refresh_token}")
+        session_id = get_refresh_session_id(refresh_token)
+        session_key = get_refresh_session_key(session_id)
+        user_id = redis_client.hget(session_key, "user_id")
+        pipe = redis_client.pipeline()
+        pipe.delete(session_key, f"refresh:{refresh_token}")
+        if user_id:
+            pipe.zrem(get_user_sessions_key(int(user_id)), session_id)
+        pipe.execute()
 
     response.delete_cookie(key="refresh_token", path="/api/v1/auth")
     return {"message": "Logged out"}
+
+
+@router.get("/auth/sessions", response_model=RefreshSessionListResponse)
+def get_sessions(
+    refresh_token: str = Cookie(default=None),
+    current_user: dict = Depends(get_current_user),
+):
+    """내 로그인 세션 목록 — 사용자 세션 인덱스만 읽는 파이프라인 1회 (만료 항목 정리 포함)"""
+    sessions_key = get_user_sessions_key(int(current_user["sub"]))
+    pipe = redis_client.pipeline()
+    pipe.zremrangebyscore(sessions_key, "-inf", int(time.time()))
+    pipe.zrevrange(sessions_key, 0, -1, withscores=True)
+    _, raw = pipe.execute()
+
+    current_id = get_refresh_session_id(refresh_token) if refresh_token else None
+    sessions = [
+        RefreshSessionResponse(
+            session_id=session_id,
+            created_at=datetime.fromtimestamp(expires_at - REFRESH_TTL),
+            expires_at=datetime.fromtimestamp(expires_at),
+            current=session_id == current_id,
+        )
+        for session_id, expires_at in raw
+    ]
+    return RefreshSessionListResponse(sessions=sessions, total=len(sessions))
+
+
+@router.post("/auth/logout-all", response_model=LogoutAllResponse)
+def logout_all(
+    response: Response,
+    current_user: dict = Depends(get_current_user),
+):
+    """모든 기기에서 로그아웃 — 내 refresh 세션 전체를 1회 왕복으로 폐기 (발급된 Access Token은 만료까지 유효)"""
+    revoked = revoke_refresh_sessions(int(current_user["sub"]))
+    response.delete_cookie(key="refresh_token", path="/api/v1/auth")
+    return LogoutAllResponse(message="Logged out from all sessions", revoked=revoked)
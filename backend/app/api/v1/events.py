@@ -0,0 +1,235 @@
+# backend/app/api/v1/events.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from datetime import datetime
+
+from app.redis_client import redis_client
+
+from app.api.deps import get_db, require_admin
+from app.api.v1.monthly_scores import (
+    LEADERBOARD_DEFAULT_LIMIT,
+    LEADERBOARD_MAX_LIMIT,
+    WARM_UP_CHUNK_SIZE,
+    build_next_cursor,
+    get_cursor_offset,
+    get_nickname_key,
+    parse_cursor,
+    resolve_nicknames,
+)
+from app.core.config import settings
+from app.schemas.event import (
+    EventCreateRequest,
+    EventResponse,
+    EventListResponse,
+    EventScoreRequest,
+    EventScoreResponse,
+    EventLeaderboardResponse,
+)
+from app.schemas.leaderboard import LeaderboardEntry
+
+# 기존 models.py 사용
+import sys
+sys.path.insert(0, '/code')
+from models import User, Event, EventScore
+
+router = APIRouter()
+
+# 종료 후 보관 작업이 끝나지 않아도 ZSET이 스스로 사라지도록 종료 시각 + 유예 시간에 만료
+EVENT_KEY_GRACE_SECONDS = 24 * 3600
+
+
+# 이벤트 최고 점수 갱신 + 최대 인원 초과분(최하위) 제거 + 만료 시각 지정 (1회 왕복, 원자적)
+# KEYS[1]=이벤트 리더보드 ZSET, KEYS[2]=닉네임 HASH
+# ARGV[1]=user_id, ARGV[2]=score, ARGV[3]=nickname, ARGV[4]=만료 시각(unix 초), ARGV[5]=최대 인원
+# 반환값: {반영 후 최고 점수, 0-based 순위} (최대 인원 밖이면 둘 다 nil)
+EVENT_SCORE_SCRIPT = redis_client.register_script("""
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[3])
+local best = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not best or tonumber(best) < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+    local overflow = redis.call('ZCARD', KEYS[1]) - tonumber(ARGV[5])
+    if overflow > 0 then
+        redis.call('ZREMRANGEBYRANK', KEYS[1], 0, overflow - 1)
+    end
+end
+redis.call('EXPIREAT', KEYS[1], ARGV[4])
+return {redis.call('ZSCORE', KEYS[1], ARGV[1]), redis.call('ZREVRANK', KEYS[1], ARGV[1])}
+""")
+
+
+def get_event_key(event_id: int) -> str:
+    """이벤트 리더보드 ZSET (member = user_id, score = 이벤트 내 최고 점수)"""
+    return f"events:board:{event_id}"
+
+
+def _to_local(dt: datetime) -> datetime:
+    """timezone이 있는 시각은 서버 로컬 naive 시각으로 변환 (DB/비교 기준 통일)"""
+    return dt.astimezone().replace(tzinfo=None) if dt.tzinfo else dt
+
+
+def _get_event_or_404(db: Session, event_id: int) -> Event:
+    event = db.query(Event).filter(Event.id == event_id).first()
+    if event is None:
+        raise HTTPException(status_code=404, detail=f"Event {event_id} not found")
+    return event
+
+
+def archive_event(db: Session, event: Event) -> int:
+    """종료된 이벤트의 Redis 순위를 event_scores에 청크 단위로 기록하고 ZSET 삭제 (이미 보관했으면 건너뜀)
+
+    기록한 행 수를 반환. Redis 장애로 실패하면 예외를 그대로 올려 다음 주기에 재시도한다.
+    """
+    if event.archived_at is not None:
+        return 0
+
+    key = get_event_key(event.id)
+    rank, start = 0, 0
+    while True:
+        raw = redis_client.zrevrange(key, start, start + WARM_UP_CHUNK_SIZE - 1, withscores=True)
+        if not raw:
+            break
+        nicknames = resolve_nicknames(db, [int(m) for m, _ in raw])
+        values = []
+        for m, s in raw:
+            rank += 1
+            values.append({
+                "event_id": event.id, "rank": rank,
+                "user_id": int(m), "nickname": nicknames.get(int(m), ""), "score": int(s),
+            })
+        db.execute(pg_insert(EventScore).values(values).on_conflict_do_nothing())
+        start += WARM_UP_CHUNK_SIZE
+
+    event.archived_at = datetime.now()
+    db.commit()
+    try:
+        redis_client.delete(key)
+    except Exception:
+        pass  # 만료 시각(종료 + 유예)에 어차피 사라짐
+    return rank
+
+
+def archive_ended_events(db: Session) -> int:
+    """종료됐지만 아직 보관되지 않은 이벤트를 모두 보관, 보관한 이벤트 수 반환"""
+    events = db.query(Event).filter(
+        Event.ends_at <= datetime.now(),
+        Event.archived_at.is_(None),
+    ).order_by(Event.ends_at).all()
+    for event in events:
+        archive_event(db, event)
+    return len(events)
+
+
+@router.post("", response_model=EventResponse)
+def create_event(
+    body: EventCreateRequest,
+    db: Session = Depends(get_db),
+    _: dict = Depends(require_admin),
+):
+    """이벤트 생성 (admin 전용) — 기간 동안만 점수를 받고 종료 후 자동 보관"""
+    starts_at, ends_at = _to_local(body.starts_at), _to_local(body.ends_at)
+    if ends_at <= starts_at:
+        raise HTTPException(status_code=400, detail="ends_at must be after starts_at")
+    event = Event(name=body.name, starts_at=starts_at, ends_at=ends_at)
+    db.add(event)
+    db.commit()
+    db.refresh(event)
+    return event
+
+
+@router.get("", response_model=EventListResponse)
+def get_events(
+    limit: int = Query(LEADERBOARD_DEFAULT_LIMIT, ge=1, le=LEADERBOARD_MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """이벤트 목록 조회 (최근 시작 순)"""
+    total = db.query(Event).count()
+    events = db.query(Event).order_by(Event.starts_at.desc(), Event.id.desc()).offset(offset).limit(limit).all()
+    return EventListResponse(events=events, total=total)
+
+
+@router.get("/{event_id}", response_model=EventResponse)
+def get_event(event_id: int, db: Session = Depends(get_db)):
+    return _get_event_or_404(db, event_id)
+
+
+@router.post("/{event_id}/scores", response_model=EventScoreResponse)
+def submit_event_score(
+    event_id: int,
+    score_data: EventScoreRequest,
+    db: Session = Depends(get_db)
+):
+    """이벤트 점수 제출 (최고 점수만 반영) — 진행 중(starts_at <= now < ends_at)일 때만 허용
+
+    이벤트 ZSET 하나에만 Lua 1회 왕복으로 기록하고 DB에는 쓰지 않는다 (종료 후 보관 작업이 기록).
+    Redis가 유일한 저장소이므로 Redis 장애 시 503.
+    """
+    event = _get_event_or_404(db, event_id)
+    now = datetime.now()
+    if not event.starts_at <= now < event.ends_at:
+        raise HTTPException(status_code=409, detail=f"Event {event_id} is not active")
+    user = db.query(User).filter(User.id == score_data.user_id).first()
+    if user is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"User with id {score_data.user_id} not found"
+        )
+
+    expire_at = int(event.ends_at.timestamp()) + EVENT_KEY_GRACE_SECONDS
+    best, rank = EVENT_SCORE_SCRIPT(
+        keys=[get_event_key(event.id), get_nickname_key()],
+        args=[user.id, score_data.score, user.nickname, expire_at, settings.EVENT_MAX_ENTRIES],
+    )
+    return EventScoreResponse(
+        event_id=event.id,
+        user_id=user.id,
+        score=int(float(best)) if best is not None else None,
+        rank=rank + 1 if rank is not None else None,
+    )
+
+
+@router.get("/{event_id}/leaderboard", response_model=EventLeaderboardResponse)
+def get_event_leaderboard(
+    event_id: int,
+    limit: int = Query(LEADERBOARD_DEFAULT_LIMIT, ge=1, le=LEADERBOARD_MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
+    db: Session = Depends(get_db)
+):
+    """이벤트 리더보드 페이지 조회 - 진행 중/보관 전에는 Redis ZSET, 보관 후에는 event_scores"""
+    event = _get_event_or_404(db, event_id)
+    page_cursor = parse_cursor(cursor) if cursor else None
+
+    if event.archived_at is not None:
+        query = db.query(EventScore).filter(EventScore.event_id == event.id)
+        total = query.count()
+        if page_cursor is not None:
+            offset = page_cursor[2]
+        rows = query.filter(EventScore.rank > offset).order_by(EventScore.rank).limit(limit).all()
+        scores = [
+            LeaderboardEntry(user_id=row.user_id, nickname=row.nickname, score=row.score, rank=row.rank)
+            for row in rows
+        ]
+        return EventLeaderboardResponse(
+            event_id=event.id, archived=True, scores=scores, total=total,
+            next_cursor=build_next_cursor(scores, limit),
+        )
+
+    key = get_event_key(event.id)
+    if page_cursor is not None:
+        offset = get_cursor_offset(key, page_cursor)
+    pipe = redis_client.pipeline()
+    pipe.zrevrange(key, offset, offset + limit - 1, withscores=True)
+    pipe.zcard(key)
+    raw, total = pipe.execute()
+    nicknames = resolve_nicknames(db, [int(m) for m, _ in raw])
+    scores = [
+        LeaderboardEntry(user_id=int(m), nickname=nicknames.get(int(m), ""), score=int(s), rank=offset + i + 1)
+        for i, (m, s) in enumerate(raw)
+    ]
+    return EventLeaderboardResponse(
+        event_id=event.id, archived=False, scores=scores, total=total,
+        next_cursor=build_next_cursor(scores, limit),
+    )
@@ -5,6 +5,7 @@ from sqlalchemy import or_
 from sqlalchemy.orm import aliased
 
 from app.api.deps import get_db
+from app.redis_client import redis_client
 from app.schemas.friendship import (
     FriendRequestRequest,
     FriendRequestResponse,
@@ -23,6 +24,73 @@ router = APIRouter()
 
 VALID_FRIEND_STATUSES = {"pending", "accepted", "rejected", "all"}
 
+FRIENDS_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# 이미 캐시된 친구 SET에만 추가 (없는 SET을 새로 만들면 일부 친구만 담긴 SET이 생기므로)
+# KEYS[1..n]=친구 SET / ARGV[i]=KEYS[i]에 추가할 user_id
+SADD_IF_EXISTS_SCRIPT = redis_client.register_script("""
+for i, key in ipairs(KEYS) do
+    if redis.call('EXISTS', key) == 1 then
+        redis.call('SADD', key, ARGV[i])
+    end
+end
+return 0
+""")
+
+
+def get_friends_key(user_id: int) -> str:
+    """수락된 친구 user_id SET"""
+    return f"friends:{user_id}"
+
+
+def query_friend_ids(db: Session, user_id: int) -> list[int]:
+    """DB에서 수락된 친구 id 목록 조회 (양방향)"""
+    rows = db.query(Friendship.requester_id, Friendship.receiver_id).filter(
+        or_(Friendship.requester_id == user_id, Friendship.receiver_id == user_id),
+        Friendship.status == "accepted"
+    ).all()
+    return [
+        row.receiver_id if row.requester_id == user_id else row.requester_id
+        for row in rows
+    ]
+
+
+def get_friend_ids(db: Session, user_id: int) -> list[int]:
+    """수락된 친구 id 목록 - Redis SET 우선, 없으면 DB에서 읽어 SET을 채움"""
+    key = get_friends_key(user_id)
+    try:
+        members = redis_client.smembers(key)
+        if members:
+            return [int(m) for m in members]
+    except Exception:
+        pass
+
+    friend_ids = query_friend_ids(db, user_id)
+    if friend_ids:
+        try:
+            pipe = redis_client.pipeline()
+            pipe.sadd(key, *friend_ids)
+            pipe.expire(key, FRIENDS_CACHE_TTL_SECONDS)
+            pipe.execute()
+        except Exception:
+            pass
+    return friend_ids
+
+
+def _sync_friend_cache(requester_id: int, receiver_id: int, accepted: bool):
+    """수락/거절 결과를 양쪽 친구 SET에 반영 (Redis 장애는 무시, 다음 조회 시 DB에서 재구성)"""
+    keys = [get_friends_key(requester_id), get_friends_key(receiver_id)]
+    try:
+        if accepted:
+            SADD_IF_EXISTS_SCRIPT(keys=keys, args=[receiver_id, requester_id])
+        else:
+            pipe = redis_client.pipeline()
+            pipe.srem(keys[0], receiver_id)
+            pipe.srem(keys[1], requester_id)
+            pipe.execute()
+    except Exception:
+        pass
+
 
 @router.post("", response_model=FriendRequestResponse)
 def create_friend_request(request: FriendRequestRequest, db: Session = Depends(get_db)):
@@ -190,6 +258,7 @@ def accept_friend_request(action: FriendRequestActionRequest, db: Session = Depe
     friendship.status = "accepted"
     db.commit()
     db.refresh(friendship)
+    _sync_friend_cache(friendship.requester_id, friendship.receiver_id, accepted=True)
 
     print(f"친구 요청 승인됨 (DB): {action.receiver_id} -> {action.requester_id}")
     return FriendRequestActionResponse(
@@ -217,6 +286,7 @@ def reject_friend_request(action: FriendRequestActionRequest, db: Session = Depe
     friendship.status = "rejected"
     db.commit()
     db.refresh(friendship)
+    _sync_friend_cache(friendship.requester_id, friendship.receiver_id, accepted=False)
 
     print(f"친구 요청 거절됨 (DB): {action.receiver_id} -> {action.requester_id}")
     return FriendRequestActionResponse(
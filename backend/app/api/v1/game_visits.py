@@ -6,6 +6,7 @@ from datetime import date
 from typing import Optional
 
 from app.api.deps import get_db
+from app.core.config import settings
 from app.schemas.game_visit import (
     GameVisitCreateRequest,
     GameVisitCreateResponse,
@@ -25,20 +26,21 @@ from models import GameVisit, User
 
 # Helper function (main.py에서 가져옴)
 def get_client_ip(request: Request) -> str:
-    """클라이언트 IP 주소 추출 (프록시 고려)"""
-    # X-Forwarded-For 헤더 확인 (프록시/로드밸런서 뒤에 있는 경우)
-    forwarded_for = request.headers.get("X-Forwarded-For")
-    if forwarded_for:
-        # 첫 번째 IP가 실제 클라이언트 IP
-        return forwarded_for.split(",")[0].strip()
-
-    # X-Real-IP 헤더 확인 (Nginx 등에서 사용)
-    real_ip = request.headers.get("X-Real-IP")
-    if real_ip:
-        return real_ip
-
-    # 직접 연결된 클라이언트 IP
-    return request.client.host
+    """클라이언트 IP 주소 추출 (신뢰하는 프록시 TRUSTED_PROXY_HOPS단 고려)"""
+    if settings.TRUSTED_PROXY_HOPS > 0:
+        # X-Forwarded-For 헤더 확인 (프록시/로드밸런서 뒤에 있는 경우)
+        # 왼쪽 값은 클라이언트가 임의로 채울 수 있으므로 신뢰하는 프록시가 덧붙인 오른쪽에서 N번째 값을 사용
+        hops = [ip.strip() for ip in request.headers.get("X-Forwarded-For", "").split(",") if ip.strip()]
+        if hops:
+            return hops[-min(settings.TRUSTED_PROXY_HOPS, len(hops))]
+
+        # X-Real-IP 헤더 확인 (Nginx 등에서 사용)
+        real_ip = request.headers.get("X-Real-IP")
+        if real_ip:
+            return real_ip
+
+    # 직접 연결된 클라이언트 IP (unix 소켓 등으로 주소가 없으면 "unknown")
+    return request.client.host if request.client else "unknown"
 
 
 router = APIRouter()
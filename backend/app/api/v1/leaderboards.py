@@ -0,0 +1,204 @@
+# backend/app/api/v1/leaderboards.py
+from fastapi import APIRouter, Depends, Path, Query
+from sqlalchemy import func, select, tuple_, union_all
+from sqlalchemy.orm import Session
+
+import secrets
+import time
+from datetime import datetime
+
+from app.redis_client import redis_client
+
+from app.api.deps import get_db
+from app.api.v1.monthly_scores import (
+    LEADERBOARD_DEFAULT_LIMIT,
+    LEADERBOARD_MAX_LIMIT,
+    RELEASE_LOCK_SCRIPT,
+    WARM_UP_CHUNK_SIZE,
+    WARM_UP_LOCK_TTL_MS,
+    WARM_UP_POLL_SECONDS,
+    WARM_UP_WAIT_SECONDS,
+    WINDOW_TTL_SECONDS,
+    LeaderboardNotReady,
+    build_next_cursor,
+    get_cursor_offset,
+    get_nickname_key,
+    get_window_key,
+    get_window_label,
+    get_window_start,
+    member_order,
+    parse_cursor,
+    resolve_nicknames,
+)
+from app.schemas.leaderboard import LeaderboardEntry, LeaderboardWindowResponse
+
+# 기존 models.py 사용
+import sys
+sys.path.insert(0, '/code')
+from models import User, MonthlyScore, MonthlyScoreSnapshot, ScoreEvent
+
+router = APIRouter()
+
+WINDOW_PATTERN = r"^(daily|weekly|all-time)$"
+
+
+def get_window_warm_key(window: str, dt: datetime | None = None) -> str:
+    """기간별 ZSET이 DB 기준으로 재구성되었음을 표시하는 key"""
+    return f"{get_window_key(window, dt)}:warm"
+
+
+def _window_best(window: str, now: datetime):
+    """기간 내 사용자별 최고 점수 (user_id, score) 서브쿼리
+
+    일간/주간은 score_events(모든 제출 기록), 전체 기간은 monthly_scores와
+    보관 파티션이 분리된 달까지 담은 monthly_score_snapshots의 최대값을 원본으로 한다.
+    """
+    if window == "all-time":
+        sources = union_all(
+            select(MonthlyScore.user_id, MonthlyScore.score),
+            select(MonthlyScoreSnapshot.user_id, MonthlyScoreSnapshot.score),
+        ).subquery()
+    else:
+        sources = select(ScoreEvent.user_id, ScoreEvent.score).where(
+            ScoreEvent.created_at >= get_window_start(window, now)
+        ).subquery()
+    return select(
+        sources.c.user_id, func.max(sources.c.score).label("score")
+    ).group_by(sources.c.user_id).subquery()
+
+
+def _rebuild_window(db: Session, window: str, now: datetime):
+    """DB 최고 점수를 임시 key에 청크 단위로 ZADD 후 본 key에 MAX 병합 (재구성 중 제출분 보존)"""
+    key = get_window_key(window, now)
+    tmp_key = f"{key}:rebuild"
+    ttl = WINDOW_TTL_SECONDS[window]
+    redis_client.delete(tmp_key)
+
+    best = _window_best(window, now)
+    rows = db.query(best.c.user_id, User.nickname, best.c.score).join(
+        User, User.id == best.c.user_id  # score_events에는 탈퇴한 사용자도 남아 있음
+    ).yield_per(WARM_UP_CHUNK_SIZE)
+
+    pipe = redis_client.pipeline(transaction=False)
+    mapping, nicknames = {}, {}
+    for row in rows:
+        mapping[row.user_id] = float(row.score)
+        nicknames[row.user_id] = row.nickname
+        if len(mapping) >= WARM_UP_CHUNK_SIZE:
+            pipe.zadd(tmp_key, mapping)
+            pipe.hset(get_nickname_key(), mapping=nicknames)
+            pipe.execute()
+            mapping, nicknames = {}, {}
+    if mapping:
+        pipe.zadd(tmp_key, mapping)
+        pipe.hset(get_nickname_key(), mapping=nicknames)
+        pipe.execute()
+
+    pipe = redis_client.pipeline()
+    pipe.zunionstore(key, [key, tmp_key], aggregate="MAX")
+    pipe.delete(tmp_key)
+    pipe.set(get_window_warm_key(window, now), 1, ex=ttl or None)
+    if ttl:
+        pipe.expire(key, ttl)
+    pipe.execute()
+
+
+def warm_up_window(db: Session, window: str, now: datetime):
+    """기간별 ZSET 재구성 (single-flight) - warm_up_sorted_set과 같이 락을 얻은 워커 하나만 재구성
+
+    나머지는 재구성 완료 표시를 잠시 기다리고, 대기 시간 내에 끝나지 않을 때만 DB 폴백을 유도한다
+    (all-time 폴백은 monthly_scores 전체 집계라 동시 요청이 모두 폴백하면 DB가 몰린다).
+    """
+    lock_key = f"{get_window_key(window, now)}:lock"
+    token = secrets.token_hex(8)
+    if redis_client.set(lock_key, token, nx=True, px=WARM_UP_LOCK_TTL_MS):
+        try:
+            _rebuild_window(db, window, now)
+        finally:
+            RELEASE_LOCK_SCRIPT(keys=[lock_key], args=[token])
+        return
+
+    deadline = time.monotonic() + WARM_UP_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(WARM_UP_POLL_SECONDS)
+        if redis_client.exists(get_window_warm_key(window, now)):
+            return
+    raise LeaderboardNotReady(window)
+
+
+def _read_window_page(window: str, now: datetime, offset: int, limit: int):
+    """재구성 완료 여부, [offset, offset + limit) 구간, 전체 인원을 1회 왕복(MULTI)으로 조회"""
+    key = get_window_key(window, now)
+    pipe = redis_client.pipeline()
+    pipe.exists(get_window_warm_key(window, now))
+    pipe.zrevrange(key, offset, offset + limit - 1, withscores=True)
+    pipe.zcard(key)
+    return pipe.execute()
+
+
+@router.get("/{window}", response_model=LeaderboardWindowResponse)
+def get_window_leaderboard(
+    window: str = Path(..., pattern=WINDOW_PATTERN, description="daily | weekly | all-time"),
+    limit: int = Query(LEADERBOARD_DEFAULT_LIMIT, ge=1, le=LEADERBOARD_MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
+    db: Session = Depends(get_db)
+):
+    """기간별 리더보드 페이지 조회 (score 내림차순) - 월간 리더보드와 같은 limit/offset/cursor 규칙
+
+    점수 제출 시 월간 보드와 같은 Lua 호출로 갱신되는 Redis Sorted Set을 읽고,
+    key가 비어 있으면(Redis 재시작 등) DB에서 재구성한다. Redis 장애 시 DB 집계로 폴백.
+    """
+    now = datetime.now()
+    page_cursor = parse_cursor(cursor) if cursor else None
+    period = get_window_label(window, now)
+    try:
+        key = get_window_key(window, now)
+        if page_cursor is not None:
+            offset = get_cursor_offset(key, page_cursor)
+        ready, raw, total = _read_window_page(window, now, offset, limit)
+        if not ready:
+            warm_up_window(db, window, now)
+            if page_cursor is not None:
+                offset = get_cursor_offset(key, page_cursor)
+            _, raw, total = _read_window_page(window, now, offset, limit)
+
+        nicknames = resolve_nicknames(db, [int(m) for m, _ in raw])
+        scores = [
+            LeaderboardEntry(
+                user_id=int(m),
+                nickname=nicknames.get(int(m), ""),
+                score=int(s),
+                rank=offset + i + 1,
+            )
+            for i, (m, s) in enumerate(raw)
+        ]
+        return LeaderboardWindowResponse(
+            window=window, period=period, scores=scores, total=total,
+            next_cursor=build_next_cursor(scores, limit),
+        )
+    except Exception:
+        pass  # Redis 장애 시 DB 직접 조회로 폴백
+
+    best = _window_best(window, now)
+    total = db.query(func.count()).select_from(best).join(User, User.id == best.c.user_id).scalar()
+    query = db.query(best.c.user_id, User.nickname, best.c.score).join(
+        User, User.id == best.c.user_id
+    ).order_by(
+        best.c.score.desc(), member_order(best.c.user_id).desc()
+    )
+    if page_cursor is not None:
+        cursor_score, cursor_user_id, offset = page_cursor
+        query = query.filter(
+            tuple_(best.c.score, member_order(best.c.user_id)) < (cursor_score, str(cursor_user_id))
+        )
+    else:
+        query = query.offset(offset)
+    scores = [
+        LeaderboardEntry(user_id=row.user_id, nickname=row.nickname, score=row.score, rank=offset + i + 1)
+        for i, row in enumerate(query.limit(limit).all())
+    ]
+    return LeaderboardWindowResponse(
+        window=window, period=period, scores=scores, total=total,
+        next_cursor=build_next_cursor(scores, limit),
+    )
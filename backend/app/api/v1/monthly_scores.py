@@ -1,54 +1,917 @@
 # backend/app/api/v1/monthly_scores.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import String, cast, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from datetime import datetime
+import asyncio
+import csv
+import io
+import json
+import secrets
+import time
+from datetime import date, datetime, timedelta
 from calendar import monthrange
 
-from app.redis_client import redis_client
+from app.redis_client import redis_client, binary_redis_client
 
 from app.api.deps import get_db
+from app.api.v1.friends import get_friend_ids
+from app.core.config import settings
+from app.leaderboard_events import LeaderboardBroadcaster
+from app.event_buffer import EventBuffer
+from app.lru_cache import LRUCache
 from app.schemas.monthly_score import (
     MonthlyScoreCreateRequest,
+    MonthlyScoreBatchRequest,
     MonthlyScoreUpdateRequest,
     MonthlyScoreResponse,
     MonthlyScoreListResponse,
+    MonthlyScoreBatchItemResult,
+    MonthlyScoreBatchResponse,
+    MonthlyScoreRankResponse,
+    MonthlyScoreHistoryResponse,
+    MonthlyScoreDistributionBucket,
+    MonthlyScoreDistributionResponse,
     MonthlyScoreDeleteResponse,
 )
 
 # 기존 models.py 사용
 import sys
 sys.path.insert(0, '/code')
-from models import User, MonthlyScore
+from models import User, MonthlyScore, MonthlyScoreSnapshot
 
 router = APIRouter()
 
+LEADERBOARD_DEFAULT_LIMIT = 20
+LEADERBOARD_MAX_LIMIT = 100
 
-def get_cache_key() -> str:
+# Sorted Set 재구성(warm-up) 설정
+WARM_UP_CHUNK_SIZE = 1000          # DB 스트리밍/파이프라인 ZADD 청크 크기
+WARM_UP_LOCK_TTL_MS = 10_000       # 재구성 락 최대 보유 시간
+WARM_UP_WAIT_SECONDS = 0.5         # 락을 얻지 못한 워커의 최대 대기 시간 (초과 시 DB 폴백)
+WARM_UP_POLL_SECONDS = 0.05
+WARM_MARKER_TTL_SECONDS = 40 * 24 * 3600
+
+# 점수 변경 이벤트 pub/sub 채널 (SSE 스트림이 구독)
+LEADERBOARD_EVENTS_CHANNEL = "monthly_scores:events"
+STREAM_COALESCE_SECONDS = 1.0      # 클라이언트당 diff 최대 전송 주기
+STREAM_KEEPALIVE_SECONDS = 15.0    # 프록시 유휴 타임아웃 방지용 주석 전송 주기
+
+# ?since=<version> 증분 동기화용 변경 로그 설정
+CHANGE_LOG_MAXLEN = 10_000         # 보관할 최근 변경 수 (이보다 오래된 버전은 전체 목록으로 응답)
+DELTA_MAX_CHANGES = 1000           # 증분 응답 최대 변경 수 (초과 시 전체 목록이 더 저렴)
+
+# 직렬화된 페이지 캐시 설정
+PAGE_CACHE_LOCAL_SIZE = 256        # 워커 프로세스당 보관할 페이지 수
+PAGE_CACHE_TTL_SECONDS = 60        # Redis에 보관할 시간 (버전이 바뀌면 어차피 새 key 사용)
+
+# 월간 외 기간별 리더보드 (점수 제출 시 월간 보드와 같은 스크립트 호출로 갱신)
+LEADERBOARD_WINDOWS = ("daily", "weekly", "all-time")
+WINDOW_TTL_SECONDS = {             # 마지막 기록 후 보관 시간 (기간이 끝난 보드는 자연히 만료)
+    "daily": 2 * 24 * 3600,
+    "weekly": 8 * 24 * 3600,
+    "all-time": 0,
+}
+
+# 일별 순위 스냅샷 (순위 변화 표시 기준, 오늘/어제 것만 필요)
+RANK_SNAPSHOT_TTL_SECONDS = 2 * 24 * 3600
+
+# 내 주변 순위 조회 시 위/아래로 보여줄 인원
+AROUND_DEFAULT_RADIUS = 10
+AROUND_MAX_RADIUS = 50
+
+# 점수 분포 구간 수
+DISTRIBUTION_DEFAULT_BUCKETS = 10
+DISTRIBUTION_MAX_BUCKETS = 50
+
+# 지난달 스냅샷 보관 후 Redis key 정리까지의 유예 시간
+ARCHIVED_KEY_TTL_SECONDS = 7 * 24 * 3600
+
+
+# 리더보드 버전 증가 + 변경 로그(capped stream, entry id = "{version}-0") 기록 + 변경 이벤트 발행
+# 버전 key가 없으면(첫 변경/유실) 벽시계 ms로 새 세대를 시작하고 이전 세대 로그는 버린다
+_LOG_CHANGE_LUA = """
+local function log_change(version_key, log_key, seed, maxlen, channel, month, user_id, score)
+    if redis.call('SETNX', version_key, seed) == 1 then
+        redis.call('DEL', log_key)
+    end
+    local version = redis.call('INCR', version_key)
+    redis.call('XADD', log_key, 'MAXLEN', '~', maxlen, version .. '-0', 'user_id', user_id)
+    redis.call('PUBLISH', channel,
+        '{"month":"' .. month .. '","user_id":' .. user_id .. ',"score":' .. score .. ',"version":' .. version .. '}')
+    return version
+end
+"""
+
+# 점수가 기존 최고 점수보다 높을 때만 ZADD (1회 왕복, 원자적) + 닉네임 해시 갱신 + 버전/변경 로그/이벤트
+# 일간/주간/전체 기간 보드(KEYS[6..])도 같은 호출에서 최고 점수로 갱신하고 만료 시간을 연장한다
+# KEYS[1]=월간 리더보드 ZSET, KEYS[2]=닉네임 HASH, KEYS[3]=버전, KEYS[4]=변경 로그, KEYS[5]=DB 미반영 member SET,
+# KEYS[6..]=기간별 리더보드 ZSET
+# ARGV[1]=user_id, ARGV[2]=score, ARGV[3]=nickname, ARGV[4]=이벤트 채널, ARGV[5]=YYYY-MM,
+# ARGV[6]=버전 초기값(ms), ARGV[7]=변경 로그 최대 길이, ARGV[8]=1이면 KEYS[5]에 기록,
+# ARGV[9]=기간 보드에 반영할 점수 (DB 최고 점수로 월간 보드를 보정할 때는 실제 제출 점수),
+# ARGV[10..]=KEYS[6..]에 대응하는 TTL(초, 0이면 만료 없음)
+# 반환값: 반영 후 월간 최고 점수
+BEST_SCORE_SCRIPT = redis_client.register_script(_LOG_CHANGE_LUA + """
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[3])
+for i = 6, #KEYS do
+    local best = redis.call('ZSCORE', KEYS[i], ARGV[1])
+    if not best or tonumber(best) < tonumber(ARGV[9]) then
+        redis.call('ZADD', KEYS[i], ARGV[9], ARGV[1])
+    end
+    local ttl = tonumber(ARGV[i + 4])
+    if ttl > 0 then
+        redis.call('EXPIRE', KEYS[i], ttl)
+    end
+end
+local current = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if current and tonumber(current) >= tonumber(ARGV[2]) then
+    return current
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+if ARGV[8] == '1' then
+    redis.call('SADD', KEYS[5], ARGV[1])
+end
+log_change(KEYS[3], KEYS[4], ARGV[6], ARGV[7], ARGV[4], ARGV[5], ARGV[1], ARGV[2])
+return ARGV[2]
+""")
+
+# 관리자 수정/삭제, 닉네임 변경 등 BEST_SCORE_SCRIPT를 거치지 않는 변경 기록
+# KEYS[1]=버전, KEYS[2]=변경 로그
+# ARGV[1]=user_id, ARGV[2]=score(삭제/닉네임 변경은 'null'), ARGV[3]=이벤트 채널, ARGV[4]=YYYY-MM,
+# ARGV[5]=버전 초기값(ms), ARGV[6]=변경 로그 최대 길이
+# 반환값: 새 버전
+LOG_CHANGE_SCRIPT = redis_client.register_script(_LOG_CHANGE_LUA + """
+return log_change(KEYS[1], KEYS[2], ARGV[5], ARGV[6], ARGV[3], ARGV[4], ARGV[1], ARGV[2])
+""")
+
+
+# 락 소유자(token)일 때만 해제
+RELEASE_LOCK_SCRIPT = redis_client.register_script("""
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+""")
+
+
+def get_month_label(dt: datetime | None = None) -> str:
+    """YYYY-MM 형식의 월 라벨"""
+    dt = dt or datetime.now()
+    return f"{dt.year}-{dt.month:02d}"
+
+
+def get_previous_month_label() -> str:
     now = datetime.now()
-    return f"monthly_scores:{now.year}-{now.month:02d}"
+    year, month = (now.year, now.month - 1) if now.month > 1 else (now.year - 1, 12)
+    return f"{year}-{month:02d}"
+
+
+def get_cache_key(month: str | None = None) -> str:
+    """월간 리더보드 ZSET (member = user_id, score = 최고 점수)"""
+    return f"monthly_scores:board:{month or get_month_label()}"
+
+
+def get_window_label(window: str, dt: datetime | None = None) -> str | None:
+    """기간별 리더보드 라벨 (daily=YYYY-MM-DD, weekly=ISO 주 YYYY-Www, all-time=None)"""
+    dt = dt or datetime.now()
+    if window == "daily":
+        return dt.date().isoformat()
+    if window == "weekly":
+        year, week, _ = dt.isocalendar()
+        return f"{year}-W{week:02d}"
+    return None
+
+
+def get_window_start(window: str, dt: datetime | None = None) -> datetime | None:
+    """기간 시작 시각 (daily=오늘 00:00, weekly=이번 주 월요일 00:00, all-time=None)"""
+    dt = dt or datetime.now()
+    if window == "daily":
+        return datetime(dt.year, dt.month, dt.day)
+    if window == "weekly":
+        return datetime(dt.year, dt.month, dt.day) - timedelta(days=dt.weekday())
+    return None
+
+
+def get_window_key(window: str, dt: datetime | None = None) -> str:
+    """기간별 리더보드 ZSET (member = user_id, score = 기간 내 최고 점수)"""
+    label = get_window_label(window, dt)
+    return f"leaderboard:{window}:{label}" if label else f"leaderboard:{window}"
+
+
+def get_nickname_key() -> str:
+    """user_id → nickname HASH (모든 월 공용, 닉네임 변경 시 HSET 1회로 반영)"""
+    return "monthly_scores:nicknames"
+
+
+def get_dirty_key(month: str | None = None) -> str:
+    """write-behind 모드에서 아직 DB에 반영되지 않은 member 집합"""
+    return f"monthly_scores:dirty:{month or get_month_label()}"
+
+
+def get_version_key(month: str | None = None) -> str:
+    """월간 리더보드 버전 (변경마다 INCR, 단조 증가)"""
+    return f"monthly_scores:version:{month or get_month_label()}"
+
+
+def get_changes_key(month: str | None = None) -> str:
+    """버전별 변경 member 로그 (capped stream, entry id = "{version}-0")"""
+    return f"monthly_scores:changes:{month or get_month_label()}"
+
+
+def get_rank_snapshot_key(dt: datetime | None = None) -> str:
+    """해당 날짜 첫 스냅샷 시점의 월간 순위 HASH (user_id → rank)"""
+    dt = dt or datetime.now()
+    return f"monthly_scores:ranks:{get_month_label(dt)}:{dt.date().isoformat()}"
+
+
+# 점수 제출 이벤트 버퍼 ((user_id, score, created_at), main.flush_score_events_job이 COPY로 기록)
+score_event_buffer = EventBuffer(settings.SCORE_EVENT_FLUSH_SIZE, settings.SCORE_EVENT_BUFFER_MAX)
+
+# 직렬화된 리더보드 페이지 캐시 (프로세스 로컬 LRU, 미스 시 Redis)
+page_cache = LRUCache(PAGE_CACHE_LOCAL_SIZE)
+
+
+# SSE 구독자에게 변경분을 전달하는 워커 프로세스 단일 브로드캐스터
+broadcaster = LeaderboardBroadcaster(
+    LEADERBOARD_EVENTS_CHANNEL, get_cache_key, get_nickname_key(), STREAM_COALESCE_SECONDS
+)
+
+
+def get_month_range(month: str):
+    """해당 월(YYYY-MM)의 시작(1일 00:00:00)과 끝(말일 23:59:59)을 반환"""
+    year, month_num = map(int, month.split("-"))
+    _, last_day = monthrange(year, month_num)
+    start = datetime(year, month_num, 1, 0, 0, 0)
+    end = datetime(year, month_num, last_day, 23, 59, 59)
+    return start, end
 
 
 def get_current_month_range():
     """이번 달 시작(1일 00:00:00)과 끝(말일 23:59:59)을 반환"""
+    return get_month_range(get_month_label())
+
+
+def get_month_start(month: str | None = None) -> date:
+    """monthly_scores.month 컬럼 값 (해당 월 1일)"""
+    year, month_num = map(int, (month or get_month_label()).split("-"))
+    return date(year, month_num, 1)
+
+
+def upsert_monthly_scores(
+    db: Session, month: str, scores: dict[int, tuple[str, int]], fetch_unchanged: bool = True
+):
+    """{user_id: (nickname, score)}를 INSERT ... ON CONFLICT (user_id, month) 한 문장으로 반영
+
+    기존 점수보다 높을 때만 행을 갱신하므로(ON CONFLICT ... WHERE) 같거나 낮은 점수는 행 버전을 만들지 않는다.
+    행은 user_id 순으로 보내 동시 배치/플러셔가 같은 (user_id, month) 행을 항상 같은 순서로 잠근다 (교착 방지).
+    commit은 호출자가 한다. 반영 후 행(user_id, nickname, score, created_at) 목록을 반환하며,
+    갱신하지 않은 기존 행은 fetch_unchanged일 때만 추가 조회해 포함한다 (플러셔는 결과를 쓰지 않음).
+    """
+    if not scores:
+        return []
+    month_start = get_month_start(month)
+    stmt = pg_insert(MonthlyScore).values([
+        {"user_id": user_id, "nickname": nickname, "score": score, "month": month_start}
+        for user_id, (nickname, score) in sorted(scores.items())
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MonthlyScore.user_id, MonthlyScore.month],
+        set_={"score": stmt.excluded.score, "nickname": stmt.excluded.nickname},
+        where=MonthlyScore.score < stmt.excluded.score,
+    ).returning(MonthlyScore.user_id, MonthlyScore.nickname, MonthlyScore.score, MonthlyScore.created_at)
+    rows = db.execute(stmt).all()
+    if fetch_unchanged and len(rows) < len(scores):
+        changed = {row.user_id for row in rows}
+        rows += db.query(
+            MonthlyScore.user_id, MonthlyScore.nickname, MonthlyScore.score, MonthlyScore.created_at
+        ).filter(
+            MonthlyScore.month == month_start,
+            MonthlyScore.user_id.in_([user_id for user_id in scores if user_id not in changed]),
+        ).all()
+    return rows
+
+
+def record_best_score(
+    user_id: int, nickname: str, score: int, mark_dirty: bool = False, window_score: int | None = None
+) -> int:
+    """Lua 스크립트로 월간 최고 점수와 닉네임을 원자적으로 갱신하고 반영 후 최고 점수를 반환"""
+    window_scores = {user_id: window_score} if window_score is not None else None
+    return record_best_scores({user_id: (nickname, score)}, mark_dirty, window_scores)[user_id]
+
+
+def record_best_scores(
+    scores: dict[int, tuple[str, int]],
+    mark_dirty: bool = False,
+    window_scores: dict[int, int] | None = None,
+) -> dict[int, int]:
+    """{user_id: (nickname, score)}를 BEST_SCORE_SCRIPT 파이프라인 1회 왕복으로 반영, {user_id: 월간 최고 점수} 반환
+
+    일간/주간/전체 기간 보드도 같은 스크립트 호출에서 갱신되므로 기간이 늘어도 왕복 수는 그대로다.
+    scores가 DB의 월간 최고 점수(보정용)이면 window_scores에 실제 제출 점수를 넘겨야 한다 —
+    지난 제출의 월간 최고 점수가 오늘/이번 주 보드에 들어가지 않도록.
+    """
     now = datetime.now()
-    year, month = now.year, now.month
-    _, last_day = monthrange(year, month)
-    start = datetime(year, month, 1, 0, 0, 0)
-    end = datetime(year, month, last_day, 23, 59, 59)
-    return start, end
+    month = get_month_label(now)
+    keys = [
+        get_cache_key(month), get_nickname_key(), get_version_key(month), get_changes_key(month),
+        get_dirty_key(month), *(get_window_key(window, now) for window in LEADERBOARD_WINDOWS),
+    ]
+    ttls = [WINDOW_TTL_SECONDS[window] for window in LEADERBOARD_WINDOWS]
+    seed = int(now.timestamp() * 1000)
+    pipe = redis_client.pipeline(transaction=False)
+    for user_id, (nickname, score) in scores.items():
+        BEST_SCORE_SCRIPT(
+            keys=keys,
+            args=[
+                user_id, score, nickname, LEADERBOARD_EVENTS_CHANNEL, month, seed, CHANGE_LOG_MAXLEN,
+                int(mark_dirty), (window_scores or {}).get(user_id, score), *ttls,
+            ],
+            client=pipe,
+        )
+    return {user_id: int(float(best)) for user_id, best in zip(scores, pipe.execute())}
+
+
+def record_board_change(user_id: int, score: int | None = None, pipe=None):
+    """Lua 스크립트를 거치지 않는 리더보드 변경의 버전 증가/변경 로그/이벤트 발행 (score=None은 삭제·닉네임 변경)"""
+    month = get_month_label()
+    LOG_CHANGE_SCRIPT(
+        keys=[get_version_key(month), get_changes_key(month)],
+        args=[
+            user_id, "null" if score is None else score, LEADERBOARD_EVENTS_CHANNEL, month,
+            int(time.time() * 1000), CHANGE_LOG_MAXLEN,
+        ],
+        client=pipe,
+    )
+
+
+def resolve_nicknames(db: Session, user_ids: list[int]) -> dict[int, str]:
+    """닉네임 HASH를 HMGET 1회로 조회하고, 빠진 id만 DB에서 읽어 HASH를 채움"""
+    if not user_ids:
+        return {}
+    nicknames = {
+        user_id: nickname
+        for user_id, nickname in zip(user_ids, redis_client.hmget(get_nickname_key(), user_ids))
+        if nickname is not None
+    }
+    missing = [user_id for user_id in user_ids if user_id not in nicknames]
+    if missing:
+        rows = db.query(User.id, User.nickname).filter(User.id.in_(missing)).all()
+        loaded = {row.id: row.nickname for row in rows}
+        if loaded:
+            redis_client.hset(get_nickname_key(), mapping=loaded)
+        nicknames.update(loaded)
+    return nicknames
+
+
+def flush_dirty_scores(db: Session, month: str, batch_size: int) -> int:
+    """write-behind로 Redis에만 기록된 점수를 monthly_scores에 일괄 반영
+
+    dirty SET에서 최대 batch_size개를 꺼내(SPOP) 현재 최고 점수를 ZMSCORE로 읽고,
+    DB 반영에 실패하면 꺼낸 member를 다시 dirty SET에 넣는다. 처리한 member 수를 반환.
+    """
+    dirty_key = get_dirty_key(month)
+    members = redis_client.spop(dirty_key, batch_size)
+    if not members:
+        return 0
+
+    try:
+        scores = {}
+        for member, score in zip(members, redis_client.zmscore(get_cache_key(month), members)):
+            if score is None:
+                continue  # 플러시 전에 삭제된 점수
+            scores[int(member)] = int(score)
+
+        # 닉네임은 DB 기준으로 채우고, 탈퇴한 사용자는 FK 위반이 나므로 제외
+        rows = db.query(User.id, User.nickname).filter(User.id.in_(scores.keys())).all()
+        best = {row.id: (row.nickname, scores[row.id]) for row in rows}
+
+        upsert_monthly_scores(db, month, best, fetch_unchanged=False)
+        db.commit()
+    except Exception:
+        db.rollback()
+        redis_client.sadd(dirty_key, *members)
+        raise
+    return len(members)
+
+
+def flush_score_events(db: Session) -> int:
+    """버퍼에 쌓인 점수 제출을 COPY로 score_events에 기록하고, 같은 트랜잭션에서 월간 최고 점수를 파생 반영
+
+    monthly_scores에는 (월, 사용자)별 배치 최대값만 upsert하고 기존 최고 점수를 넘을 때만 행을 갱신하므로,
+    요청 경로에서 이미 반영한 최고 점수는 다시 쓰거나 잠그지 않는다. write-behind 모드에서는 dirty 플러셔가 최고 점수를 담당.
+    실패하면 꺼낸 이벤트를 버퍼에 되돌린다. 기록한 이벤트 수를 반환.
+    """
+    events = score_event_buffer.drain()
+    if not events:
+        return 0
+
+    try:
+        data = io.StringIO()
+        csv.writer(data).writerows(
+            (user_id, score, created_at.isoformat(sep=" ")) for user_id, score, created_at in events
+        )
+        data.seek(0)
+        with db.connection().connection.cursor() as cursor:
+            cursor.copy_expert("COPY score_events (user_id, score, created_at) FROM STDIN WITH (FORMAT csv)", data)
+
+        if not settings.SCORE_WRITE_BEHIND:
+            best: dict[str, dict[int, int]] = {}
+            for user_id, score, created_at in events:
+                month_best = best.setdefault(get_month_label(created_at), {})
+                month_best[user_id] = max(score, month_best.get(user_id, score))
+            user_ids = {user_id for month_best in best.values() for user_id in month_best}
+            # 탈퇴한 사용자는 FK 위반이 나므로 제외 (score_events에는 남김)
+            nicknames = dict(db.query(User.id, User.nickname).filter(User.id.in_(user_ids)).all())
+            for month, month_best in best.items():
+                scores = {
+                    user_id: (nicknames[user_id], score)
+                    for user_id, score in month_best.items()
+                    if user_id in nicknames
+                }
+                if scores:
+                    upsert_monthly_scores(db, month, scores, fetch_unchanged=False)
+        db.commit()
+    except Exception:
+        db.rollback()
+        score_event_buffer.requeue(events)
+        raise
+    return len(events)
+
+
+class LeaderboardNotReady(Exception):
+    """다른 워커가 Sorted Set을 재구성 중이라 대기 시간 내에 준비되지 않음 (DB 폴백 신호)"""
+
+
+def get_warm_key(month: str | None = None) -> str:
+    """Sorted Set이 DB 기준으로 재구성되었음을 표시하는 key (빈 달도 재구성 완료로 인식)"""
+    return f"{get_cache_key(month)}:warm"
+
+
+def get_warm_lock_key(month: str | None = None) -> str:
+    return f"{get_cache_key(month)}:lock"
+
+
+def _rebuild_sorted_set(db: Session, month: str):
+    """DB 행을 스트리밍으로 읽어 임시 key에 청크 단위 파이프라인 ZADD 후 본 key에 MAX 병합
+
+    재구성 중에도 점수 제출은 본 key에 기록되므로 RENAME 대신 ZUNIONSTORE(AGGREGATE MAX)로 합친다.
+    """
+    key = get_cache_key(month)
+    tmp_key = f"{key}:rebuild"
+    redis_client.delete(tmp_key)
+
+    rows = db.query(
+        MonthlyScore.user_id, MonthlyScore.nickname, MonthlyScore.score
+    ).filter(
+        MonthlyScore.month == get_month_start(month)
+    ).yield_per(WARM_UP_CHUNK_SIZE)
+
+    pipe = redis_client.pipeline(transaction=False)
+    mapping, nicknames = {}, {}
+    for row in rows:
+        mapping[row.user_id] = float(row.score)
+        nicknames[row.user_id] = row.nickname
+        if len(mapping) >= WARM_UP_CHUNK_SIZE:
+            pipe.zadd(tmp_key, mapping)
+            pipe.hset(get_nickname_key(), mapping=nicknames)
+            pipe.execute()
+            mapping, nicknames = {}, {}
+    if mapping:
+        pipe.zadd(tmp_key, mapping)
+        pipe.hset(get_nickname_key(), mapping=nicknames)
+        pipe.execute()
+
+    # 재구성으로 바뀐 member는 변경 로그에 없으므로 새 버전 세대를 시작해 증분 클라이언트가 전체를 다시 받게 한다
+    pipe = redis_client.pipeline()
+    pipe.zunionstore(key, [key, tmp_key], aggregate="MAX")
+    pipe.delete(tmp_key, get_changes_key(month))
+    pipe.set(get_version_key(month), int(time.time() * 1000))
+    pipe.set(get_warm_key(month), 1, ex=WARM_MARKER_TTL_SECONDS)
+    pipe.execute()
+
+
+def warm_up_sorted_set(db: Session, month: str | None = None):
+    """DB에서 해당 월 점수를 읽어 Redis Sorted Set을 재구성 (single-flight)
+
+    Redis 락(SET NX PX)을 얻은 워커 하나만 재구성하고, 나머지는 잠시 대기한다.
+    대기 시간 내에 재구성이 끝나지 않으면 LeaderboardNotReady를 던져 DB 폴백을 유도한다.
+    """
+    month = month or get_month_label()
+    lock_key = get_warm_lock_key(month)
+    token = secrets.token_hex(8)
+    if redis_client.set(lock_key, token, nx=True, px=WARM_UP_LOCK_TTL_MS):
+        try:
+            _rebuild_sorted_set(db, month)
+        finally:
+            RELEASE_LOCK_SCRIPT(keys=[lock_key], args=[token])
+        return
+
+    deadline = time.monotonic() + WARM_UP_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(WARM_UP_POLL_SECONDS)
+        if redis_client.exists(get_warm_key(month)):
+            return
+    raise LeaderboardNotReady(month)
+
+
+def archive_month(db: Session, month: str) -> int:
+    """종료된 달의 순위를 monthly_score_snapshots에 고정 (이미 있으면 건너뜀)
+
+    재구성 완료된 Redis ZSET이 있으면 그것을(write-behind 미반영분 포함), 없으면 DB를 원본으로
+    청크 단위로 읽어 한 트랜잭션에 기록한다. 기록 후 해당 달 Redis key에는 만료를 건다.
+    기록한 행 수를 반환.
+    """
+    month_start = get_month_start(month)
+    if db.query(MonthlyScoreSnapshot.rank).filter(MonthlyScoreSnapshot.month == month_start).first():
+        return 0
+
+    key = get_cache_key(month)
+    use_redis = False
+    try:
+        use_redis = bool(redis_client.exists(get_warm_key(month)))
+    except Exception:
+        pass
+
+    def chunks():
+        if use_redis:
+            start = 0
+            while True:
+                raw = redis_client.zrevrange(key, start, start + WARM_UP_CHUNK_SIZE - 1, withscores=True)
+                if not raw:
+                    return
+                nicknames = resolve_nicknames(db, [int(m) for m, _ in raw])
+                yield [(int(m), nicknames.get(int(m), ""), int(s)) for m, s in raw]
+                start += WARM_UP_CHUNK_SIZE
+        else:
+            rows = db.query(
+                MonthlyScore.user_id, MonthlyScore.nickname, MonthlyScore.score
+            ).filter(
+                MonthlyScore.month == month_start
+            ).order_by(
+                MonthlyScore.score.desc(), member_order(MonthlyScore.user_id).desc()
+            ).yield_per(WARM_UP_CHUNK_SIZE)
+            chunk = []
+            for row in rows:
+                chunk.append((row.user_id, row.nickname, row.score))
+                if len(chunk) >= WARM_UP_CHUNK_SIZE:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+    rank = 0
+    for chunk in chunks():
+        values = []
+        for user_id, nickname, score in chunk:
+            rank += 1
+            values.append({
+                "month": month_start, "rank": rank,
+                "user_id": user_id, "nickname": nickname, "score": score,
+            })
+        db.execute(pg_insert(MonthlyScoreSnapshot).values(values).on_conflict_do_nothing())
+    db.commit()
+
+    if use_redis:
+        try:
+            pipe = redis_client.pipeline()
+            pipe.expire(key, ARCHIVED_KEY_TTL_SECONDS)
+            pipe.expire(get_warm_key(month), ARCHIVED_KEY_TTL_SECONDS)
+            pipe.expire(get_version_key(month), ARCHIVED_KEY_TTL_SECONDS)
+            pipe.expire(get_changes_key(month), ARCHIVED_KEY_TTL_SECONDS)
+            pipe.execute()
+        except Exception:
+            pass
+    return rank
+
+
+def get_archive_lock_key(month: str) -> str:
+    return f"{get_cache_key(month)}:archive_lock"
+
+
+def _has_snapshot(db: Session, month: str) -> bool:
+    return db.query(MonthlyScoreSnapshot.rank).filter(
+        MonthlyScoreSnapshot.month == get_month_start(month)
+    ).first() is not None
+
+
+def archive_month_once(db: Session, month: str) -> bool:
+    """archive_month의 single-flight 버전 — 스냅샷이 준비됐으면 True
+
+    warm_up_sorted_set과 같이 Redis 락을 얻은 워커 하나만 보관하고, 나머지는 잠시 스냅샷을 기다린다.
+    대기 시간 내에 끝나지 않으면 LeaderboardNotReady (조회 측은 503으로 재시도 유도).
+    """
+    if _has_snapshot(db, month):
+        return True
+    lock_key = get_archive_lock_key(month)
+    token = secrets.token_hex(8)
+    if redis_client.set(lock_key, token, nx=True, px=WARM_UP_LOCK_TTL_MS):
+        try:
+            archive_month(db, month)
+        finally:
+            RELEASE_LOCK_SCRIPT(keys=[lock_key], args=[token])
+        return _has_snapshot(db, month)
+
+    deadline = time.monotonic() + WARM_UP_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(WARM_UP_POLL_SECONDS)
+        db.rollback()  # 다른 워커가 커밋한 스냅샷이 보이도록 새 트랜잭션에서 확인
+        if _has_snapshot(db, month):
+            return True
+    raise LeaderboardNotReady(month)
+
+
+def get_rank_snapshot_lock_key(snapshot_key: str) -> str:
+    return f"{snapshot_key}:lock"
+
+
+def snapshot_monthly_ranks(db: Session, now: datetime | None = None) -> int:
+    """이번 달 순위를 오늘 날짜 HASH(user_id → rank)로 고정 (하루 1회, 이미 있으면 건너뜀)
+
+    Redis 락(SET NX PX)을 얻은 워커 하나만 만들고, 락을 얻지 못하면 다음 주기로 넘긴다.
+    실행마다 다른 임시 key에 청크 단위로 기록한 뒤 RENAME하므로, 락이 만료돼 실행이 겹쳐도
+    서로의 중간 결과를 지우지 않고 조회 측은 완성된 스냅샷만 본다.
+    리더보드가 비어 있으면 만들지 않고 다음 주기에 다시 시도한다. 기록한 member 수를 반환.
+    """
+    now = now or datetime.now()
+    month = get_month_label(now)
+    snapshot_key = get_rank_snapshot_key(now)
+    if redis_client.exists(snapshot_key):
+        return 0
+    if not redis_client.exists(get_warm_key(month)):
+        warm_up_sorted_set(db, month)
+
+    lock_key = get_rank_snapshot_lock_key(snapshot_key)
+    token = secrets.token_hex(8)
+    if not redis_client.set(lock_key, token, nx=True, px=WARM_UP_LOCK_TTL_MS):
+        return 0
+    try:
+        if redis_client.exists(snapshot_key):
+            return 0  # 락을 기다리는 사이 다른 워커가 완성
+
+        key = get_cache_key(month)
+        tmp_key = f"{snapshot_key}:building:{token}"
+        start = 0
+        while True:
+            members = redis_client.zrevrange(key, start, start + WARM_UP_CHUNK_SIZE - 1)
+            if not members:
+                break
+            pipe = redis_client.pipeline()
+            pipe.hset(tmp_key, mapping={member: start + i + 1 for i, member in enumerate(members)})
+            pipe.expire(tmp_key, RANK_SNAPSHOT_TTL_SECONDS)  # 중간에 실패해도 남지 않음
+            pipe.execute()
+            start += WARM_UP_CHUNK_SIZE
+        if start == 0:
+            return 0
+
+        pipe = redis_client.pipeline()
+        pipe.rename(tmp_key, snapshot_key)
+        pipe.expire(snapshot_key, RANK_SNAPSHOT_TTL_SECONDS)
+        pipe.execute()
+        return redis_client.hlen(snapshot_key)
+    finally:
+        RELEASE_LOCK_SCRIPT(keys=[lock_key], args=[token])
+
+
+def attach_rank_deltas(scores: list[MonthlyScoreResponse], snapshot_key: str | None = None):
+    """오늘 순위 스냅샷 대비 순위 변화(양수 = 상승)를 HMGET 1회로 채움 (스냅샷에 없던 member는 None)"""
+    if not scores:
+        return
+    previous = redis_client.hmget(snapshot_key or get_rank_snapshot_key(), [entry.user_id for entry in scores])
+    for entry, rank in zip(scores, previous):
+        if rank is not None:
+            entry.rank_delta = int(rank) - entry.rank
+
+
+def _read_page(key: str, offset: int, limit: int, snapshot_key: str):
+    """[offset, offset + limit) 구간, 전체 인원, 재구성 완료 여부, 버전, 순위 스냅샷 유무를 1회 왕복(MULTI)으로 조회"""
+    pipe = redis_client.pipeline()
+    pipe.zrevrange(key, offset, offset + limit - 1, withscores=True)
+    pipe.zcard(key)
+    pipe.exists(get_warm_key())
+    pipe.get(get_version_key())
+    pipe.exists(snapshot_key)
+    return pipe.execute()
+
+
+def _read_version(snapshot_key: str):
+    """재구성 완료 여부, 현재 버전, 순위 스냅샷 유무만 1회 왕복으로 조회 (ETag 비교/페이지 캐시 조회용)"""
+    pipe = redis_client.pipeline()
+    pipe.exists(get_warm_key())
+    pipe.get(get_version_key())
+    pipe.exists(snapshot_key)
+    return pipe.execute()
+
+
+def _page_etag(month: str, version, snapshot: str | None, offset: int, limit: int) -> str:
+    """같은 (월, 버전, 순위 스냅샷, 페이지)의 응답 바이트는 항상 같으므로 강한 ETag로 사용"""
+    return f'"{month}.{version}.{snapshot or "-"}.{offset}.{limit}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 약한 비교 — 쉼표로 나열된 값, 프록시가 붙인 W/ 접두사, *를 모두 처리"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (tag.removeprefix("W/") for tag in candidates)
+
+
+def _page_headers(etag: str) -> dict:
+    # 매 요청 재검증(no-cache) — 변경이 없으면 304로 본문 없이 응답
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def get_page_cache_key(month: str, version, snapshot: str | None, offset: int, limit: int) -> str:
+    """직렬화된 리더보드 페이지 JSON (워커 간 공유, 버전/순위 스냅샷이 바뀌면 자연히 사용되지 않음)"""
+    return f"monthly_scores:page:{month}:{version}:{snapshot or '-'}:{offset}:{limit}"
+
+
+def get_distribution_cache_key(month: str, version, buckets: int) -> str:
+    """직렬화된 점수 분포 구간 목록 (버전이 바뀌면 자연히 사용되지 않음)"""
+    return f"monthly_scores:distribution:{month}:{version}:{buckets}"
+
+
+def _get_cached_body(cache_key: str) -> bytes | None:
+    """프로세스 로컬 LRU → Redis 순으로 직렬화된 응답 조회 (key에 버전이 들어가므로 무효화 불필요)"""
+    body = page_cache.get(cache_key)
+    if body is None:
+        body = binary_redis_client.get(cache_key)
+        if body is not None:
+            page_cache.set(cache_key, body)
+    return body
+
+
+def _set_cached_body(cache_key: str, body: bytes):
+    page_cache.set(cache_key, body)
+    try:
+        binary_redis_client.set(cache_key, body, ex=PAGE_CACHE_TTL_SECONDS)
+    except Exception:
+        pass
+
+
+def member_order(user_id_column):
+    """DB 정렬/keyset 비교에서 동점자 순서를 Redis ZSET과 맞추는 식
+
+    Redis는 같은 점수의 member를 문자열 바이트 순서로 정렬하므로("9" > "10") 숫자 user_id 대신
+    C collation 문자열로 비교해야 Redis 페이지에서 받은 cursor를 DB 폴백에 넘겨도 건너뜀/중복이 없다.
+    """
+    return cast(user_id_column, String).collate("C")
+
+
+def parse_cursor(cursor: str) -> tuple[int, int, int]:
+    """next_cursor("score:user_id:rank") 파싱 — 형식이 다르면 400"""
+    try:
+        score, user_id, rank = map(int, cursor.split(":"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return score, user_id, rank
+
+
+def build_next_cursor(scores: list[MonthlyScoreResponse], limit: int) -> str | None:
+    """페이지가 가득 찼으면 마지막 member 기준 다음 페이지 cursor (불투명 문자열로 취급)"""
+    if len(scores) < limit:
+        return None
+    last = scores[-1]
+    return f"{last.score}:{last.user_id}:{last.rank}"
+
+
+def get_cursor_offset(key: str, page_cursor: tuple[int, int, int]) -> int:
+    """cursor member의 현재 위치 다음 offset (그 사이 점수가 바뀌었으면 cursor 점수보다 높은 인원 수)"""
+    score, user_id, _ = page_cursor
+    pipe = redis_client.pipeline()
+    pipe.zscore(key, user_id)
+    pipe.zrevrank(key, user_id)
+    pipe.zcount(key, f"({score}", "+inf")
+    current, rank, higher = pipe.execute()
+    if current is not None and int(current) == score:
+        return rank + 1
+    return higher
+
 
+def _read_changes(since: int):
+    """since 이후 변경된 user_id 목록과 현재 버전 조회
 
-def warm_up_sorted_set(db: Session):
-    """DB에서 이번 달 점수를 읽어 Redis Sorted Set을 재구성"""
-    start, end = get_current_month_range()
-    scores = db.query(MonthlyScore).filter(
-        MonthlyScore.created_at >= start,
-        MonthlyScore.created_at <= end
-    ).all()
-    if scores:
-        mapping = {f"{s.user_id}:{s.nickname}": float(s.score) for s in scores}
-        redis_client.zadd(get_cache_key(), mapping)
+    반환값: (version, user_ids) — 증분으로 응답할 수 없으면(재구성 전, 로그에서 밀려난 버전,
+    다른 세대의 버전, 변경이 너무 많음) None
+    """
+    log_key = get_changes_key()
+    pipe = redis_client.pipeline()
+    pipe.exists(get_warm_key())
+    pipe.get(get_version_key())
+    pipe.xrange(log_key, count=1)
+    pipe.xrange(log_key, min=f"{since + 1}-0", count=DELTA_MAX_CHANGES + 1)
+    ready, version, first, entries = pipe.execute()
+
+    if not ready or version is None or since > int(version):
+        return None
+    version = int(version)
+    if since == version:
+        return version, []
+    if not first or int(first[0][0].split("-")[0]) > since + 1 or len(entries) > DELTA_MAX_CHANGES:
+        return None
+    return version, list(dict.fromkeys(int(fields["user_id"]) for _, fields in entries))
+
+
+def _read_delta(db: Session, since: int) -> MonthlyScoreListResponse | None:
+    """since 이후 변경된 member의 현재 점수/순위만 담은 증분 응답 (불가능하면 None)"""
+    changes = _read_changes(since)
+    if changes is None:
+        return None
+    version, user_ids = changes
+
+    key = get_cache_key()
+    pipe = redis_client.pipeline()
+    for user_id in user_ids:
+        pipe.zrevrank(key, user_id)
+    pipe.zmscore(key, user_ids or [0])
+    pipe.zcard(key)
+    *ranks, scores, total = pipe.execute()
+
+    present = [(uid, rank, score) for uid, rank, score in zip(user_ids, ranks, scores) if rank is not None]
+    month_start = get_current_month_range()[0]
+    nicknames = resolve_nicknames(db, [uid for uid, _, _ in present])
+    entries = [
+        MonthlyScoreResponse(
+            nickname=nicknames.get(uid, ""),
+            score=int(score),
+            created_at=month_start,
+            user_id=uid,
+            rank=rank + 1,
+        )
+        for uid, rank, score in sorted(present, key=lambda item: item[1])
+    ]
+    attach_rank_deltas(entries)
+    return MonthlyScoreListResponse(
+        scores=entries,
+        total=total,
+        version=version,
+        full=False,
+        removed=[uid for uid, rank, _ in zip(user_ids, ranks, scores) if rank is None],
+    )
+
+
+def _read_rank(key: str, user_id: int):
+    """user_id의 0-based 순위, 점수, 전체 인원, 재구성 완료 여부를 1회 왕복으로 조회"""
+    pipe = redis_client.pipeline()
+    pipe.zrevrank(key, user_id)
+    pipe.zscore(key, user_id)
+    pipe.zcard(key)
+    pipe.exists(get_warm_key())
+    return pipe.execute()
+
+
+def _read_scores(key: str, user_ids: list[int]):
+    """user_ids의 점수(ZMSCORE)와 재구성 완료 여부를 1회 왕복으로 조회"""
+    pipe = redis_client.pipeline()
+    pipe.zmscore(key, user_ids)
+    pipe.exists(get_warm_key())
+    return pipe.execute()
+
+
+def get_percentile(rank: int, total: int) -> float:
+    """rank(1부터 시작)보다 아래에 있는 참가자 비율(%)"""
+    if total <= 0:
+        return 0.0
+    return round((total - rank) / total * 100, 2)
+
+
+def get_bucket_width(low: int, high: int, buckets: int) -> int:
+    """정수 점수 범위 [low, high]를 최대 buckets개의 같은 폭 구간으로 나눌 때의 폭"""
+    return max(1, -(-(high - low + 1) // buckets))
+
+
+def _read_distribution_state(key: str, score: int | None):
+    """재구성 완료 여부, 버전, 전체 인원, score보다 낮은 인원을 1회 왕복으로 조회"""
+    pipe = redis_client.pipeline()
+    pipe.exists(get_warm_key())
+    pipe.get(get_version_key())
+    pipe.zcard(key)
+    if score is not None:
+        pipe.zcount(key, "-inf", f"({score}")
+    ready, version, total, *below = pipe.execute()
+    return ready, version, total, below[0] if below else None
+
+
+def _count_buckets(key: str, buckets: int) -> list[MonthlyScoreDistributionBucket]:
+    """최저/최고 점수를 읽어 구간을 정하고 구간별 ZCOUNT를 1회 왕복으로 조회 (구간당 O(log N))"""
+    pipe = redis_client.pipeline()
+    pipe.zrange(key, 0, 0, withscores=True)
+    pipe.zrevrange(key, 0, 0, withscores=True)
+    lowest, highest = pipe.execute()
+    if not lowest:
+        return []
+    low, high = int(lowest[0][1]), int(highest[0][1])
+    width = get_bucket_width(low, high, buckets)
+    bounds = [(start, start + width - 1) for start in range(low, high + 1, width)]
+    pipe = redis_client.pipeline()
+    for start, end in bounds:
+        pipe.zcount(key, start, end)
+    return [
+        MonthlyScoreDistributionBucket(min_score=start, max_score=end, count=count)
+        for (start, end), count in zip(bounds, pipe.execute())
+    ]
 
 
 @router.post("", response_model=MonthlyScoreResponse)
@@ -56,86 +919,588 @@ def create_or_update_monthly_score(
     score_data: MonthlyScoreCreateRequest,
     db: Session = Depends(get_db)
 ):
-    """월간 점수 생성 또는 수정 (최고 점수만 저장)"""
+    """월간 점수 생성 또는 수정 (최고 점수만 저장)
+
+    모든 제출은 score_events 버퍼에 쌓여 백그라운드에서 COPY로 기록된다.
+    최고 점수 판단은 Redis Lua 스크립트가 하고, 최고 점수가 바뀐 제출만 monthly_scores 행을 upsert한다.
+    SCORE_WRITE_BEHIND 모드에서는 DB 반영을 백그라운드 플러셔(main.flush_monthly_scores_job)에 맡긴다.
+    """
     user = db.query(User).filter(User.id == score_data.user_id).first()
     if user is None:
         raise HTTPException(
             status_code=404,
             detail=f"User with id {score_data.user_id} not found"
         )
-    
 
-    start, end = get_current_month_range()
+    score_event_buffer.add((user.id, score_data.score, datetime.now()))
 
-    existing_score = db.query(MonthlyScore).filter(
-        MonthlyScore.user_id == score_data.user_id,
-        MonthlyScore.created_at >= start,
-        MonthlyScore.created_at <= end
-    ).first()
+    if settings.SCORE_WRITE_BEHIND:
+        try:
+            best = record_best_score(user.id, user.nickname, score_data.score, mark_dirty=True)
+            return MonthlyScoreResponse(
+                nickname=user.nickname,
+                score=best,
+                created_at=get_current_month_range()[0],
+                user_id=user.id,
+            )
+        except Exception:
+            pass  # Redis 장애 시 DB 동기 저장으로 폴백
 
-    if existing_score:
-        if score_data.score > existing_score.score:
-            existing_score.score = score_data.score
-            existing_score.nickname = user.nickname  # nickname 갱신
-            db.commit()
-            db.refresh(existing_score)
-            try:
-                key = get_cache_key()
-                member = f"{score_data.user_id}:{user.nickname}"
-                current = redis_client.zscore(key, member)
-                if current is None or score_data.score > current:
-                    redis_client.zadd(key, {member: float(score_data.score)})
-            except Exception:
-                pass
-        return existing_score
-    else:
-        new_score = MonthlyScore(
-            user_id=score_data.user_id,
-            nickname=user.nickname,  # nickname 저장
-            score=score_data.score
-        )
-        db.add(new_score)
+    synced = False
+    try:
+        best = record_best_score(user.id, user.nickname, score_data.score)
+        synced = True
+        if best > score_data.score:
+            # 최고 점수가 아닌 제출은 monthly_scores 행을 잠그지 않음 (기록은 score_events에 남음)
+            return MonthlyScoreResponse(
+                nickname=user.nickname,
+                score=best,
+                created_at=get_current_month_range()[0],
+                user_id=user.id,
+            )
+    except Exception:
+        pass  # Redis 장애 시 DB에서 최고 점수 판단
+
+    # INSERT ... ON CONFLICT 1문장으로 최고 점수 반영 (select-then-update 경쟁 제거)
+    row = upsert_monthly_scores(
+        db, get_month_label(), {user.id: (user.nickname, score_data.score)}
+    )[0]
+    db.commit()
+    if row.score > score_data.score or not synced:
+        try:
+            # 재구성 전 Redis 월간 보드에 DB 최고 점수 반영 (기간 보드에는 이번 제출 점수만)
+            record_best_score(row.user_id, row.nickname, row.score, window_score=score_data.score)
+        except Exception:
+            pass
+    return MonthlyScoreResponse(
+        nickname=row.nickname,
+        score=row.score,
+        created_at=row.created_at,
+        user_id=row.user_id,
+    )
+
+
+@router.post("/batch", response_model=MonthlyScoreBatchResponse)
+def create_or_update_monthly_scores_batch(
+    batch: MonthlyScoreBatchRequest,
+    db: Session = Depends(get_db)
+):
+    """월간 점수 일괄 제출 (게임 클라이언트 묶음 전송, 리플레이 임포터)
+
+    사용자 확인은 IN 쿼리 1회, DB 반영은 다중 행 upsert 1문장, Redis 반영은 파이프라인 1회 왕복.
+    존재하지 않는 user_id 항목은 status="not_found"로 응답하고 나머지는 반영한다.
+    """
+    best_requested: dict[int, int] = {}
+    for item in batch.scores:
+        best_requested[item.user_id] = max(item.score, best_requested.get(item.user_id, item.score))
+
+    nicknames = dict(
+        db.query(User.id, User.nickname).filter(User.id.in_(best_requested)).all()
+    )
+    scores = {
+        user_id: (nicknames[user_id], score)
+        for user_id, score in best_requested.items()
+        if user_id in nicknames
+    }
+    now = datetime.now()
+    score_event_buffer.add(*[
+        (item.user_id, item.score, now) for item in batch.scores if item.user_id in nicknames
+    ])
+
+    best: dict[int, int] | None = None
+    if scores and settings.SCORE_WRITE_BEHIND:
+        try:
+            best = record_best_scores(scores, mark_dirty=True)
+        except Exception:
+            pass  # Redis 장애 시 DB 동기 저장으로 폴백
+    if scores and best is None:
+        rows = upsert_monthly_scores(db, get_month_label(), scores)
         db.commit()
-        db.refresh(new_score)
+        best = {row.user_id: row.score for row in rows}
         try:
-            key = get_cache_key()
-            member = f"{score_data.user_id}:{user.nickname}"
-            redis_client.zadd(key, {member: float(score_data.score)})
+            record_best_scores(
+                {row.user_id: (row.nickname, row.score) for row in rows},
+                window_scores={user_id: score for user_id, (_, score) in scores.items()},
+            )
         except Exception:
             pass
-        return new_score
+
+    results = [
+        MonthlyScoreBatchItemResult(user_id=item.user_id, status="ok", score=best[item.user_id])
+        if item.user_id in scores
+        else MonthlyScoreBatchItemResult(user_id=item.user_id, status="not_found")
+        for item in batch.scores
+    ]
+    accepted = sum(1 for result in results if result.status == "ok")
+    return MonthlyScoreBatchResponse(results=results, accepted=accepted, rejected=len(results) - accepted)
 
 
 @router.get("", response_model=MonthlyScoreListResponse)
 def get_monthly_scores(
+    request: Request,
+    limit: int = Query(LEADERBOARD_DEFAULT_LIMIT, ge=1, le=LEADERBOARD_MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
+    since: int | None = Query(None, ge=0, description="이전 응답의 version (지정 시 이후 변경분만 반환)"),
+    db: Session = Depends(get_db)
+):
+    """월간 점수 페이지 조회 (score 내림차순) - Redis Sorted Set 주 경로
+
+    ZREVRANGE로 [offset, offset + limit) 구간만 읽으므로 참가자 수와 무관하게 비용이 일정하다.
+    cursor(다음 페이지 keyset)를 주면 직전 페이지 마지막 member 다음부터 반환한다.
+    since를 주면 그 버전 이후 바뀐 member만 full=false로 반환하고(removed = 빠진 user_id),
+    변경 로그에서 밀려난 버전이면 전체 페이지를 full=true로 반환한다.
+    전체 페이지는 (월, 버전, 순위 스냅샷, offset, limit) 단위로 직렬화된 JSON을 캐시하고 ETag/304로 재검증한다.
+    오늘 순위 스냅샷이 있으면 각 항목에 rank_delta(양수 = 상승)를 HMGET 1회로 채운다.
+    """
+    page_cursor = parse_cursor(cursor) if cursor else None
+    try:
+        if since is not None:
+            delta = _read_delta(db, since)
+            if delta is not None:
+                return delta
+
+        month = get_month_label()
+        key = get_cache_key()
+        snapshot_key = get_rank_snapshot_key()
+        snapshot = date.today().isoformat()
+        ready, version, has_snapshot = _read_version(snapshot_key)
+        if not ready:
+            warm_up_sorted_set(db)
+            version = None  # 재구성으로 버전이 바뀌었으므로 아래 페이지 조회의 버전 사용
+        if page_cursor is not None:
+            offset = get_cursor_offset(key, page_cursor)
+
+        # 버전이 같으면 응답 바이트도 같으므로 ETag 비교/캐시 조회에 Sorted Set을 읽을 필요가 없다
+        if version:
+            page_snapshot = snapshot if has_snapshot else None
+            etag = _page_etag(month, version, page_snapshot, offset, limit)
+            if _etag_matches(request.headers.get("If-None-Match"), etag):
+                return Response(status_code=304, headers=_page_headers(etag))
+            body = _get_cached_body(get_page_cache_key(month, version, page_snapshot, offset, limit))
+            if body is not None:
+                return Response(content=body, media_type="application/json", headers=_page_headers(etag))
+
+        raw, total, _, version, has_snapshot = _read_page(key, offset, limit, snapshot_key)
+        page_snapshot = snapshot if has_snapshot else None
+        month_start = get_current_month_range()[0]
+        nicknames = resolve_nicknames(db, [int(m) for m, _ in raw])
+        scores = [
+            MonthlyScoreResponse(
+                nickname=nicknames.get(int(m), ""),
+                score=int(s),
+                created_at=month_start,
+                user_id=int(m),
+                rank=offset + i + 1,
+            )
+            for i, (m, s) in enumerate(raw)
+        ]
+        if has_snapshot:
+            attach_rank_deltas(scores, snapshot_key)
+        result = MonthlyScoreListResponse(
+            scores=scores,
+            total=total,
+            version=int(version) if version else None,
+            next_cursor=build_next_cursor(scores, limit),
+        )
+        if not version:
+            return result
+        body = result.model_dump_json().encode()
+        _set_cached_body(get_page_cache_key(month, version, page_snapshot, offset, limit), body)
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers=_page_headers(_page_etag(month, version, page_snapshot, offset, limit)),
+        )
+    except Exception:
+        pass  # Redis 장애 시 DB 직접 조회로 폴백
+
+    # (month, score DESC, user_id DESC) INCLUDE (nickname, created_at) 인덱스를 score 구간으로 읽는 keyset 페이지
+    # (동점자는 Redis와 같은 member 문자열 순서로 정렬 — score 범위 안에서만 추가 정렬)
+    month_start = get_month_start()
+    total = db.query(func.count()).select_from(MonthlyScore).filter(
+        MonthlyScore.month == month_start
+    ).scalar()
+    query = db.query(
+        MonthlyScore.user_id, MonthlyScore.nickname, MonthlyScore.score, MonthlyScore.created_at
+    ).filter(
+        MonthlyScore.month == month_start
+    ).order_by(
+        MonthlyScore.score.desc(), member_order(MonthlyScore.user_id).desc()
+    )
+    if page_cursor is not None:
+        cursor_score, cursor_user_id, offset = page_cursor
+        query = query.filter(
+            MonthlyScore.score <= cursor_score,  # 인덱스 범위 조건 (아래 행 비교만으로는 인덱스를 못 씀)
+            tuple_(MonthlyScore.score, member_order(MonthlyScore.user_id)) < (cursor_score, str(cursor_user_id)),
+        )
+    else:
+        query = query.offset(offset)
+    rows = query.limit(limit).all()
+    scores = [
+        MonthlyScoreResponse(
+            nickname=row.nickname,
+            score=row.score,
+            created_at=row.created_at,
+            user_id=row.user_id,
+            rank=offset + i + 1,
+        )
+        for i, row in enumerate(rows)
+    ]
+    return MonthlyScoreListResponse(scores=scores, total=total, next_cursor=build_next_cursor(scores, limit))
+
+
+@router.get("/rank/{user_id}", response_model=MonthlyScoreRankResponse)
+def get_monthly_rank(
+    user_id: int,
+    db: Session = Depends(get_db)
+):
+    """특정 사용자의 이번 달 순위/점수/백분위 조회 - ZREVRANK/ZSCORE (O(log N))"""
+    try:
+        key = get_cache_key()
+        rank, score, total, ready = _read_rank(key, user_id)
+        if not ready:
+            warm_up_sorted_set(db)
+            rank, score, total, _ = _read_rank(key, user_id)
+        if rank is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Monthly score for user {user_id} not found"
+            )
+        return MonthlyScoreRankResponse(
+            user_id=user_id,
+            nickname=resolve_nicknames(db, [user_id]).get(user_id, ""),
+            score=int(score),
+            rank=rank + 1,
+            total=total,
+            percentile=get_percentile(rank + 1, total),
+        )
+    except HTTPException:
+        raise
+    except Exception:
+        pass  # Redis 장애 시 DB 직접 조회로 폴백
+
+    month_filter = (MonthlyScore.month == get_month_start(),)
+    row = db.query(MonthlyScore).filter(
+        MonthlyScore.user_id == user_id, *month_filter
+    ).first()
+    if row is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Monthly score for user {user_id} not found"
+        )
+    total = db.query(MonthlyScore).filter(*month_filter).count()
+    higher = db.query(MonthlyScore).filter(
+        MonthlyScore.score > row.score, *month_filter
+    ).count()
+    return MonthlyScoreRankResponse(
+        user_id=user_id,
+        nickname=row.nickname,
+        score=row.score,
+        rank=higher + 1,
+        total=total,
+        percentile=get_percentile(higher + 1, total),
+    )
+
+
+@router.get("/around/{user_id}", response_model=MonthlyScoreListResponse)
+def get_monthly_scores_around(
+    user_id: int,
+    radius: int = Query(AROUND_DEFAULT_RADIUS, ge=1, le=AROUND_MAX_RADIUS),
     db: Session = Depends(get_db)
 ):
-    """전체 월간 점수 조회 (score 내림차순) - Redis Sorted Set 주 경로"""
+    """특정 사용자 위/아래 radius명씩의 이번 달 순위 (본인 포함, score 내림차순)
+
+    ZREVRANK로 순위를 찾고 [rank - radius, rank + radius] 구간만 ZREVRANGE로 읽는다.
+    DB 폴백은 본인 (score, user_id) 기준 keyset 쿼리 위/아래 각 radius행.
+    """
     try:
         key = get_cache_key()
-        raw = redis_client.zrevrangebyscore(key, "+inf", "-inf", withscores=True)
-        if not raw:
+        rank, _, total, ready = _read_rank(key, user_id)
+        if not ready:
             warm_up_sorted_set(db)
-            raw = redis_client.zrevrangebyscore(key, "+inf", "-inf", withscores=True)
+            rank, _, total, _ = _read_rank(key, user_id)
+        if rank is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Monthly score for user {user_id} not found"
+            )
+        start = max(0, rank - radius)
+        raw = redis_client.zrevrange(key, start, rank + radius, withscores=True)
         month_start = get_current_month_range()[0]
+        nicknames = resolve_nicknames(db, [int(m) for m, _ in raw])
         scores = [
             MonthlyScoreResponse(
-                nickname=m.split(":", 1)[1],
+                nickname=nicknames.get(int(m), ""),
                 score=int(s),
-                created_at=month_start
+                created_at=month_start,
+                user_id=int(m),
+                rank=start + i + 1,
+            )
+            for i, (m, s) in enumerate(raw)
+        ]
+        attach_rank_deltas(scores)
+        return MonthlyScoreListResponse(scores=scores, total=total)
+    except HTTPException:
+        raise
+    except Exception:
+        pass  # Redis 장애 시 DB 직접 조회로 폴백
+
+    month_filter = (MonthlyScore.month == get_month_start(),)
+    row = db.query(MonthlyScore).filter(
+        MonthlyScore.user_id == user_id, *month_filter
+    ).first()
+    if row is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Monthly score for user {user_id} not found"
+        )
+    tie = member_order(MonthlyScore.user_id)
+    position = tuple_(MonthlyScore.score, tie)
+    anchor = (row.score, str(row.user_id))
+    columns = (MonthlyScore.user_id, MonthlyScore.nickname, MonthlyScore.score, MonthlyScore.created_at)
+    total = db.query(func.count()).select_from(MonthlyScore).filter(*month_filter).scalar()
+    higher = db.query(func.count()).select_from(MonthlyScore).filter(
+        MonthlyScore.score >= row.score, position > anchor, *month_filter
+    ).scalar()
+    above = db.query(*columns).filter(
+        MonthlyScore.score >= row.score, position > anchor, *month_filter
+    ).order_by(
+        MonthlyScore.score.asc(), tie.asc()
+    ).limit(radius).all()
+    below = db.query(*columns).filter(
+        MonthlyScore.score <= row.score, position < anchor, *month_filter
+    ).order_by(
+        MonthlyScore.score.desc(), tie.desc()
+    ).limit(radius).all()
+    rows = [*reversed(above), row, *below]
+    first_rank = higher - len(above) + 1
+    return MonthlyScoreListResponse(
+        scores=[
+            MonthlyScoreResponse(
+                nickname=item.nickname,
+                score=item.score,
+                created_at=item.created_at,
+                user_id=item.user_id,
+                rank=first_rank + i,
+            )
+            for i, item in enumerate(rows)
+        ],
+        total=total,
+    )
+
+
+@router.get("/distribution", response_model=MonthlyScoreDistributionResponse)
+def get_monthly_distribution(
+    buckets: int = Query(DISTRIBUTION_DEFAULT_BUCKETS, ge=1, le=DISTRIBUTION_MAX_BUCKETS),
+    score: int | None = Query(None, description="백분위를 계산할 점수 (score보다 낮은 참가자 비율)"),
+    db: Session = Depends(get_db)
+):
+    """이번 달 점수 분포(같은 폭 구간별 인원)와 특정 점수의 백분위 조회
+
+    구간 인원은 구간당 ZCOUNT(O(log N))로 세고 (월, 버전, 구간 수) 단위로 캐시하므로
+    참가자 수가 늘어도 전체 목록을 읽지 않는다. 백분위는 ZCOUNT 1회로 매 요청 계산.
+    """
+    month = get_month_label()
+    try:
+        key = get_cache_key()
+        ready, version, total, below = _read_distribution_state(key, score)
+        if not ready:
+            warm_up_sorted_set(db)
+            _, version, total, below = _read_distribution_state(key, score)
+
+        cache_key = get_distribution_cache_key(month, version, buckets)
+        body = _get_cached_body(cache_key) if version else None
+        if body is not None:
+            result = [MonthlyScoreDistributionBucket(**bucket) for bucket in json.loads(body)]
+        else:
+            result = _count_buckets(key, buckets)
+            if version:
+                _set_cached_body(cache_key, json.dumps([bucket.model_dump() for bucket in result]).encode())
+        return MonthlyScoreDistributionResponse(
+            month=month,
+            total=total,
+            buckets=result,
+            version=int(version) if version else None,
+            score=score,
+            percentile=round(below / total * 100, 2) if score is not None and total else None,
+        )
+    except Exception:
+        pass  # Redis 장애 시 DB 집계로 폴백
+
+    month_filter = (MonthlyScore.month == get_month_start(),)
+    low, high, total = db.query(
+        func.min(MonthlyScore.score), func.max(MonthlyScore.score), func.count()
+    ).filter(*month_filter).one()
+    result = []
+    if total:
+        width = get_bucket_width(low, high, buckets)
+        bucket = ((MonthlyScore.score - low) // width).label("bucket")
+        counts = dict(db.query(bucket, func.count()).filter(*month_filter).group_by(bucket).all())
+        result = [
+            MonthlyScoreDistributionBucket(min_score=start, max_score=start + width - 1, count=counts.get(i, 0))
+            for i, start in enumerate(range(low, high + 1, width))
+        ]
+    percentile = None
+    if score is not None and total:
+        below = db.query(func.count()).select_from(MonthlyScore).filter(
+            MonthlyScore.score < score, *month_filter
+        ).scalar()
+        percentile = round(below / total * 100, 2)
+    return MonthlyScoreDistributionResponse(
+        month=month, total=total, buckets=result, score=score, percentile=percentile,
+    )
+
+
+@router.get("/friends/{user_id}", response_model=MonthlyScoreListResponse)
+def get_friends_leaderboard(
+    user_id: int,
+    db: Session = Depends(get_db)
+):
+    """본인 + 수락된 친구들의 이번 달 순위 - 친구 SET과 ZMSCORE로 O(친구 수)
+
+    rank는 친구들 사이의 순위, total은 점수가 있는 인원 수.
+    """
+    user_ids = [user_id] + [fid for fid in get_friend_ids(db, user_id) if fid != user_id]
+
+    try:
+        key = get_cache_key()
+        scores, ready = _read_scores(key, user_ids)
+        if not ready:
+            warm_up_sorted_set(db)
+            scores, _ = _read_scores(key, user_ids)
+        ranked = sorted(
+            ((uid, int(score)) for uid, score in zip(user_ids, scores) if score is not None),
+            key=lambda item: (-item[1], item[0]),
+        )
+        nicknames = resolve_nicknames(db, [uid for uid, _ in ranked])
+        month_start = get_current_month_range()[0]
+        entries = [
+            MonthlyScoreResponse(
+                nickname=nicknames.get(uid, ""),
+                score=score,
+                created_at=month_start,
+                user_id=uid,
+                rank=i + 1,
             )
-            for m, s in raw
+            for i, (uid, score) in enumerate(ranked)
         ]
-        return MonthlyScoreListResponse(scores=scores, total=len(scores))
+        return MonthlyScoreListResponse(scores=entries, total=len(entries))
     except Exception:
         pass  # Redis 장애 시 DB 직접 조회로 폴백
 
-    start, end = get_current_month_range()
-    scores = db.query(MonthlyScore).filter(
-        MonthlyScore.created_at >= start,
-        MonthlyScore.created_at <= end
-    ).order_by(MonthlyScore.score.desc()).all()
-    return MonthlyScoreListResponse(scores=scores, total=len(scores))
+    rows = db.query(MonthlyScore).filter(
+        MonthlyScore.user_id.in_(user_ids),
+        MonthlyScore.month == get_month_start()
+    ).order_by(MonthlyScore.score.desc(), MonthlyScore.user_id).all()
+    entries = [
+        MonthlyScoreResponse(
+            nickname=row.nickname,
+            score=row.score,
+            created_at=row.created_at,
+            user_id=row.user_id,
+            rank=i + 1,
+        )
+        for i, row in enumerate(rows)
+    ]
+    return MonthlyScoreListResponse(scores=entries, total=len(entries))
+
+
+@router.get("/history/{month}", response_model=MonthlyScoreHistoryResponse)
+def get_monthly_history(
+    response: Response,
+    month: str = Path(..., pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="YYYY-MM"),
+    limit: int = Query(LEADERBOARD_DEFAULT_LIMIT, ge=1, le=LEADERBOARD_MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """지난달 최종 순위 조회 - 스냅샷 테이블 PK(month, rank) 구간을 1회 읽음
+
+    종료된 달은 변하지 않으므로 무기한 캐시 가능하다. 스냅샷이 아직 없으면 워커 하나만 1회 생성하고
+    (archive_month_once) 나머지는 잠시 기다렸다가 읽는다 — 생성 중이면 503 + Retry-After.
+    """
+    if month >= get_month_label():
+        raise HTTPException(
+            status_code=400,
+            detail=f"Month {month} is not finished yet"
+        )
+
+    month_start = get_month_start(month)
+
+    def read_page():
+        return db.query(
+            MonthlyScoreSnapshot, func.count().over().label("total")
+        ).filter(
+            MonthlyScoreSnapshot.month == month_start
+        ).order_by(
+            MonthlyScoreSnapshot.rank
+        ).offset(offset).limit(limit).all()
+
+    rows = read_page()
+    if rows:
+        total = rows[0].total
+    else:
+        try:
+            archived = archive_month_once(db, month)
+        except LeaderboardNotReady:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Leaderboard for {month} is being archived",
+                headers={"Retry-After": "1"},
+            )
+        if not archived:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No leaderboard archived for {month}"
+            )
+        rows = read_page()
+        # offset이 마지막 순위를 넘으면 빈 페이지라 window 함수로 total을 얻을 수 없음
+        total = rows[0].total if rows else db.query(func.count(MonthlyScoreSnapshot.rank)).filter(
+            MonthlyScoreSnapshot.month == month_start
+        ).scalar()
+
+    created_at = datetime.combine(month_start, datetime.min.time())
+    scores = [
+        MonthlyScoreResponse(
+            nickname=snapshot.nickname,
+            score=snapshot.score,
+            created_at=created_at,
+            user_id=snapshot.user_id,
+            rank=snapshot.rank,
+        )
+        for snapshot, _ in rows
+    ]
+    response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return MonthlyScoreHistoryResponse(month=month, scores=scores, total=total)
+
+
+@router.get("/stream")
+async def stream_monthly_scores(request: Request):
+    """
+    이번 달 리더보드 변경 SSE 스트림
+    - event: diff   -> {"month", "version", "changes": [{"user_id", "nickname", "score", "rank"} | {"user_id", "removed"}], "total"}
+    - event: resync -> 놓친 변경이 있으므로 GET /monthly-scores로 전체 목록 재조회
+    """
+    queue = broadcaster.subscribe()
+
+    async def event_stream():
+        try:
+            yield f"retry: {int(STREAM_KEEPALIVE_SECONDS * 1000)}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event.get('data', {}))}\n\n"
+        finally:
+            broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{user_id}", response_model=MonthlyScoreResponse)
@@ -144,12 +1509,23 @@ def get_monthly_score(
     db: Session = Depends(get_db)
 ):
     """특정 사용자 월간 점수 조회"""
-    start, end = get_current_month_range()
+    if settings.SCORE_WRITE_BEHIND:
+        # DB 반영이 지연될 수 있으므로 Redis를 먼저 조회
+        try:
+            score = redis_client.zscore(get_cache_key(), user_id)
+            if score is not None:
+                return MonthlyScoreResponse(
+                    nickname=resolve_nicknames(db, [user_id]).get(user_id, ""),
+                    score=int(score),
+                    created_at=get_current_month_range()[0],
+                    user_id=user_id,
+                )
+        except Exception:
+            pass
 
     score = db.query(MonthlyScore).filter(
         MonthlyScore.user_id == user_id,
-        MonthlyScore.created_at >= start,
-        MonthlyScore.created_at <= end
+        MonthlyScore.month == get_month_start()
     ).first()
 
     if score is None:
@@ -169,7 +1545,8 @@ def update_monthly_score(
 ):
     """특정 사용자 월간 점수 수정"""
     score = db.query(MonthlyScore).filter(
-        MonthlyScore.user_id == user_id
+        MonthlyScore.user_id == user_id,
+        MonthlyScore.month == get_month_start()
     ).first()
 
     if score is None:
@@ -182,7 +1559,10 @@ def update_monthly_score(
     db.commit()
     db.refresh(score)
     try:
-        redis_client.zadd(get_cache_key(), {f"{user_id}:{score.nickname}": float(score_data.score)})
+        pipe = redis_client.pipeline()
+        pipe.zadd(get_cache_key(), {user_id: float(score_data.score)})
+        record_board_change(user_id, score_data.score, pipe)
+        pipe.execute()
     except Exception:
         pass
     return score
@@ -195,7 +1575,8 @@ def delete_monthly_score(
 ):
     """특정 사용자 월간 점수 삭제"""
     score = db.query(MonthlyScore).filter(
-        MonthlyScore.user_id == user_id
+        MonthlyScore.user_id == user_id,
+        MonthlyScore.month == get_month_start()
     ).first()
 
     if score is None:
@@ -204,11 +1585,13 @@ def delete_monthly_score(
             detail=f"Monthly score for user {user_id} not found"
         )
 
-    member = f"{user_id}:{score.nickname}"
     db.delete(score)
     db.commit()
     try:
-        redis_client.zrem(get_cache_key(), member)
+        pipe = redis_client.pipeline()
+        pipe.zrem(get_cache_key(), user_id)
+        record_board_change(user_id, None, pipe)
+        pipe.execute()
     except Exception:
         pass
 
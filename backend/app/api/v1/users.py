@@ -1,12 +1,24 @@
 # backend/app/api/v1/users.py
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List
 from typing import Optional
 from fastapi import Query
 
 from app.api.deps import get_db, get_current_user, require_self_or_admin
-from app.core.security import hash_password
+from app.core.security import password_hasher
+from app.redis_client import redis_client
+from app.api.v1.monthly_scores import (
+    LEADERBOARD_WINDOWS,
+    get_cache_key,
+    get_nickname_key,
+    get_month_start,
+    get_window_key,
+    record_board_change,
+)
+from app.api.v1.friends import get_friends_key, query_friend_ids
+from app.api.v1.auth import get_user_by_email, save_user, revoke_refresh_sessions, sync_refresh_sessions
 from app.schemas.user import (
     UserCreateRequest,
     UserUpdateRequest,
@@ -23,13 +35,13 @@ router = APIRouter()
 
 
 @router.post("", response_model=UserResponse)
-def create_user(
+async def create_user(
     user: UserCreateRequest,
     db: Session = Depends(get_db)
 ):
-    """회원가입"""
+    """회원가입 (해싱은 프로세스 풀에서 await, DB 호출은 run_in_threadpool)"""
     # 이메일 중복 검증
-    existing_user = db.query(User).filter(User.email == user.email).first()
+    existing_user = await run_in_threadpool(get_user_by_email, db, user.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -40,15 +52,11 @@ def create_user(
     db_user = User(
         email=user.email,
         nickname=user.nickname,
-        password=hash_password(user.password),
+        password=await password_hasher.hash(user.password),
         birth_date=user.birth_date,
         role="user",
     )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-
-    return db_user
+    return await run_in_threadpool(save_user, db, db_user)
 
 
 @router.get("", response_model=List[UserResponse])
@@ -114,12 +122,32 @@ def update_user(
         if value is not None:
             setattr(user, field, value)
             if field == "nickname":
-                month = db.query(MonthlyScore).filter(MonthlyScore.user_id == user_id).all()
-                for i in month:
-                    i.nickname = value
+                # 이번 달 파티션만 갱신 (지난달 기록은 당시 닉네임 유지, 최종 순위는 스냅샷에 보존)
+                db.query(MonthlyScore).filter(
+                    MonthlyScore.user_id == user_id,
+                    MonthlyScore.month == get_month_start()
+                ).update({MonthlyScore.nickname: value}, synchronize_session=False)
 
     db.commit()
     db.refresh(user)
+
+    # refresh 세션 클레임(email/role/nickname) 동기화, 비밀번호 변경 시 전체 폐기
+    # — 실패를 삼키면 재발급 토큰에 옛 role/비밀번호 세션이 남으므로 503으로 알림
+    changed = {field for field, value in update_data.items() if value is not None}
+    if "password" in changed:
+        revoke_refresh_sessions(user_id)
+    elif {"email", "role", "nickname"} & changed:
+        sync_refresh_sessions(user)
+
+    if "nickname" in update_data and update_data["nickname"] is not None:
+        # 리더보드 member는 user_id이므로 닉네임 HASH 1건만 갱신하면 됨 (+ 증분 동기화용 변경 기록)
+        try:
+            pipe = redis_client.pipeline()
+            pipe.hset(get_nickname_key(), user_id, user.nickname)
+            record_board_change(user_id, pipe=pipe)
+            pipe.execute()
+        except Exception:
+            pass
     return user
 
 
@@ -137,6 +165,11 @@ def delete_user(
             detail=f"User with id {user_id} not found"
         )
 
+    friend_ids = query_friend_ids(db, user_id)  # Redis 친구 SET 정리용
+
+    # refresh 재발급은 DB를 보지 않으므로 삭제 전에 세션부터 폐기 (Redis 장애 시 503, 삭제하지 않음)
+    revoke_refresh_sessions(user_id)
+
     # FK 참조 테이블 데이터 먼저 삭제
     # GameVisit의 user_id를 NULL로 설정 (방문 기록 보존, FK 위반 방지)
     db.query(GameVisit).filter(GameVisit.user_id == user_id)\
@@ -152,6 +185,20 @@ def delete_user(
     db.delete(user)
     db.commit()
 
+    try:
+        pipe = redis_client.pipeline()
+        pipe.zrem(get_cache_key(), user_id)
+        record_board_change(user_id, pipe=pipe)
+        for window in LEADERBOARD_WINDOWS:
+            pipe.zrem(get_window_key(window), user_id)
+        pipe.hdel(get_nickname_key(), user_id)
+        pipe.delete(get_friends_key(user_id))
+        for friend_id in friend_ids:
+            pipe.srem(get_friends_key(friend_id), user_id)
+        pipe.execute()
+    except Exception:
+        pass
+
     return DeleteResponse(
         message="User deleted successfully",
         deleted_user_id=user_id
@@ -0,0 +1,59 @@
+# backend/app/background.py
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+_stop_event = threading.Event()
+_threads: list[threading.Thread] = []
+_wake_events: list[threading.Event] = []
+
+
+def start_periodic_job(
+    name: str,
+    interval: float,
+    job: Callable[[], None],
+    wake: threading.Event | None = None,
+    run_immediately: bool = False,
+) -> None:
+    """interval초마다 job을 실행하는 데몬 스레드 시작 (예외는 로그만 남기고 계속 실행)
+
+    wake가 주어지면 그 이벤트가 설정되는 즉시(interval 이전이라도) job을 실행한다.
+    run_immediately면 스레드 시작 직후 1회 먼저 실행한다 (실패해도 앱 시작을 막지 않음).
+    """
+    def run():
+        if run_immediately:
+            try:
+                job()
+            except Exception:
+                logger.exception("Background job %s failed", name)
+        while not _stop_event.is_set():
+            if wake is None:
+                _stop_event.wait(interval)
+            else:
+                wake.wait(interval)
+            if _stop_event.is_set():
+                break
+            try:
+                job()
+            except Exception:
+                logger.exception("Background job %s failed", name)
+
+    if wake is not None:
+        _wake_events.append(wake)
+    thread = threading.Thread(target=run, name=name, daemon=True)
+    thread.start()
+    _threads.append(thread)
+
+
+def stop_periodic_jobs(timeout: float = 5.0) -> None:
+    """모든 주기 작업 스레드를 정지하고 종료를 기다림"""
+    _stop_event.set()
+    for wake in _wake_events:
+        wake.set()
+    for thread in _threads:
+        thread.join(timeout)
+    _threads.clear()
+    _wake_events.clear()
+    _stop_event.clear()
@@ -29,6 +29,38 @@ class Settings:
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
     JWT_EXPIRE_MINUTES: int = int(os.getenv("JWT_EXPIRE_MINUTES", "15"))
     REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "30"))
+    # 검증된 Access Token payload 프로세스 로컬 캐시 크기 (같은 토큰 재요청 시 서명 검증 생략, exp까지만 유효)
+    JWT_CACHE_SIZE: int = int(os.getenv("JWT_CACHE_SIZE", "10000"))
+
+    # 비밀번호 해싱 프로세스 풀 (bcrypt를 워커 스레드/이벤트 루프 밖에서 실행, 대기열이 차면 즉시 503)
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+    # 앞단 리버스 프록시 수 (X-Forwarded-For의 오른쪽에서 이 번째 값을 클라이언트 IP로 사용, 0이면 헤더 무시)
+    TRUSTED_PROXY_HOPS: int = int(os.getenv("TRUSTED_PROXY_HOPS", "1"))
+    # 로그인 시도 제한 (bcrypt 검증 전에 Redis 슬라이딩 윈도우로 email/IP별 시도 횟수 제한, 초과 시 429)
+    LOGIN_THROTTLE_WINDOW_SECONDS: int = int(os.getenv("LOGIN_THROTTLE_WINDOW_SECONDS", "300"))
+    LOGIN_THROTTLE_EMAIL_LIMIT: int = int(os.getenv("LOGIN_THROTTLE_EMAIL_LIMIT", "10"))
+    LOGIN_THROTTLE_IP_LIMIT: int = int(os.getenv("LOGIN_THROTTLE_IP_LIMIT", "50"))
+
+    # Monthly Scores (write-behind: Redis에 먼저 기록하고 DB는 백그라운드로 반영)
+    SCORE_WRITE_BEHIND: bool = os.getenv("SCORE_WRITE_BEHIND", "false").lower() == "true"
+    SCORE_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("SCORE_FLUSH_INTERVAL_SECONDS", "1.0"))
+    SCORE_FLUSH_BATCH_SIZE: int = int(os.getenv("SCORE_FLUSH_BATCH_SIZE", "500"))
+    # 점수 제출 이벤트(score_events) 버퍼: FLUSH_SIZE건이 쌓이거나 FLUSH_INTERVAL마다 COPY로 기록
+    SCORE_EVENT_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("SCORE_EVENT_FLUSH_INTERVAL_SECONDS", "1.0"))
+    SCORE_EVENT_FLUSH_SIZE: int = int(os.getenv("SCORE_EVENT_FLUSH_SIZE", "1000"))
+    SCORE_EVENT_BUFFER_MAX: int = int(os.getenv("SCORE_EVENT_BUFFER_MAX", "100000"))
+    # monthly_scores 파티션 보관 기간 (이보다 오래된 월 파티션은 분리해 보관 테이블로 전환, 0이면 비활성)
+    MONTHLY_SCORE_RETENTION_MONTHS: int = int(os.getenv("MONTHLY_SCORE_RETENTION_MONTHS", "12"))
+    # 이벤트 리더보드 ZSET당 최대 인원 (초과 시 최하위부터 제거 — 이벤트 수와 무관하게 메모리 상한 유지)
+    EVENT_MAX_ENTRIES: int = int(os.getenv("EVENT_MAX_ENTRIES", "10000"))
+
+    # Redis (연결/읽기 타임아웃 + 서킷 브레이커: 연속 실패 시 즉시 DB 폴백 또는 503)
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+    REDIS_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("REDIS_CONNECT_TIMEOUT_SECONDS", "0.2"))
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", "0.5"))
+    REDIS_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("REDIS_BREAKER_FAILURE_THRESHOLD", "5"))
+    REDIS_BREAKER_PROBE_INTERVAL_SECONDS: float = float(os.getenv("REDIS_BREAKER_PROBE_INTERVAL_SECONDS", "2.0"))
 
 settings = Settings()
 
@@ -1,5 +1,9 @@
 # fastapi/app/core/security.py
+import asyncio
+import multiprocessing
 import secrets
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pwdlib import PasswordHash
 from pwdlib.hashers.bcrypt import BcryptHasher
@@ -21,6 +25,56 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class PasswordHashingBusy(Exception):
+    """해싱 대기열이 가득 차 요청을 받지 않음 (main.py에서 503으로 응답)"""
+
+
+class PasswordHashingPool:
+    """
+    bcrypt 해싱/검증 전용 프로세스 풀 (GIL과 무관하게 CPU를 쓰고 요청 워커 스레드를 점유하지 않음)
+    - async 엔드포인트에서 await — 해싱을 기다리는 동안 threadpool 스레드도 이벤트 루프도 묶이지 않음
+    - 실행 중 + 대기 중 작업이 workers + max_pending을 넘으면 기다리지 않고 PasswordHashingBusy
+    - 프로세스는 첫 사용 시 spawn으로 시작 (요청 스레드/백그라운드 스레드가 있는 상태에서 fork하지 않음)
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    async def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingBusy()
+        try:
+            return await asyncio.wrap_future(self._get_executor().submit(fn, *args))
+        finally:
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_hasher = PasswordHashingPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
+
+
 def create_refresh_token() -> str:
     return secrets.token_urlsafe(64)
 
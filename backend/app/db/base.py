@@ -2,6 +2,10 @@
 from app.db.session import Base
 
 # 모든 모델을 import하여 Base.metadata에 등록
-from models import User, Friendship, MonthlyScore, GameVisit
+from models import User, Friendship, MonthlyScore, MonthlyScoreSnapshot, ScoreEvent, Event, EventScore, GameVisit
+from app.db import partitions
 
-__all__ = ["Base", "User", "Friendship", "MonthlyScore", "GameVisit"]
+# create_all 시 monthly_scores 기본/월 파티션 생성
+partitions.register(MonthlyScore.__table__)
+
+__all__ = ["Base", "User", "Friendship", "MonthlyScore", "MonthlyScoreSnapshot", "ScoreEvent", "Event", "EventScore", "GameVisit"]
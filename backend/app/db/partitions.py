@@ -0,0 +1,118 @@
+# backend/app/db/partitions.py
+"""monthly_scores 월별 RANGE 파티션 관리 (생성/보관 분리)"""
+import logging
+from datetime import date
+
+from sqlalchemy import Table, event, text
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "monthly_scores"
+DEFAULT_PARTITION = "monthly_scores_default"  # 파티션이 없는 달(과거 데이터 등)을 받는 파티션
+PARTITION_MONTHS_AHEAD = 2                     # 이번 달 외에 미리 만들어 둘 파티션 수
+
+
+def add_months(month_start: date, months: int) -> date:
+    index = month_start.year * 12 + month_start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def get_partition_name(month_start: date) -> str:
+    return f"{PARENT_TABLE}_y{month_start.year}m{month_start.month:02d}"
+
+
+def get_archive_name(month_start: date) -> str:
+    return f"{PARENT_TABLE}_archive_y{month_start.year}m{month_start.month:02d}"
+
+
+def list_month_partitions(conn: Connection) -> list[tuple[str, date]]:
+    """붙어 있는 월 파티션 (이름, 해당 월 1일) 목록 - 기본 파티션 제외"""
+    names = conn.execute(text("""
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = :parent
+    """), {"parent": PARENT_TABLE}).scalars()
+    prefix = f"{PARENT_TABLE}_y"
+    partitions = []
+    for name in names:
+        if name.startswith(prefix):
+            year, month = name[len(prefix):].split("m")
+            partitions.append((name, date(int(year), int(month), 1)))
+    return sorted(partitions, key=lambda item: item[1])
+
+
+def create_month_partition(conn: Connection, month_start: date) -> bool:
+    """해당 월 파티션 생성 (이미 있으면 False)
+
+    기본 파티션에 이미 그 달 행이 있으면 PARTITION OF가 실패하므로
+    같은 트랜잭션 안에서 행을 잠시 옮겼다가 새 파티션으로 되돌린다.
+    """
+    name = get_partition_name(month_start)
+    if conn.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is not None:
+        return False
+
+    bounds = {"start": month_start, "end": add_months(month_start, 1)}
+    moved = conn.execute(text(f"""
+        SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE month >= :start AND month < :end)
+    """), bounds).scalar()
+    if moved:
+        conn.execute(text(f"""
+            CREATE TEMP TABLE _moved_monthly_scores ON COMMIT DROP AS
+            WITH moved AS (
+                DELETE FROM {DEFAULT_PARTITION} WHERE month >= :start AND month < :end RETURNING *
+            )
+            SELECT * FROM moved
+        """), bounds)
+    conn.execute(text(
+        f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{bounds['start']}') TO ('{bounds['end']}')"
+    ))
+    if moved:
+        conn.execute(text(f"INSERT INTO {name} SELECT * FROM _moved_monthly_scores"))
+        conn.execute(text("DROP TABLE _moved_monthly_scores"))
+    logger.info("Created partition %s", name)
+    return True
+
+
+def ensure_monthly_partitions(conn: Connection, today: date | None = None,
+                              months_ahead: int = PARTITION_MONTHS_AHEAD) -> list[str]:
+    """이번 달부터 months_ahead개월 뒤까지 파티션 생성, 새로 만든 파티션 이름 반환"""
+    current = (today or date.today()).replace(day=1)
+    created = []
+    for i in range(months_ahead + 1):
+        month_start = add_months(current, i)
+        if create_month_partition(conn, month_start):
+            created.append(get_partition_name(month_start))
+    return created
+
+
+def detach_expired_partitions(conn: Connection, retain_months: int, today: date | None = None) -> list[str]:
+    """이번 달 기준 retain_months개월보다 오래된 파티션을 분리해 보관 테이블로 이름 변경
+
+    분리된 테이블은 독립 테이블로 남으므로 필요하면 백업 후 DROP TABLE로 즉시 정리할 수 있다.
+    retain_months <= 0 이면 아무것도 하지 않음. 보관 테이블 이름 목록 반환.
+    """
+    if retain_months <= 0:
+        return []
+    cutoff = add_months((today or date.today()).replace(day=1), -retain_months)
+    archived = []
+    for name, month_start in list_month_partitions(conn):
+        if month_start >= cutoff:
+            break
+        archive_name = get_archive_name(month_start)
+        conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        conn.execute(text(f"ALTER TABLE {name} RENAME TO {archive_name}"))
+        logger.info("Detached partition %s as %s", name, archive_name)
+        archived.append(archive_name)
+    return archived
+
+
+def register(table: Table):
+    """create_all로 부모 테이블을 만들 때 기본 파티션과 이번 달~예정 파티션도 함께 생성"""
+    @event.listens_for(table, "after_create")
+    def create_partitions(target, connection, **kw):
+        connection.execute(text(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT"))
+        ensure_monthly_partitions(connection)
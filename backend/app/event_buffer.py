@@ -0,0 +1,50 @@
+# backend/app/event_buffer.py
+import logging
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class EventBuffer:
+    """
+    요청 스레드가 쌓고 백그라운드 플러셔가 일괄 기록하는 프로세스 로컬 버퍼 (스레드 안전)
+    - flush_size 이상 쌓이면 ready 이벤트를 세워 플러셔를 주기보다 먼저 깨운다
+    - DB 장애로 max_pending을 넘으면 가장 오래된 항목부터 버린다 (메모리 보호)
+    """
+
+    def __init__(self, flush_size: int, max_pending: int):
+        self.flush_size = flush_size
+        self.max_pending = max_pending
+        self.ready = threading.Event()
+        self._items: list[Any] = []
+        self._lock = threading.Lock()
+
+    def add(self, *items: Any) -> None:
+        with self._lock:
+            self._items.extend(items)
+            self._trim()
+            if len(self._items) >= self.flush_size:
+                self.ready.set()
+
+    def drain(self) -> list[Any]:
+        """쌓인 항목을 모두 꺼내 반환"""
+        with self._lock:
+            items, self._items = self._items, []
+            self.ready.clear()
+            return items
+
+    def requeue(self, items: list[Any]) -> None:
+        """기록에 실패한 항목을 순서를 유지한 채 앞쪽에 되돌림"""
+        with self._lock:
+            self._items[:0] = items
+            self._trim()
+
+    def _trim(self):
+        overflow = len(self._items) - self.max_pending
+        if overflow > 0:
+            del self._items[:overflow]
+            logger.warning("Event buffer full, dropped %d oldest events", overflow)
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,115 @@
+# backend/app/leaderboard_events.py
+import asyncio
+import json
+import logging
+from typing import Callable
+
+from app.redis_client import async_redis_client
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBER_QUEUE_SIZE = 8          # 클라이언트별 미전송 diff 최대 개수 (초과 시 resync 전송)
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+class LeaderboardBroadcaster:
+    """
+    워커 프로세스당 하나의 pub/sub 구독으로 점수 변경 이벤트를 받아
+    interval 동안 모은 변경분을 하나의 diff로 합쳐 모든 SSE 구독자에게 전달
+    (구독자가 없으면 pub/sub 구독도 종료)
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        board_key: Callable[[str], str],
+        nickname_key: str,
+        interval: float = 1.0,
+    ):
+        self.channel = channel
+        self.board_key = board_key
+        self.nickname_key = nickname_key
+        self.interval = interval
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    async def _run(self):
+        while self._subscribers:
+            pubsub = async_redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                while self._subscribers:
+                    pending, versions = await self._collect(pubsub)
+                    for month, changes in pending.items():
+                        self._publish(await self._build_diff(month, changes, versions.get(month)))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Leaderboard event subscription failed")
+                # 끊긴 동안의 변경은 유실되므로 클라이언트가 전체 목록을 다시 받게 한다
+                self._publish({"type": "resync"})
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+            finally:
+                await pubsub.aclose()
+
+    async def _collect(self, pubsub) -> tuple[dict[str, dict[int, int | None]], dict[str, int]]:
+        """interval 동안 받은 이벤트를 월/사용자별 마지막 점수로 병합 (+ 월별 최신 버전)"""
+        pending: dict[str, dict[int, int | None]] = {}
+        versions: dict[str, int] = {}
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.interval
+        while (remaining := deadline - loop.time()) > 0:
+            message = await pubsub.get_message(timeout=remaining)
+            if message is None or message["type"] != "message":
+                continue
+            event = json.loads(message["data"])
+            pending.setdefault(event["month"], {})[int(event["user_id"])] = event["score"]
+            if event.get("version") is not None:
+                versions[event["month"]] = max(versions.get(event["month"], 0), event["version"])
+        return pending, versions
+
+    async def _build_diff(self, month: str, changes: dict[int, int | None], version: int | None) -> dict:
+        """변경된 사용자의 현재 순위/점수/닉네임을 1회 왕복으로 조회해 diff 구성"""
+        key = self.board_key(month)
+        user_ids = list(changes)
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.zrevrank(key, user_id)
+            pipe.zmscore(key, user_ids)
+            pipe.hmget(self.nickname_key, user_ids)
+            pipe.zcard(key)
+            *ranks, scores, nicknames, total = await pipe.execute()
+
+        entries = []
+        for user_id, rank, score, nickname in zip(user_ids, ranks, scores, nicknames):
+            if rank is None:
+                entries.append({"user_id": user_id, "removed": True})
+            else:
+                entries.append({
+                    "user_id": user_id,
+                    "nickname": nickname,
+                    "score": int(score),
+                    "rank": rank + 1,
+                })
+        entries.sort(key=lambda entry: entry.get("rank", 0))
+        return {"type": "diff", "data": {"month": month, "version": version, "changes": entries, "total": total}}
+
+    def _publish(self, event: dict):
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # 느린 클라이언트: 밀린 diff를 버리고 전체 재조회를 요청
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": "resync"})
@@ -1,8 +1,159 @@
-import redis
+import logging
 import os
+import threading
+import time
+
+import redis
+import redis.asyncio
+from redis.backoff import ExponentialBackoff
+from redis.client import Pipeline
+from redis.exceptions import ConnectionError, TimeoutError
+from redis.retry import Retry
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+REDIS_HOST = os.getenv("REDIS_HOST", "redis-server")
+REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+
+
+class RedisUnavailable(ConnectionError):
+    """서킷 브레이커가 열려 있어 Redis 호출을 보내지 않고 즉시 실패 (기존 except 폴백/503 처리 대상)"""
+
+
+class CircuitBreaker:
+    """
+    Redis 연결/타임아웃 오류가 연속 failure_threshold회 발생하면 열림(open) 상태로 전환해
+    모든 호출을 즉시 실패시키고, 백그라운드 probe가 PING에 성공하면 다시 닫는다.
+    """
+
+    def __init__(self, probe_client: redis.Redis, failure_threshold: int, probe_interval: float):
+        self.probe_client = probe_client
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+        self.trips = 0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def before_call(self):
+        if self.opened_at is not None:
+            raise RedisUnavailable("Redis circuit breaker is open")
+
+    def record_success(self):
+        if self.consecutive_failures:
+            self.consecutive_failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.opened_at is None and self.consecutive_failures >= self.failure_threshold:
+                self.opened_at = time.time()
+                self.trips += 1
+                logger.warning("Redis circuit breaker opened after %d failures", self.consecutive_failures)
+                threading.Thread(target=self._probe, name="redis-breaker-probe", daemon=True).start()
+
+    def close(self):
+        with self._lock:
+            self.opened_at = None
+            self.consecutive_failures = 0
+
+    def _probe(self):
+        """열린 동안 probe_interval마다 PING, 성공하면 닫음"""
+        while self.opened_at is not None:
+            time.sleep(self.probe_interval)
+            try:
+                self.probe_client.ping()
+            except Exception:
+                continue
+            logger.info("Redis circuit breaker closed (probe succeeded)")
+            self.close()
+
+    def snapshot(self) -> dict:
+        """모니터링용 상태"""
+        return {
+            "state": "open" if self.is_open else "closed",
+            "consecutive_failures": self.consecutive_failures,
+            "opened_at": self.opened_at,
+            "trips": self.trips,
+        }
+
+
+class GuardedPipeline(Pipeline):
+    """execute() 1회를 Redis 호출 1회로 보고 서킷 브레이커에 반영"""
+
+    breaker: CircuitBreaker
+
+    def execute(self, raise_on_error: bool = True):
+        self.breaker.before_call()
+        try:
+            result = super().execute(raise_on_error)
+        except (ConnectionError, TimeoutError):
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+
+class GuardedRedis(redis.Redis):
+    """모든 명령(Lua 스크립트 포함)과 파이프라인을 서킷 브레이커로 감싼 클라이언트"""
+
+    def __init__(self, breaker: CircuitBreaker, **kwargs):
+        super().__init__(**kwargs)
+        self.breaker = breaker
+
+    def execute_command(self, *args, **options):
+        self.breaker.before_call()
+        try:
+            result = super().execute_command(*args, **options)
+        except (ConnectionError, TimeoutError):
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def pipeline(self, transaction=True, shard_hint=None) -> GuardedPipeline:
+        pipe = GuardedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+        pipe.breaker = self.breaker
+        return pipe
+
+
+def _connection_pool(**kwargs) -> redis.BlockingConnectionPool:
+    """연결/읽기 타임아웃, 1회 재시도, 풀 대기 시간이 짧은 공유 커넥션 풀"""
+    return redis.BlockingConnectionPool(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,  # 풀이 가득 찼을 때 빈 연결을 기다리는 시간
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        retry=Retry(ExponentialBackoff(cap=0.05, base=0.01), 1),
+        health_check_interval=30,
+        **kwargs,
+    )
+
+
+redis_breaker = CircuitBreaker(
+    # probe는 브레이커를 거치지 않는 별도 클라이언트로 PING
+    probe_client=redis.Redis(connection_pool=_connection_pool()),
+    failure_threshold=settings.REDIS_BREAKER_FAILURE_THRESHOLD,
+    probe_interval=settings.REDIS_BREAKER_PROBE_INTERVAL_SECONDS,
+)
+
+redis_client = GuardedRedis(redis_breaker, connection_pool=_connection_pool(decode_responses=True))
+
+# 직렬화된 응답 바이트 캐시 전용 클라이언트 (decode 없이 bytes 그대로 반환)
+binary_redis_client = GuardedRedis(redis_breaker, connection_pool=_connection_pool())
 
-redis_client = redis.Redis(
-    host=os.getenv("REDIS_HOST", "redis-server"),
-    port=int(os.getenv("REDIS_PORT", 6379)),
+# pub/sub 구독 등 async 엔드포인트 전용 클라이언트 (구독 대기는 길어질 수 있으므로 연결 타임아웃만 적용)
+async_redis_client = redis.asyncio.Redis(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
     decode_responses=True
 )
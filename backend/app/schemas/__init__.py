@@ -12,16 +12,42 @@ from app.schemas.user import (
     LoginRequest,
     LoginResponse,
     DeleteResponse,
+    LoginThrottleCounter,
+    LoginThrottleCountersResponse,
+    RefreshSessionResponse,
+    RefreshSessionListResponse,
+    LogoutAllResponse,
 )
 
 from app.schemas.monthly_score import (
     MonthlyScoreCreateRequest,
+    MonthlyScoreBatchRequest,
     MonthlyScoreUpdateRequest,
     MonthlyScoreResponse,
     MonthlyScoreListResponse,
+    MonthlyScoreBatchItemResult,
+    MonthlyScoreBatchResponse,
+    MonthlyScoreRankResponse,
+    MonthlyScoreHistoryResponse,
+    MonthlyScoreDistributionBucket,
+    MonthlyScoreDistributionResponse,
     MonthlyScoreDeleteResponse,
 )
 
+from app.schemas.leaderboard import (
+    LeaderboardEntry,
+    LeaderboardWindowResponse,
+)
+
+from app.schemas.event import (
+    EventCreateRequest,
+    EventResponse,
+    EventListResponse,
+    EventScoreRequest,
+    EventScoreResponse,
+    EventLeaderboardResponse,
+)
+
 from app.schemas.friendship import (
     FriendRequestRequest,
     FriendRequestResponse,
@@ -57,12 +83,34 @@ __all__ = [
     "LoginRequest",
     "LoginResponse",
     "DeleteResponse",
+    "LoginThrottleCounter",
+    "LoginThrottleCountersResponse",
+    "RefreshSessionResponse",
+    "RefreshSessionListResponse",
+    "LogoutAllResponse",
     # MonthlyScore schemas
     "MonthlyScoreCreateRequest",
+    "MonthlyScoreBatchRequest",
     "MonthlyScoreUpdateRequest",
     "MonthlyScoreResponse",
     "MonthlyScoreListResponse",
+    "MonthlyScoreBatchItemResult",
+    "MonthlyScoreBatchResponse",
+    "MonthlyScoreRankResponse",
+    "MonthlyScoreHistoryResponse",
+    "MonthlyScoreDistributionBucket",
+    "MonthlyScoreDistributionResponse",
     "MonthlyScoreDeleteResponse",
+    # Leaderboard schemas
+    "LeaderboardEntry",
+    "LeaderboardWindowResponse",
+    # Event schemas
+    "EventCreateRequest",
+    "EventResponse",
+    "EventListResponse",
+    "EventScoreRequest",
+    "EventScoreResponse",
+    "EventLeaderboardResponse",
     # Friendship schemas
     "FriendRequestRequest",
     "FriendRequestResponse",
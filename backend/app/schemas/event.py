@@ -0,0 +1,55 @@
+# backend/app/schemas/event.py
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Optional
+
+from app.schemas.leaderboard import LeaderboardEntry
+
+
+class EventCreateRequest(BaseModel):
+    """이벤트(토너먼트) 생성 요청 — 시각은 서버 로컬 시간 기준"""
+    name: str = Field(..., min_length=1, max_length=100)
+    starts_at: datetime
+    ends_at: datetime
+
+
+class EventResponse(BaseModel):
+    """이벤트 응답"""
+    id: int
+    name: str
+    starts_at: datetime
+    ends_at: datetime
+    created_at: datetime
+    archived_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class EventListResponse(BaseModel):
+    """이벤트 목록 응답 (starts_at 내림차순)"""
+    events: List[EventResponse]
+    total: int
+
+
+class EventScoreRequest(BaseModel):
+    """이벤트 점수 제출 요청"""
+    user_id: int
+    score: int
+
+
+class EventScoreResponse(BaseModel):
+    """이벤트 점수 제출 응답"""
+    event_id: int
+    user_id: int
+    score: Optional[int] = None  # 반영 후 이벤트 내 최고 점수 (최대 인원 밖으로 밀려났으면 None)
+    rank: Optional[int] = None   # 1부터 시작
+
+
+class EventLeaderboardResponse(BaseModel):
+    """이벤트 리더보드 페이지 응답 (archived=True면 보관된 최종 순위)"""
+    event_id: int
+    archived: bool
+    scores: List[LeaderboardEntry]
+    total: int
+    next_cursor: Optional[str] = None
@@ -0,0 +1,20 @@
+# backend/app/schemas/leaderboard.py
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class LeaderboardEntry(BaseModel):
+    """기간별 리더보드 항목"""
+    user_id: int
+    nickname: str
+    score: int  # 기간 내 최고 점수
+    rank: int   # 1부터 시작
+
+
+class LeaderboardWindowResponse(BaseModel):
+    """기간별(일간/주간/전체) 리더보드 페이지 응답 (total은 기간 내 전체 참가자 수)"""
+    window: str                   # "daily" | "weekly" | "all-time"
+    period: Optional[str] = None  # daily=YYYY-MM-DD, weekly=YYYY-Www, all-time=None
+    scores: List[LeaderboardEntry]
+    total: int
+    next_cursor: Optional[str] = None  # 다음 페이지 조회용 cursor (마지막 페이지면 None)
@@ -1,7 +1,7 @@
 # backend/app/schemas/monthly_score.py
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 
 class MonthlyScoreCreateRequest(BaseModel):
@@ -10,6 +10,11 @@ class MonthlyScoreCreateRequest(BaseModel):
     score: int
 
 
+class MonthlyScoreBatchRequest(BaseModel):
+    """월간 점수 일괄 제출 요청 (같은 user_id가 여러 번 있으면 최고 점수만 반영)"""
+    scores: List[MonthlyScoreCreateRequest] = Field(..., min_length=1, max_length=1000)
+
+
 class MonthlyScoreUpdateRequest(BaseModel):
     """월간 점수 수정 요청"""
     score: int
@@ -20,17 +25,72 @@ class MonthlyScoreResponse(BaseModel):
     nickname: str
     score: int
     created_at: datetime
+    user_id: Optional[int] = None
+    rank: Optional[int] = None  # 리더보드 조회 시에만 채워짐 (1부터 시작)
+    rank_delta: Optional[int] = None  # 오늘 순위 스냅샷 대비 순위 변화 (양수 = 상승, 스냅샷에 없으면 None)
 
     class Config:
         from_attributes = True
 
 
+class MonthlyScoreBatchItemResult(BaseModel):
+    """일괄 제출 항목별 결과 (요청 순서와 동일)"""
+    user_id: int
+    status: str                  # "ok" | "not_found"
+    score: Optional[int] = None  # 반영 후 이번 달 최고 점수 (status="ok"일 때만)
+
+
+class MonthlyScoreBatchResponse(BaseModel):
+    """월간 점수 일괄 제출 응답"""
+    results: List[MonthlyScoreBatchItemResult]
+    accepted: int
+    rejected: int
+
+
 class MonthlyScoreListResponse(BaseModel):
-    """월간 점수 목록 응답"""
+    """월간 점수 목록 응답 (total은 이번 달 전체 참가자 수)"""
+    scores: List[MonthlyScoreResponse]
+    total: int
+    version: Optional[int] = None  # 리더보드 버전 (다음 요청의 since로 사용, DB 폴백 시 None)
+    full: bool = True              # False면 scores는 since 이후 변경된 member만 포함
+    removed: List[int] = []        # since 이후 리더보드에서 빠진 user_id (full=False일 때만)
+    next_cursor: Optional[str] = None  # 다음 페이지 조회용 cursor (마지막 페이지면 None)
+
+
+class MonthlyScoreHistoryResponse(BaseModel):
+    """지난달 최종 순위 스냅샷 응답"""
+    month: str  # YYYY-MM
     scores: List[MonthlyScoreResponse]
     total: int
 
 
+class MonthlyScoreRankResponse(BaseModel):
+    """특정 사용자의 이번 달 순위 응답"""
+    user_id: int
+    nickname: str
+    score: int
+    rank: int
+    total: int
+    percentile: float  # 해당 사용자보다 점수가 낮은 참가자 비율 (%)
+
+
+class MonthlyScoreDistributionBucket(BaseModel):
+    """점수 구간별 인원 (min_score ~ max_score, 양끝 포함)"""
+    min_score: int
+    max_score: int
+    count: int
+
+
+class MonthlyScoreDistributionResponse(BaseModel):
+    """이번 달 점수 분포 응답 (구간 폭은 모두 같음)"""
+    month: str  # YYYY-MM
+    total: int
+    buckets: List[MonthlyScoreDistributionBucket]
+    version: Optional[int] = None       # 분포 계산 기준 리더보드 버전 (DB 폴백 시 None)
+    score: Optional[int] = None         # 요청한 점수 (?score=)
+    percentile: Optional[float] = None  # score보다 낮은 참가자 비율 (%)
+
+
 class MonthlyScoreDeleteResponse(BaseModel):
     """월간 점수 삭제 응답"""
     message: str
@@ -1,7 +1,7 @@
 # backend/app/schemas/user.py
 from pydantic import BaseModel
-from datetime import date
-from typing import Optional
+from datetime import date, datetime
+from typing import List, Optional
 
 
 class UserCreateRequest(BaseModel):
@@ -67,3 +67,40 @@ class DeleteResponse(BaseModel):
 class GoogleLoginRequest(BaseModel):
     """구글 로그인 요청: 프론트엔드에서 전송하는 Authorization Code"""
     code: str
+
+
+class LoginThrottleCounter(BaseModel):
+    """로그인 시도 카운터 (kind = "email" 또는 "ip")"""
+    kind: str
+    subject: str
+    attempts: int        # 현재 윈도우 안의 시도 횟수
+    limit: int
+    blocked: bool
+    reset_in: int        # 가장 오래된 시도가 윈도우 밖으로 빠지기까지 남은 초
+
+
+class LoginThrottleCountersResponse(BaseModel):
+    """로그인 시도 카운터 목록 응답 (최근 시도 순)"""
+    window_seconds: int
+    counters: List[LoginThrottleCounter]
+    total: int
+
+
+class RefreshSessionResponse(BaseModel):
+    """로그인 세션(refresh 토큰) 정보 — 토큰 원문 대신 세션 ID(SHA-256)만 노출"""
+    session_id: str
+    created_at: datetime
+    expires_at: datetime
+    current: bool        # 요청에 실린 refresh 쿠키의 세션인지
+
+
+class RefreshSessionListResponse(BaseModel):
+    """내 로그인 세션 목록 응답 (최근 로그인 순)"""
+    sessions: List[RefreshSessionResponse]
+    total: int
+
+
+class LogoutAllResponse(BaseModel):
+    """전체 로그아웃 응답"""
+    message: str
+    revoked: int
@@ -1,15 +1,22 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
 
 # 새 구조의 모듈 import
 from app.db.session import engine, SessionLocal, wait_for_db
 from app.db.base import Base
-from app.api.v1 import users, auth, monthly_scores, game_visits, friends, chat, pinball_ai, game_sessions, notices
+from app.api.v1 import users, auth, monthly_scores, leaderboards, events, game_visits, friends, chat, pinball_ai, game_sessions, notices
 
 #---
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from fastapi import APIRouter, Depends
-from app.api.deps import get_db
+from app.api.deps import get_db, token_cache
+from app.core.config import settings
+from app import background
+from app.db import partitions
+from app.redis_client import redis_breaker
+from app.core.security import PasswordHashingBusy, password_hasher
 
 #---
 
@@ -43,10 +50,132 @@ if os.getenv("TESTING") != "1":
 # FastAPI 앱 생성
 app = FastAPI(title="Hexsera API", version="1.0.0", redirect_slashes=False)
 
+MONTHLY_ARCHIVE_INTERVAL_SECONDS = 600
+MONTHLY_PARTITION_INTERVAL_SECONDS = 6 * 3600
+EVENT_ARCHIVE_INTERVAL_SECONDS = 60
+RANK_SNAPSHOT_INTERVAL_SECONDS = 600
+
+
+def flush_monthly_scores_job():
+    """write-behind 플러셔: 지난달(월 경계 직후 잔여분)과 이번 달 dirty member를 모두 DB에 반영"""
+    batch_size = settings.SCORE_FLUSH_BATCH_SIZE
+    db = SessionLocal()
+    try:
+        for month in (monthly_scores.get_previous_month_label(), monthly_scores.get_month_label()):
+            while monthly_scores.flush_dirty_scores(db, month, batch_size) >= batch_size:
+                pass
+    finally:
+        db.close()
+
+
+def flush_score_events_job():
+    """점수 제출 이벤트 버퍼를 score_events에 COPY (+ 월간 최고 점수 파생 반영)"""
+    db = SessionLocal()
+    try:
+        monthly_scores.flush_score_events(db)
+    finally:
+        db.close()
+
+
+def archive_previous_month_job():
+    """월 전환 작업: 지난달 순위를 스냅샷 테이블에 고정 (이미 고정된 달은 건너뜀)
+
+    history 조회와 같은 락을 쓰는 archive_month_once로 워커 하나만 보관한다.
+    다른 워커가 보관 중이라 대기 시간 내에 끝나지 않으면 다음 주기에 다시 확인.
+    """
+    db = SessionLocal()
+    try:
+        monthly_scores.archive_month_once(db, monthly_scores.get_previous_month_label())
+    except monthly_scores.LeaderboardNotReady:
+        pass
+    finally:
+        db.close()
+
+
+def snapshot_monthly_ranks_job():
+    """일별 순위 스냅샷: 날짜가 바뀐 뒤 첫 실행에서 이번 달 순위를 HASH로 고정 (순위 변화 표시 기준)"""
+    db = SessionLocal()
+    try:
+        monthly_scores.snapshot_monthly_ranks(db)
+    finally:
+        db.close()
+
+
+def archive_ended_events_job():
+    """종료된 이벤트 순위를 event_scores에 보관하고 Redis ZSET 삭제"""
+    db = SessionLocal()
+    try:
+        events.archive_ended_events(db)
+    finally:
+        db.close()
+
+
+def maintain_monthly_partitions_job():
+    """monthly_scores 파티션 관리: 다가올 달 파티션 미리 생성 + 보관 기간이 지난 파티션 분리"""
+    with engine.begin() as conn:
+        partitions.ensure_monthly_partitions(conn)
+        partitions.detach_expired_partitions(conn, settings.MONTHLY_SCORE_RETENTION_MONTHS)
+
+
+@app.on_event("startup")
+def start_background_jobs():
+    """백그라운드 주기 작업 시작 (테스트 환경 제외)"""
+    if os.getenv("TESTING") == "1":
+        return
+    if settings.SCORE_WRITE_BEHIND:
+        background.start_periodic_job(
+            "monthly-score-flusher",
+            settings.SCORE_FLUSH_INTERVAL_SECONDS,
+            flush_monthly_scores_job,
+        )
+    background.start_periodic_job(
+        "score-event-flusher",
+        settings.SCORE_EVENT_FLUSH_INTERVAL_SECONDS,
+        flush_score_events_job,
+        wake=monthly_scores.score_event_buffer.ready,
+    )
+    # 파티션 DDL 실패(워커 간 경합, 마이그레이션 전 DB 등)가 앱 시작을 막지 않도록 주기 작업 스레드에서 즉시 1회 실행
+    background.start_periodic_job(
+        "monthly-score-partitions",
+        MONTHLY_PARTITION_INTERVAL_SECONDS,
+        maintain_monthly_partitions_job,
+        run_immediately=True,
+    )
+    background.start_periodic_job(
+        "monthly-score-archiver",
+        MONTHLY_ARCHIVE_INTERVAL_SECONDS,
+        archive_previous_month_job,
+    )
+    background.start_periodic_job(
+        "monthly-rank-snapshot",
+        RANK_SNAPSHOT_INTERVAL_SECONDS,
+        snapshot_monthly_ranks_job,
+    )
+    background.start_periodic_job(
+        "event-archiver",
+        EVENT_ARCHIVE_INTERVAL_SECONDS,
+        archive_ended_events_job,
+    )
+
+
+@app.on_event("shutdown")
+def stop_background_jobs():
+    """주기 작업 정지 후 버퍼에 남은 점수 이벤트와 write-behind 잔여분을 마지막으로 DB에 반영"""
+    background.stop_periodic_jobs()
+    password_hasher.shutdown()
+    if os.getenv("TESTING") == "1":
+        return
+    flush_score_events_job()
+    if settings.SCORE_WRITE_BEHIND:
+        flush_monthly_scores_job()
+
+
 # 라우터 등록
 app.include_router(users.router, prefix="/api/v1/users", tags=["Users"])
 app.include_router(auth.router, prefix="/api/v1", tags=["Auth"])
 app.include_router(monthly_scores.router, prefix="/api/v1/monthly-scores", tags=["Monthly Scores"])
+app.include_router(leaderboards.router, prefix="/api/v1/leaderboards", tags=["Leaderboards"])
+app.include_router(events.router, prefix="/api/v1/events", tags=["Events"])
 app.include_router(game_visits.router, prefix="/api/v1/game_visits", tags=["Game Visits"])
 app.include_router(friends.router, prefix="/api/friend-requests", tags=["Friends"])
 app.include_router(chat.router, prefix="/api/v1", tags=["Chat"])
@@ -55,12 +184,46 @@ app.include_router(game_sessions.router, prefix="/api/v1/game-sessions", tags=["
 app.include_router(notices.router, prefix="/api/v1/notices", tags=["Notices"])
 
 
+@app.exception_handler(RedisConnectionError)
+@app.exception_handler(RedisTimeoutError)
+async def redis_unavailable_handler(request: Request, exc: Exception):
+    """DB 폴백이 없는 Redis 경로(세션, 게임 세션 등)는 타임아웃까지 매달리지 않고 즉시 503"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Redis is temporarily unavailable"},
+        headers={"Retry-After": str(int(settings.REDIS_BREAKER_PROBE_INTERVAL_SECONDS) or 1)},
+    )
+
+
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+    """로그인/가입 폭주 시 해싱 대기열을 무한정 늘리지 않고 즉시 거절"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many authentication requests, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
 # 헬스 체크 엔드포인트
 @app.get("/api/")
 def health_check():
     return {"status": "ok", "message": "FastAPI is running"}
 
 
+@app.get("/api/health/redis")
+def redis_health_check():
+    """Redis 서킷 브레이커 상태 (모니터링용, 열려 있으면 503)"""
+    snapshot = redis_breaker.snapshot()
+    return JSONResponse(status_code=503 if redis_breaker.is_open else 200, content=snapshot)
+
+
+@app.get("/api/health/jwt-cache")
+def jwt_cache_health_check():
+    """Access Token 검증 캐시 상태 (크기, 적중/미스 횟수)"""
+    return token_cache.snapshot()
+
+
 @app.get("/api/test")
 def api_test():
     return {"status": "ok", "message": "API test endpoint"}
@@ -1,5 +1,5 @@
 from enum import Enum
-from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, UniqueConstraint, CheckConstraint, ForeignKey, Text
+from sqlalchemy import Column, BigInteger, Integer, String, Date, DateTime, Boolean, UniqueConstraint, CheckConstraint, ForeignKey, Index, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -41,13 +41,75 @@ class Friendship(Base):
 class MonthlyScore(Base):
     __tablename__ = "monthly_scores"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
     nickname = Column(String(100), nullable=False)
-    score = Column(Integer, nullable=False, index=True)
+    score = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
+    # 해당 월 1일 — 월별 RANGE 파티션 키 (파티션 테이블의 PK/UNIQUE는 파티션 키를 포함해야 함)
+    month = Column(Date, primary_key=True, server_default=text("(date_trunc('month', now()))::date"))
+
+    __table_args__ = (
+        UniqueConstraint('user_id', 'month', name='uq_monthly_score_user_month'),
+        # 리더보드 DB 폴백(월 필터 + score/user_id 내림차순 keyset)을 index-only scan으로 처리하는 covering index
+        Index(
+            'ix_monthly_scores_month_score_user',
+            'month', score.desc(), user_id.desc(),
+            postgresql_include=['nickname', 'created_at'],
+        ),
+        # 파티션 생성/보관 분리는 app/db/partitions.py
+        {'postgresql_partition_by': 'RANGE (month)'},
+    )
+
+
+class MonthlyScoreSnapshot(Base):
+    """종료된 달의 최종 순위 스냅샷 (월 전환 작업이 1회 기록, 이후 변경 없음)"""
+    __tablename__ = "monthly_score_snapshots"
+
+    month = Column(Date, primary_key=True)
+    rank = Column(Integer, primary_key=True)
+    user_id = Column(Integer, nullable=False, index=True)  # 탈퇴 후에도 기록 보존 (FK 없음)
+    nickname = Column(String(100), nullable=False)
+    score = Column(Integer, nullable=False)
+
+
+class ScoreEvent(Base):
+    """모든 점수 제출 기록 (append-only, 분석용) — 월간 최고 점수는 이 이벤트에서 파생"""
+    __tablename__ = "score_events"
+
+    id = Column(BigInteger, primary_key=True)
+    user_id = Column(Integer, nullable=False, index=True)  # 탈퇴 후에도 기록 보존 (FK 없음)
+    score = Column(Integer, nullable=False)
     created_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
 
 
+class Event(Base):
+    """기간 한정 이벤트(토너먼트) — 진행 중 점수는 Redis ZSET, 종료 후 event_scores에 보관"""
+    __tablename__ = "events"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False)
+    starts_at = Column(DateTime, nullable=False)
+    ends_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    archived_at = Column(DateTime, nullable=True)  # 최종 순위 보관 완료 시각 (보관 작업이 기록)
+
+    __table_args__ = (
+        CheckConstraint('ends_at > starts_at', name='ck_event_period'),
+    )
+
+
+class EventScore(Base):
+    """종료된 이벤트의 최종 순위 (보관 작업이 1회 기록, 이후 변경 없음)"""
+    __tablename__ = "event_scores"
+
+    event_id = Column(Integer, ForeignKey('events.id', ondelete='CASCADE'), primary_key=True)
+    rank = Column(Integer, primary_key=True)
+    user_id = Column(Integer, nullable=False, index=True)  # 탈퇴 후에도 기록 보존 (FK 없음)
+    nickname = Column(String(100), nullable=False)
+    score = Column(Integer, nullable=False)
+
+
 class GameVisit(Base):
     __tablename__ = "game_visits"
 
@@ -44,11 +44,13 @@ def create_mock_users(db, count=50):
 def create_mock_monthly_scores(db, users):
     for user in users:
         days_ago = random.randint(0, 30)
+        created_at = datetime.utcnow() - timedelta(days=days_ago)
         score = MonthlyScore(
             user_id=user.id,
             nickname=user.nickname,
             score=random.randint(1000, 59999),
-            created_at=datetime.utcnow() - timedelta(days=days_ago)
+            created_at=created_at,
+            month=created_at.date().replace(day=1)
         )
         db.add(score)
     db.commit()
@@ -18,7 +18,7 @@ sys.path.insert(0, '/code')
 
 from app.db.session import SessionLocal
 from models import User, MonthlyScore
-from app.api.v1.monthly_scores import create_or_update_monthly_score, get_current_month_range
+from app.api.v1.monthly_scores import create_or_update_monthly_score, get_month_start
 from app.schemas.monthly_score import MonthlyScoreCreateRequest
 
 
@@ -40,12 +40,11 @@ def run(count: int):
         print("-" * 55)
 
         # 이번 달 기존 데이터 일괄 제거
-        start, end = get_current_month_range()
+        month_start = get_month_start()
         target_ids = [u.id for u in targets]
         deleted = db.query(MonthlyScore).filter(
             MonthlyScore.user_id.in_(target_ids),
-            MonthlyScore.created_at >= start,
-            MonthlyScore.created_at <= end,
+            MonthlyScore.month == month_start,
         ).delete(synchronize_session=False)
         db.commit()
         if deleted:
@@ -62,8 +61,7 @@ def run(count: int):
             # 실제 저장값 확인
             row = db.query(MonthlyScore).filter(
                 MonthlyScore.user_id == user.id,
-                MonthlyScore.created_at >= start,
-                MonthlyScore.created_at <= end,
+                MonthlyScore.month == month_start,
             ).first()
             saved = row.score if row else None
             ok = saved == expected
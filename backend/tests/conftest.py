@@ -21,6 +21,10 @@ TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_eng
 TABLES_TO_TRUNCATE = [
     "friendships",
     "monthly_scores",
+    "monthly_score_snapshots",
+    "score_events",
+    "event_scores",
+    "events",
     "game_visits",
     "users",
 ]
@@ -44,6 +48,16 @@ def truncate_tables():
         conn.commit()
 
 
+@pytest.fixture(scope="function", autouse=True)
+def reset_login_throttle():
+    """로그인 시도 카운터가 테스트 간(반복 실행 포함) 누적되지 않도록 초기화"""
+    from app.redis_client import redis_client
+    keys = list(redis_client.scan_iter("login_throttle:*"))
+    if keys:
+        redis_client.delete(*keys)
+    yield
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """프로덕션과 동일한 독립 세션 - commit()이 실제로 DB에 반영됨"""
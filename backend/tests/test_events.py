@@ -0,0 +1,148 @@
+"""이벤트(토너먼트) 리더보드 API 테스트"""
+from datetime import datetime, timedelta
+
+import pytest
+from app.redis_client import redis_client
+from app.api.v1 import events
+from app.api.v1.events import get_event_key, archive_ended_events
+
+
+@pytest.fixture
+def admin_client(client):
+    """require_admin을 통과하는 클라이언트"""
+    from main import app
+    from app.api.deps import require_admin
+
+    app.dependency_overrides[require_admin] = lambda: {"sub": "1", "role": "admin"}
+    return client
+
+
+@pytest.fixture
+def players(db_session):
+    """사용자 3명 생성"""
+    from models import User
+    from datetime import date
+
+    users = []
+    for i in range(1, 4):
+        user = User(
+            email=f"event{i}@test.com",
+            nickname=f"Event{i}",
+            password=None,
+            birth_date=date(2000, 1, 1),
+            role="user",
+        )
+        db_session.add(user)
+        users.append(user)
+    db_session.commit()
+    for user in users:
+        db_session.refresh(user)
+    return users
+
+
+def _create_event(client, starts_in=timedelta(hours=-1), ends_in=timedelta(hours=1)):
+    now = datetime.now()
+    response = client.post("/api/v1/events", json={
+        "name": "Weekend Cup",
+        "starts_at": (now + starts_in).isoformat(),
+        "ends_at": (now + ends_in).isoformat(),
+    })
+    assert response.status_code == 200
+    event_id = response.json()["id"]
+    redis_client.delete(get_event_key(event_id))
+    return event_id
+
+
+def _submit(client, event_id, user, score):
+    return client.post(f"/api/v1/events/{event_id}/scores", json={"user_id": user.id, "score": score})
+
+
+class TestEventCreation:
+
+    def test_requires_admin(self, client):
+        response = client.post("/api/v1/events", json={
+            "name": "Cup", "starts_at": "2026-01-01T00:00:00", "ends_at": "2026-01-02T00:00:00",
+        })
+        assert response.status_code in (401, 403)
+
+    def test_rejects_inverted_period(self, admin_client):
+        response = admin_client.post("/api/v1/events", json={
+            "name": "Cup", "starts_at": "2026-01-02T00:00:00", "ends_at": "2026-01-01T00:00:00",
+        })
+        assert response.status_code == 400
+
+    def test_listed_after_creation(self, admin_client):
+        event_id = _create_event(admin_client)
+        data = admin_client.get("/api/v1/events").json()
+        assert data["total"] == 1
+        assert data["events"][0]["id"] == event_id
+
+
+class TestEventScores:
+
+    def test_scores_ranked_by_best(self, admin_client, players):
+        """진행 중인 이벤트에는 최고 점수만 반영되고 순위가 매겨진다"""
+        event_id = _create_event(admin_client)
+        for i, user in enumerate(players, start=1):
+            _submit(admin_client, event_id, user, i * 100)
+        response = _submit(admin_client, event_id, players[0], 50)
+
+        assert response.json() == {"event_id": event_id, "user_id": players[0].id, "score": 100, "rank": 3}
+        data = admin_client.get(f"/api/v1/events/{event_id}/leaderboard").json()
+        assert data["archived"] is False
+        assert [(s["nickname"], s["score"], s["rank"]) for s in data["scores"]] == [
+            ("Event3", 300, 1), ("Event2", 200, 2), ("Event1", 100, 3),
+        ]
+
+    def test_key_expires_after_event_end(self, admin_client, players):
+        event_id = _create_event(admin_client)
+        _submit(admin_client, event_id, players[0], 100)
+
+        ttl = redis_client.ttl(get_event_key(event_id))
+        assert 3600 < ttl <= 3600 + events.EVENT_KEY_GRACE_SECONDS
+
+    def test_rejects_when_not_active(self, admin_client, players):
+        """시작 전 이벤트에는 점수를 받지 않는다"""
+        event_id = _create_event(admin_client, starts_in=timedelta(hours=1), ends_in=timedelta(hours=2))
+
+        assert _submit(admin_client, event_id, players[0], 100).status_code == 409
+        assert not redis_client.exists(get_event_key(event_id))
+
+    def test_board_is_bounded(self, admin_client, players, monkeypatch):
+        """최대 인원을 넘으면 최하위가 제거된다"""
+        from app.core.config import settings
+        monkeypatch.setattr(settings, "EVENT_MAX_ENTRIES", 2)
+        event_id = _create_event(admin_client)
+        for i, user in enumerate(players, start=1):
+            _submit(admin_client, event_id, user, i * 100)
+
+        assert redis_client.zcard(get_event_key(event_id)) == 2
+        assert _submit(admin_client, event_id, players[0], 10).json()["rank"] is None
+
+
+class TestEventArchive:
+
+    def test_ended_event_archived_to_db(self, admin_client, players, db_session):
+        """종료된 이벤트는 event_scores에 보관되고 Redis key는 삭제된다"""
+        from models import Event
+        event_id = _create_event(admin_client)
+        for i, user in enumerate(players, start=1):
+            _submit(admin_client, event_id, user, i * 100)
+
+        event = db_session.query(Event).filter(Event.id == event_id).first()
+        event.starts_at = datetime.now() - timedelta(hours=2)
+        event.ends_at = datetime.now() - timedelta(minutes=1)
+        db_session.commit()
+
+        assert archive_ended_events(db_session) == 1
+        assert archive_ended_events(db_session) == 0
+        assert not redis_client.exists(get_event_key(event_id))
+
+        first = admin_client.get(f"/api/v1/events/{event_id}/leaderboard", params={"limit": 2}).json()
+        assert first["archived"] is True
+        assert first["total"] == 3
+        assert [s["score"] for s in first["scores"]] == [300, 200]
+        rest = admin_client.get(
+            f"/api/v1/events/{event_id}/leaderboard", params={"cursor": first["next_cursor"]}
+        ).json()
+        assert [(s["nickname"], s["rank"]) for s in rest["scores"]] == [("Event1", 3)]
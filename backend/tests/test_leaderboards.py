@@ -0,0 +1,224 @@
+"""기간별(일간/주간/전체) 리더보드 API 테스트"""
+import pytest
+from app.redis_client import redis_client
+from app.api.v1 import leaderboards
+from app.api.v1.leaderboards import get_window_warm_key
+from app.api.v1.monthly_scores import (
+    LEADERBOARD_WINDOWS,
+    get_cache_key,
+    get_nickname_key,
+    get_warm_key,
+    get_version_key,
+    get_changes_key,
+    get_window_key,
+    score_event_buffer,
+    flush_score_events,
+)
+
+
+def _window_keys():
+    keys = [get_cache_key(), get_nickname_key(), get_warm_key(), get_version_key(), get_changes_key()]
+    for window in LEADERBOARD_WINDOWS:
+        keys += [get_window_key(window), get_window_warm_key(window)]
+    return keys
+
+
+@pytest.fixture(autouse=True)
+def cleanup_redis():
+    """각 테스트 전후로 이번 기간 리더보드 key 삭제"""
+    redis_client.delete(*_window_keys())
+    score_event_buffer.drain()
+    yield
+    redis_client.delete(*_window_keys())
+
+
+@pytest.fixture
+def players(db_session):
+    """사용자 3명 생성"""
+    from models import User
+    from datetime import date
+
+    users = []
+    for i in range(1, 4):
+        user = User(
+            email=f"window{i}@test.com",
+            nickname=f"Window{i}",
+            password=None,
+            birth_date=date(2000, 1, 1),
+            role="user",
+        )
+        db_session.add(user)
+        users.append(user)
+    db_session.commit()
+    for user in users:
+        db_session.refresh(user)
+    return users
+
+
+def _submit(client, user, score):
+    response = client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": score})
+    assert response.status_code == 200
+
+
+class TestWindowUpdates:
+    """점수 제출 시 모든 기간 보드 갱신"""
+
+    @pytest.mark.parametrize("window", LEADERBOARD_WINDOWS)
+    def test_submission_updates_every_window(self, client, players, window):
+        """제출한 점수가 각 기간 보드에 최고 점수 기준으로 반영된다"""
+        for i, user in enumerate(players, start=1):
+            _submit(client, user, i * 100)
+        _submit(client, players[2], 50)  # 낮은 점수는 최고 점수를 내리지 않음
+
+        data = client.get(f"/api/v1/leaderboards/{window}").json()
+
+        assert data["window"] == window
+        assert data["total"] == 3
+        assert [(s["nickname"], s["score"], s["rank"]) for s in data["scores"]] == [
+            ("Window3", 300, 1), ("Window2", 200, 2), ("Window1", 100, 3),
+        ]
+
+    def test_batch_submission_updates_windows(self, client, players):
+        """일괄 제출도 같은 스크립트 호출로 기간 보드를 갱신한다"""
+        response = client.post("/api/v1/monthly-scores/batch", json={"scores": [
+            {"user_id": players[0].id, "score": 70},
+            {"user_id": players[1].id, "score": 90},
+        ]})
+        assert response.status_code == 200
+
+        assert redis_client.zscore(get_window_key("daily"), players[1].id) == 90
+        assert redis_client.zscore(get_window_key("all-time"), players[0].id) == 70
+
+    def test_monthly_best_does_not_leak_into_windows(self, client, players, db_session):
+        """이전에 기록된 월간 최고 점수가 있어도 기간 보드에는 이번에 제출한 점수만 들어간다"""
+        from models import MonthlyScore
+        from app.api.v1.monthly_scores import get_month_start
+        db_session.add(MonthlyScore(
+            user_id=players[0].id, nickname=players[0].nickname, score=1000, month=get_month_start(),
+        ))
+        db_session.commit()
+
+        response = client.post("/api/v1/monthly-scores/batch", json={"scores": [
+            {"user_id": players[0].id, "score": 10},
+        ]})
+        assert response.json()["results"][0]["score"] == 1000
+
+        assert redis_client.zscore(get_cache_key(), players[0].id) == 1000
+        for window in LEADERBOARD_WINDOWS:
+            assert redis_client.zscore(get_window_key(window), players[0].id) == 10
+
+    def test_single_submission_resync_keeps_window_score(self, client, players, db_session):
+        """단건 제출이 DB 최고 점수로 월간 보드를 보정할 때도 기간 보드에는 제출 점수만"""
+        from models import MonthlyScore
+        from app.api.v1.monthly_scores import get_month_start
+        db_session.add(MonthlyScore(
+            user_id=players[1].id, nickname=players[1].nickname, score=500, month=get_month_start(),
+        ))
+        db_session.commit()
+
+        _submit(client, players[1], 20)
+
+        assert redis_client.zscore(get_cache_key(), players[1].id) == 500
+        assert redis_client.zscore(get_window_key("daily"), players[1].id) == 20
+
+    def test_expiring_windows_have_ttl(self, client, players):
+        """일간/주간 보드에는 만료 시간이, 전체 기간 보드에는 만료가 없다"""
+        _submit(client, players[0], 100)
+
+        assert redis_client.ttl(get_window_key("daily")) > 0
+        assert redis_client.ttl(get_window_key("weekly")) > redis_client.ttl(get_window_key("daily"))
+        assert redis_client.ttl(get_window_key("all-time")) == -1
+
+    def test_user_deletion_removes_from_windows(self, client, players):
+        """회원 탈퇴 시 기간 보드에서도 제거된다"""
+        from main import app
+        from app.api.deps import require_self_or_admin
+        user = players[0]
+        _submit(client, user, 100)
+
+        app.dependency_overrides[require_self_or_admin] = lambda: {"sub": str(user.id), "role": "user"}
+        response = client.delete(f"/api/v1/users/{user.id}")
+        assert response.status_code == 200
+
+        for window in LEADERBOARD_WINDOWS:
+            assert redis_client.zscore(get_window_key(window), user.id) is None
+
+
+class TestWindowPagination:
+    """월간 리더보드와 같은 limit/offset/cursor 규칙"""
+
+    def test_limit_offset_and_cursor(self, client, players):
+        for i, user in enumerate(players, start=1):
+            _submit(client, user, i * 100)
+
+        first = client.get("/api/v1/leaderboards/weekly", params={"limit": 2}).json()
+        assert [s["score"] for s in first["scores"]] == [300, 200]
+        assert first["next_cursor"] is not None
+
+        by_offset = client.get("/api/v1/leaderboards/weekly", params={"limit": 2, "offset": 2}).json()
+        by_cursor = client.get(
+            "/api/v1/leaderboards/weekly", params={"limit": 2, "cursor": first["next_cursor"]}
+        ).json()
+        assert by_offset["scores"] == by_cursor["scores"]
+        assert [(s["score"], s["rank"]) for s in by_cursor["scores"]] == [(100, 3)]
+        assert by_cursor["next_cursor"] is None
+
+    def test_unknown_window_rejected(self, client):
+        assert client.get("/api/v1/leaderboards/yearly").status_code == 422
+
+
+class TestWindowRebuild:
+    """key 유실 시 DB 재구성 및 Redis 장애 시 DB 폴백"""
+
+    def test_daily_board_rebuilt_from_score_events(self, client, players, db_session):
+        """Redis key가 사라지면 score_events에서 오늘 최고 점수로 재구성한다"""
+        _submit(client, players[0], 100)
+        _submit(client, players[0], 400)
+        _submit(client, players[1], 200)
+        flush_score_events(db_session)
+        redis_client.delete(get_window_key("daily"), get_window_warm_key("daily"))
+
+        data = client.get("/api/v1/leaderboards/daily").json()
+
+        assert [(s["user_id"], s["score"]) for s in data["scores"]] == [(players[0].id, 400), (players[1].id, 200)]
+        assert redis_client.exists(get_window_warm_key("daily"))
+
+    def test_waits_for_other_worker_rebuild(self, client, players, monkeypatch):
+        """다른 워커가 재구성 중(락 보유)이면 바로 DB 폴백하지 않고 재구성 완료를 기다린다"""
+        import threading
+        key = get_window_key("all-time")
+        lock_key = f"{key}:lock"
+        redis_client.set(lock_key, "other-worker", px=5000)
+
+        def other_worker_finishes():
+            redis_client.zadd(key, {players[0].id: 700})
+            redis_client.set(get_window_warm_key("all-time"), 1)
+
+        def must_not_fall_back(*args):
+            raise AssertionError("fell back to DB while another worker was rebuilding")
+
+        monkeypatch.setattr(leaderboards, "_window_best", must_not_fall_back)
+        timer = threading.Timer(0.1, other_worker_finishes)
+        timer.start()
+        try:
+            data = client.get("/api/v1/leaderboards/all-time").json()
+        finally:
+            timer.join()
+            redis_client.delete(lock_key)
+
+        assert [(s["user_id"], s["score"]) for s in data["scores"]] == [(players[0].id, 700)]
+
+    def test_db_fallback_when_redis_fails(self, client, players, db_session, monkeypatch):
+        """Redis 조회가 실패하면 DB 집계(전체 기간 = 월간 최고 점수)로 응답한다"""
+        _submit(client, players[0], 100)
+        _submit(client, players[1], 300)
+
+        def fail(*args, **kwargs):
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(leaderboards, "_read_window_page", fail)
+        data = client.get("/api/v1/leaderboards/all-time", params={"limit": 1}).json()
+
+        assert data["total"] == 2
+        assert [(s["user_id"], s["score"], s["rank"]) for s in data["scores"]] == [(players[1].id, 300, 1)]
+        assert data["next_cursor"] == f"300:{players[1].id}:1"
@@ -0,0 +1,89 @@
+"""로그인 시도 제한 (email/IP 슬라이딩 윈도우) 테스트"""
+import pytest
+from app.core.config import settings
+from app.core.security import password_hasher
+from app.redis_client import redis_client
+from app.api.v1.auth import get_login_throttle_key
+
+
+@pytest.fixture
+def admin_client(client):
+    """require_admin을 통과하는 클라이언트"""
+    from main import app
+    from app.api.deps import require_admin
+
+    app.dependency_overrides[require_admin] = lambda: {"sub": "1", "role": "admin"}
+    return client
+
+
+def _login(client, email="user1@test.com", password="nope", ip="10.0.0.1"):
+    return client.post(
+        "/api/v1/login",
+        json={"email": email, "password": password},
+        headers={"X-Forwarded-For": ip},
+    )
+
+
+def test_email_limit_rejects_before_password_check(client, sample_users, monkeypatch):
+    """email 한도를 넘으면 비밀번호 검증 없이 429 + Retry-After"""
+    monkeypatch.setattr(settings, "LOGIN_THROTTLE_EMAIL_LIMIT", 2)
+    for _ in range(2):
+        assert _login(client).status_code == 401
+
+    def must_not_verify(*args):
+        raise AssertionError("password verified while throttled")
+
+    monkeypatch.setattr(password_hasher, "verify", must_not_verify)
+    response = _login(client, email=" USER1@test.com", password="password1", ip="10.0.0.2")
+
+    assert response.status_code == 429
+    assert 1 <= int(response.headers["Retry-After"]) <= settings.LOGIN_THROTTLE_WINDOW_SECONDS
+    # 거절된 시도는 기록하지 않음
+    assert redis_client.zcard(get_login_throttle_key("email", "user1@test.com")) == 2
+
+
+def test_ip_limit_applies_across_emails(client, sample_users, monkeypatch):
+    monkeypatch.setattr(settings, "LOGIN_THROTTLE_IP_LIMIT", 2)
+    assert _login(client, email="user1@test.com").status_code == 401
+    assert _login(client, email="user2@test.com").status_code == 401
+
+    assert _login(client, email="user3@test.com").status_code == 429
+    assert _login(client, email="user3@test.com", ip="10.0.0.9").status_code == 401
+
+
+def test_spoofed_forwarded_for_does_not_bypass_ip_limit(client, sample_users, monkeypatch):
+    """클라이언트가 X-Forwarded-For 왼쪽 값을 바꿔도 프록시가 덧붙인 값으로 집계된다"""
+    monkeypatch.setattr(settings, "LOGIN_THROTTLE_IP_LIMIT", 2)
+    assert _login(client, ip="1.1.1.1, 10.0.0.1").status_code == 401
+    assert _login(client, ip="2.2.2.2, 10.0.0.1").status_code == 401
+
+    assert _login(client, ip="3.3.3.3, 10.0.0.1").status_code == 429
+
+
+def test_old_attempts_slide_out_of_window(client, sample_users, monkeypatch):
+    """윈도우보다 오래된 시도는 한도 계산에서 빠진다"""
+    monkeypatch.setattr(settings, "LOGIN_THROTTLE_EMAIL_LIMIT", 1)
+    key = get_login_throttle_key("email", "user1@test.com")
+    redis_client.zadd(key, {"stale": 1})
+
+    assert _login(client, password="password1").status_code == 200
+    assert redis_client.zscore(key, "stale") is None
+
+
+def test_admin_sees_counters(admin_client, sample_users, monkeypatch):
+    monkeypatch.setattr(settings, "LOGIN_THROTTLE_EMAIL_LIMIT", 2)
+    for _ in range(2):
+        _login(admin_client)
+
+    data = admin_client.get("/api/v1/auth/login-throttle").json()
+
+    counters = {(c["kind"], c["subject"]): c for c in data["counters"]}
+    assert data["window_seconds"] == settings.LOGIN_THROTTLE_WINDOW_SECONDS
+    assert data["total"] == 2
+    assert counters[("email", "user1@test.com")]["attempts"] == 2
+    assert counters[("email", "user1@test.com")]["blocked"] is True
+    assert counters[("ip", "10.0.0.1")]["blocked"] is False
+
+
+def test_counters_require_admin(client):
+    assert client.get("/api/v1/auth/login-throttle").status_code in (401, 403)
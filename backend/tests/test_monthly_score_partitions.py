@@ -0,0 +1,94 @@
+"""monthly_scores 월별 파티션 관리 테스트"""
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from app.db import partitions
+from app.api.v1.monthly_scores import get_month_start
+
+
+OLD_MONTH = date(2001, 1, 1)
+
+
+@pytest.fixture
+def user(db_session):
+    from models import User
+    user = User(email="partition@test.com", nickname="Partition", password=None, birth_date=date(2000, 1, 1), role="user")
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+@pytest.fixture(autouse=True)
+def drop_old_month_tables(db_session):
+    """테스트가 만든 과거 달 파티션/보관 테이블 정리"""
+    yield
+    db_session.rollback()
+    for name in (partitions.get_partition_name(OLD_MONTH), partitions.get_archive_name(OLD_MONTH)):
+        db_session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    db_session.commit()
+
+
+def _partition_of(db_session, user_id: int, month: date) -> str:
+    return db_session.execute(text(
+        "SELECT tableoid::regclass::text FROM monthly_scores WHERE user_id = :user_id AND month = :month"
+    ), {"user_id": user_id, "month": month}).scalar()
+
+
+def test_current_month_row_goes_to_month_partition(client, user, db_session):
+    """이번 달 점수는 create_all 때 만들어진 이번 달 파티션에 저장된다"""
+    client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": 100})
+
+    assert _partition_of(db_session, user.id, get_month_start()) == partitions.get_partition_name(get_month_start())
+
+
+def test_creating_partition_moves_rows_out_of_default(user, db_session):
+    """기본 파티션에 있던 달의 파티션을 만들면 행이 새 파티션으로 옮겨진다"""
+    from models import MonthlyScore
+    db_session.add(MonthlyScore(user_id=user.id, nickname=user.nickname, score=10, month=OLD_MONTH))
+    db_session.commit()
+    assert _partition_of(db_session, user.id, OLD_MONTH) == partitions.DEFAULT_PARTITION
+
+    assert partitions.create_month_partition(db_session.connection(), OLD_MONTH) is True
+    db_session.commit()
+
+    assert _partition_of(db_session, user.id, OLD_MONTH) == partitions.get_partition_name(OLD_MONTH)
+
+
+def test_expired_partition_is_detached_as_archive(user, db_session):
+    """보관 기간이 지난 파티션은 부모에서 분리되어 보관 테이블로 남는다"""
+    from models import MonthlyScore
+    conn = db_session.connection()
+    partitions.create_month_partition(conn, OLD_MONTH)
+    db_session.add(MonthlyScore(user_id=user.id, nickname=user.nickname, score=10, month=OLD_MONTH))
+    db_session.commit()
+
+    archived = partitions.detach_expired_partitions(db_session.connection(), retain_months=12)
+    db_session.commit()
+
+    assert archived == [partitions.get_archive_name(OLD_MONTH)]
+    assert db_session.query(MonthlyScore).filter(MonthlyScore.month == OLD_MONTH).count() == 0
+    assert db_session.execute(text(f"SELECT count(*) FROM {archived[0]}")).scalar() == 1
+
+
+def test_startup_partition_failure_does_not_block():
+    """시작 시 파티션 작업이 실패해도 예외가 startup 밖으로 나가지 않고 주기 작업은 계속 돈다"""
+    import threading
+    from app import background
+
+    calls = []
+    ran_twice = threading.Event()
+
+    def failing_job():
+        calls.append(1)
+        if len(calls) >= 2:
+            ran_twice.set()
+        raise RuntimeError("partition name race")
+
+    background.start_periodic_job("partition-test", 0.01, failing_job, run_immediately=True)
+    try:
+        assert ran_twice.wait(1)
+    finally:
+        background.stop_periodic_jobs()
@@ -0,0 +1,827 @@
+"""월간 점수 리더보드 API 테스트"""
+import asyncio
+import json
+
+import pytest
+from app.redis_client import redis_client, async_redis_client
+from app.leaderboard_events import LeaderboardBroadcaster
+from app.core.config import settings
+from app.api.v1.monthly_scores import (
+    get_cache_key,
+    get_rank_snapshot_key,
+    get_nickname_key,
+    get_dirty_key,
+    get_warm_key,
+    get_warm_lock_key,
+    get_version_key,
+    get_changes_key,
+    get_month_label,
+    get_previous_month_label,
+    get_month_start,
+    flush_dirty_scores,
+    LEADERBOARD_EVENTS_CHANNEL,
+    page_cache,
+    score_event_buffer,
+    flush_score_events,
+)
+
+
+def _leaderboard_keys():
+    return [
+        get_cache_key(), get_nickname_key(), get_dirty_key(), get_warm_key(), get_warm_lock_key(),
+        get_version_key(), get_changes_key(), get_rank_snapshot_key(),
+    ]
+
+
+@pytest.fixture(autouse=True)
+def cleanup_redis():
+    """각 테스트 전후로 이번 달 리더보드 key 삭제"""
+    redis_client.delete(*_leaderboard_keys())
+    page_cache.clear()
+    score_event_buffer.drain()
+    yield
+    redis_client.delete(*_leaderboard_keys())
+
+
+@pytest.fixture
+def scored_users(db_session):
+    """점수가 서로 다른 사용자 5명 생성 (score: 100, 200, ..., 500)"""
+    from models import User
+    from datetime import date
+
+    users = []
+    for i in range(1, 6):
+        user = User(
+            email=f"player{i}@test.com",
+            nickname=f"Player{i}",
+            password=None,
+            birth_date=date(2000, 1, 1),
+            role="user",
+        )
+        db_session.add(user)
+        users.append(user)
+    db_session.commit()
+    for user in users:
+        db_session.refresh(user)
+    return users
+
+
+def _submit_scores(client, users):
+    for i, user in enumerate(users, start=1):
+        response = client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": i * 100})
+        assert response.status_code == 200
+
+
+class TestMonthlyLeaderboardPagination:
+    """limit/offset 페이지 조회"""
+
+    def test_limit_returns_top_n(self, client, scored_users):
+        """limit=2 이면 상위 2명만 반환하고 total은 전체 인원"""
+        _submit_scores(client, scored_users)
+
+        response = client.get("/api/v1/monthly-scores", params={"limit": 2})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [s["score"] for s in body["scores"]] == [500, 400]
+        assert [s["rank"] for s in body["scores"]] == [1, 2]
+        assert body["total"] == 5
+
+    def test_offset_skips_higher_ranks(self, client, scored_users):
+        """offset=3 이면 4위부터 반환"""
+        _submit_scores(client, scored_users)
+
+        response = client.get("/api/v1/monthly-scores", params={"limit": 10, "offset": 3})
+
+        body = response.json()
+        assert [s["score"] for s in body["scores"]] == [200, 100]
+        assert body["scores"][0]["rank"] == 4
+
+    def test_cursor_continues_after_previous_page(self, client, scored_users):
+        """next_cursor로 다음 페이지를 이어서 조회하고 마지막 페이지에서는 None"""
+        _submit_scores(client, scored_users)
+
+        first = client.get("/api/v1/monthly-scores", params={"limit": 3}).json()
+        second = client.get("/api/v1/monthly-scores", params={"limit": 3, "cursor": first["next_cursor"]}).json()
+
+        assert [s["score"] for s in second["scores"]] == [200, 100]
+        assert [s["rank"] for s in second["scores"]] == [4, 5]
+        assert second["next_cursor"] is None
+
+    def test_db_fallback_uses_keyset_cursor(self, client, scored_users, monkeypatch):
+        """Redis 장애 시 DB 폴백도 같은 cursor로 이어서 조회한다"""
+        from app.api.v1 import monthly_scores
+        _submit_scores(client, scored_users)
+        cursor = client.get("/api/v1/monthly-scores", params={"limit": 2}).json()["next_cursor"]
+
+        def redis_down(*args):
+            raise ConnectionError("redis down")
+        monkeypatch.setattr(monthly_scores, "_read_version", redis_down)
+        body = client.get("/api/v1/monthly-scores", params={"limit": 2, "cursor": cursor}).json()
+
+        assert body["version"] is None
+        assert [(s["rank"], s["score"]) for s in body["scores"]] == [(3, 300), (4, 200)]
+
+    def test_db_fallback_cursor_keeps_redis_tie_order(self, client, db_session, monkeypatch):
+        """동점자는 Redis처럼 user_id 문자열 내림차순("9" > "10")이어서 Redis cursor로 DB 폴백해도 건너뜀/중복이 없다"""
+        from models import User
+        from datetime import date
+        from app.api.v1 import monthly_scores
+        user_ids = [8, 9, 10, 11]
+        for user_id in user_ids:
+            db_session.add(User(
+                id=user_id, email=f"tie{user_id}@test.com", nickname=f"Tie{user_id}",
+                password=None, birth_date=date(2000, 1, 1), role="user",
+            ))
+        db_session.commit()
+        for user_id in user_ids:
+            client.post("/api/v1/monthly-scores", json={"user_id": user_id, "score": 100})
+
+        first = client.get("/api/v1/monthly-scores", params={"limit": 2}).json()
+        assert [s["user_id"] for s in first["scores"]] == [9, 8]
+
+        def redis_down(*args):
+            raise ConnectionError("redis down")
+        monkeypatch.setattr(monthly_scores, "_read_version", redis_down)
+        rest = client.get("/api/v1/monthly-scores", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+        assert [(s["user_id"], s["rank"]) for s in rest["scores"]] == [(11, 3), (10, 4)]
+
+        whole = client.get("/api/v1/monthly-scores", params={"limit": 4}).json()
+        assert [s["user_id"] for s in whole["scores"]] == [9, 8, 11, 10]
+
+    def test_invalid_cursor_returns_400(self, client):
+        """형식이 잘못된 cursor는 400"""
+        response = client.get("/api/v1/monthly-scores", params={"cursor": "abc"})
+        assert response.status_code == 400
+
+    def test_limit_over_max_returns_422(self, client):
+        """limit 최댓값(100) 초과 시 422"""
+        response = client.get("/api/v1/monthly-scores", params={"limit": 1000})
+        assert response.status_code == 422
+
+
+class TestBestScoreUpsert:
+    """POST /monthly-scores — (user_id, month)당 1행, 더 높은 점수만 ON CONFLICT ... WHERE로 갱신"""
+
+    def _rows(self, db_session, user):
+        from models import MonthlyScore
+        db_session.expire_all()
+        return db_session.query(MonthlyScore.score).filter(
+            MonthlyScore.user_id == user.id, MonthlyScore.month == get_month_start()
+        ).all()
+
+    def test_lower_then_higher_keeps_one_row_with_max(self, client, scored_users, db_session):
+        user = scored_users[0]
+        for score in (100, 300, 50):
+            response = client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": score})
+            assert response.status_code == 200
+
+        assert response.json()["score"] == 300
+        assert self._rows(db_session, user) == [(300,)]
+
+    def test_db_upsert_keeps_max_when_redis_down(self, client, scored_users, db_session, monkeypatch):
+        """Redis 판단 없이 DB만으로도 낮은 점수가 최고 점수를 덮어쓰지 않는다"""
+        from app.api.v1 import monthly_scores
+        user = scored_users[0]
+
+        def redis_down(*args, **kwargs):
+            raise ConnectionError("redis down")
+        monkeypatch.setattr(monthly_scores, "record_best_score", redis_down)
+
+        for score in (100, 300, 200):
+            client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": score})
+
+        assert self._rows(db_session, user) == [(300,)]
+
+
+class TestBatchSubmission:
+    """POST /monthly-scores/batch"""
+
+    def test_batch_applies_best_scores_and_reports_per_item(self, client, scored_users, db_session):
+        """항목별 결과를 요청 순서대로 반환하고, 같은 사용자는 최고 점수만, 없는 사용자는 not_found"""
+        from models import MonthlyScore
+        a, b = scored_users[:2]
+        payload = {"scores": [
+            {"user_id": a.id, "score": 300},
+            {"user_id": 99999, "score": 100},
+            {"user_id": b.id, "score": 200},
+            {"user_id": a.id, "score": 500},
+        ]}
+
+        response = client.post("/api/v1/monthly-scores/batch", json=payload)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [(r["user_id"], r["status"], r["score"]) for r in body["results"]] == [
+            (a.id, "ok", 500), (99999, "not_found", None), (b.id, "ok", 200), (a.id, "ok", 500),
+        ]
+        assert (body["accepted"], body["rejected"]) == (3, 1)
+        rows = {row.user_id: row.score for row in db_session.query(MonthlyScore).all()}
+        assert rows == {a.id: 500, b.id: 200}
+        assert redis_client.zscore(get_cache_key(), a.id) == 500
+
+    def test_batch_keeps_existing_higher_score(self, client, scored_users):
+        """기존 최고 점수보다 낮은 점수는 반영되지 않는다"""
+        user = scored_users[0]
+        client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": 800})
+
+        body = client.post("/api/v1/monthly-scores/batch", json={"scores": [{"user_id": user.id, "score": 100}]}).json()
+
+        assert body["results"][0]["score"] == 800
+
+    def test_upsert_locks_rows_in_user_id_order(self, client, scored_users):
+        """요청 순서와 무관하게 VALUES는 user_id 순 (동시 배치끼리 행 잠금 순서가 엇갈리지 않음)"""
+        from sqlalchemy import event
+        from tests.conftest import test_engine
+        a, b, c = scored_users[:3]
+        payload = {"scores": [{"user_id": user.id, "score": 100} for user in (c, a, b)]}
+        inserts = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO monthly_scores"):
+                inserts.append(parameters)
+
+        event.listen(test_engine, "before_cursor_execute", capture)
+        try:
+            client.post("/api/v1/monthly-scores/batch", json=payload)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", capture)
+
+        params = inserts[0]
+        user_ids = [params[f"user_id_m{i}"] for i in range(3)]
+        assert user_ids == sorted(user_ids) == sorted([a.id, b.id, c.id])
+
+    def test_empty_batch_returns_422(self, client):
+        """빈 목록은 422"""
+        response = client.post("/api/v1/monthly-scores/batch", json={"scores": []})
+        assert response.status_code == 422
+
+
+class TestScoreEvents:
+    """score_events 버퍼 + COPY 기록"""
+
+    def test_every_submission_is_recorded(self, client, scored_users, db_session):
+        """최고 점수가 아닌 제출도 score_events에 모두 기록된다"""
+        from models import MonthlyScore, ScoreEvent
+        user = scored_users[0]
+        for score in (300, 100, 200):
+            client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": score})
+
+        assert flush_score_events(db_session) == 3
+
+        assert sorted(e.score for e in db_session.query(ScoreEvent).all()) == [100, 200, 300]
+        assert db_session.query(MonthlyScore.score).filter(MonthlyScore.user_id == user.id).scalar() == 300
+        assert len(score_event_buffer) == 0
+
+    def test_flush_derives_monthly_best(self, scored_users, db_session):
+        """버퍼의 이벤트만으로 (월, 사용자)별 최고 점수가 monthly_scores에 반영된다"""
+        from datetime import datetime
+        from models import MonthlyScore
+        user = scored_users[0]
+        now = datetime.now()
+        score_event_buffer.add((user.id, 40, now), (user.id, 70, now), (user.id, 50, now))
+
+        flush_score_events(db_session)
+
+        row = db_session.query(MonthlyScore).filter(MonthlyScore.user_id == user.id).one()
+        assert (row.score, row.month) == (70, get_month_start())
+
+    def test_flush_does_not_rewrite_row_already_at_best(self, client, scored_users, db_session):
+        """요청 경로가 이미 쓴 최고 점수 행은 플러시가 다시 갱신하지 않는다 (행 버전 xmin 유지)"""
+        from sqlalchemy import text
+        user = scored_users[0]
+        client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": 300})
+        client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": 100})
+        xmin = text("SELECT xmin::text FROM monthly_scores WHERE user_id = :user_id")
+        before = db_session.execute(xmin, {"user_id": user.id}).scalar()
+        db_session.commit()
+
+        assert flush_score_events(db_session) == 2
+
+        assert db_session.execute(xmin, {"user_id": user.id}).scalar() == before
+
+
+class TestDeltaSync:
+    """GET /monthly-scores?since=<version> 증분 동기화"""
+
+    def test_since_returns_only_changed_members(self, client, scored_users):
+        """이전 버전 이후 바뀐 member만 현재 순위와 함께 반환하고 삭제된 member는 removed에 담는다"""
+        _submit_scores(client, scored_users)
+        version = client.get("/api/v1/monthly-scores").json()["version"]
+
+        client.post("/api/v1/monthly-scores", json={"user_id": scored_users[0].id, "score": 450})
+        client.delete(f"/api/v1/monthly-scores/{scored_users[1].id}")
+        response = client.get("/api/v1/monthly-scores", params={"since": version})
+
+        body = response.json()
+        assert body["full"] is False
+        assert [(s["user_id"], s["score"], s["rank"]) for s in body["scores"]] == [(scored_users[0].id, 450, 2)]
+        assert body["removed"] == [scored_users[1].id]
+        assert body["total"] == 4
+        assert body["version"] == version + 2
+
+    def test_current_version_returns_empty_delta(self, client, scored_users):
+        """최신 버전으로 요청하면 변경 없음"""
+        _submit_scores(client, scored_users)
+        version = client.get("/api/v1/monthly-scores").json()["version"]
+
+        body = client.get("/api/v1/monthly-scores", params={"since": version}).json()
+
+        assert (body["full"], body["scores"], body["version"]) == (False, [], version)
+
+    def test_aged_out_version_returns_full_page(self, client, scored_users):
+        """변경 로그에서 밀려난 버전이면 전체 페이지를 반환"""
+        _submit_scores(client, scored_users)
+        version = client.get("/api/v1/monthly-scores").json()["version"]
+        redis_client.xtrim(get_changes_key(), maxlen=1)
+
+        body = client.get("/api/v1/monthly-scores", params={"since": version - 3}).json()
+
+        assert body["full"] is True
+        assert len(body["scores"]) == 5
+
+
+class TestPageCache:
+    """직렬화된 페이지 캐시와 ETag/304"""
+
+    def test_unchanged_board_returns_304(self, client, scored_users):
+        """버전이 그대로면 If-None-Match에 304, 점수가 바뀌면 새 ETag로 200"""
+        _submit_scores(client, scored_users)
+        first = client.get("/api/v1/monthly-scores")
+        etag = first.headers["ETag"]
+
+        cached = client.get("/api/v1/monthly-scores", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+        client.post("/api/v1/monthly-scores", json={"user_id": scored_users[0].id, "score": 999})
+        changed = client.get("/api/v1/monthly-scores", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json()["scores"][0]["score"] == 999
+
+    @pytest.mark.parametrize("if_none_match", ['"other", {etag}', "W/{etag}", "*"])
+    def test_list_weak_and_wildcard_validators_return_304(self, client, scored_users, if_none_match):
+        """쉼표 목록, 프록시가 약한 검증자(W/)로 바꾼 ETag, *도 304"""
+        _submit_scores(client, scored_users)
+        etag = client.get("/api/v1/monthly-scores").headers["ETag"]
+
+        response = client.get("/api/v1/monthly-scores", headers={"If-None-Match": if_none_match.format(etag=etag)})
+
+        assert response.status_code == 304
+
+    def test_cached_page_is_served_without_sorted_set(self, client, scored_users):
+        """같은 버전의 페이지는 Sorted Set이 비어 있어도 캐시된 바이트로 응답"""
+        _submit_scores(client, scored_users)
+        first = client.get("/api/v1/monthly-scores", params={"limit": 3})
+        redis_client.delete(get_cache_key())
+
+        second = client.get("/api/v1/monthly-scores", params={"limit": 3})
+
+        assert second.content == first.content
+
+
+class TestNicknameChange:
+    """리더보드 member는 user_id, 닉네임은 별도 HASH"""
+
+    def test_renamed_player_appears_once_with_new_nickname(self, client, scored_users):
+        """닉네임 변경 후에도 리더보드에 한 번만, 새 닉네임으로 표시된다"""
+        from main import app
+        from app.api.deps import require_self_or_admin
+        user = scored_users[0]
+        client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": 100})
+
+        app.dependency_overrides[require_self_or_admin] = lambda: {"sub": str(user.id), "role": "user"}
+        response = client.put(f"/api/v1/users/{user.id}", json={"nickname": "Renamed"})
+        assert response.status_code == 200
+        client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": 200})
+
+        scores = client.get("/api/v1/monthly-scores").json()["scores"]
+        assert [(s["nickname"], s["score"]) for s in scores] == [("Renamed", 200)]
+
+
+class TestWarmUp:
+    """Redis key가 비어 있을 때의 Sorted Set 재구성"""
+
+    @pytest.fixture
+    def db_only_scores(self, db_session, scored_users):
+        """Redis를 거치지 않고 DB에만 이번 달 점수 저장"""
+        from models import MonthlyScore
+        for i, user in enumerate(scored_users, start=1):
+            db_session.add(MonthlyScore(
+                user_id=user.id, nickname=user.nickname, score=i * 10, month=get_month_start()
+            ))
+        db_session.commit()
+
+    def test_cold_key_is_rebuilt_from_db(self, client, db_only_scores):
+        """key가 없으면 DB에서 재구성하고 재구성 완료 표시를 남긴다"""
+        response = client.get("/api/v1/monthly-scores")
+
+        assert [s["score"] for s in response.json()["scores"]] == [50, 40, 30, 20, 10]
+        assert redis_client.zcard(get_cache_key()) == 5
+        assert redis_client.exists(get_warm_key())
+
+    def test_waiting_worker_falls_back_to_db(self, client, db_only_scores):
+        """다른 워커가 락을 잡고 있으면 재구성하지 않고 DB 폴백으로 응답한다"""
+        redis_client.set(get_warm_lock_key(), "other-worker", px=10_000)
+
+        response = client.get("/api/v1/monthly-scores")
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 5
+        assert redis_client.zcard(get_cache_key()) == 0
+
+
+class TestMonthlyRank:
+    """GET /monthly-scores/rank/{user_id}"""
+
+    def test_rank_returns_position_and_percentile(self, client, scored_users):
+        """300점 사용자는 5명 중 3위, 하위 40%를 앞선다"""
+        _submit_scores(client, scored_users)
+
+        response = client.get(f"/api/v1/monthly-scores/rank/{scored_users[2].id}")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["rank"] == 3
+        assert body["score"] == 300
+        assert body["total"] == 5
+        assert body["percentile"] == 40.0
+
+    def test_rank_without_score_returns_404(self, client, scored_users):
+        """이번 달 점수가 없는 사용자는 404"""
+        response = client.get(f"/api/v1/monthly-scores/rank/{scored_users[0].id}")
+        assert response.status_code == 404
+
+    def test_rank_unknown_user_returns_404(self, client):
+        """존재하지 않는 사용자는 404"""
+        response = client.get("/api/v1/monthly-scores/rank/99999")
+        assert response.status_code == 404
+
+
+class TestRankDelta:
+    """일별 순위 스냅샷 대비 rank_delta"""
+
+    def test_snapshot_records_current_ranks(self, client, scored_users, db_session):
+        from app.api.v1.monthly_scores import snapshot_monthly_ranks
+        _submit_scores(client, scored_users)
+
+        assert snapshot_monthly_ranks(db_session) == 5
+        assert snapshot_monthly_ranks(db_session) == 0  # 하루 1회
+        assert redis_client.hget(get_rank_snapshot_key(), scored_users[4].id) == "1"
+        assert redis_client.ttl(get_rank_snapshot_key()) > 0
+
+    def test_snapshot_skipped_while_another_worker_builds(self, client, scored_users, db_session):
+        """다른 워커가 락을 잡고 만드는 중이면 건드리지 않고 다음 주기로 넘긴다"""
+        from app.api.v1.monthly_scores import get_rank_snapshot_lock_key, snapshot_monthly_ranks
+        _submit_scores(client, scored_users)
+        lock_key = get_rank_snapshot_lock_key(get_rank_snapshot_key())
+        redis_client.set(lock_key, "other-worker", px=5000)
+        try:
+            assert snapshot_monthly_ranks(db_session) == 0
+            assert not redis_client.exists(get_rank_snapshot_key())
+        finally:
+            redis_client.delete(lock_key)
+
+        assert snapshot_monthly_ranks(db_session) == 5
+        assert redis_client.keys(f"{get_rank_snapshot_key()}:*") == []
+
+    def test_page_carries_rank_delta(self, client, scored_users, db_session):
+        """스냅샷 후 100점 사용자가 1위가 되면 +4, 나머지는 -1"""
+        from app.api.v1.monthly_scores import snapshot_monthly_ranks
+        _submit_scores(client, scored_users)
+        before = client.get("/api/v1/monthly-scores")
+        assert all(s["rank_delta"] is None for s in before.json()["scores"])
+
+        snapshot_monthly_ranks(db_session)
+        client.post("/api/v1/monthly-scores", json={"user_id": scored_users[0].id, "score": 1000})
+        body = client.get("/api/v1/monthly-scores").json()
+
+        assert [(s["nickname"], s["rank_delta"]) for s in body["scores"]] == [
+            ("Player1", 4), ("Player5", -1), ("Player4", -1), ("Player3", -1), ("Player2", -1),
+        ]
+        around = client.get(f"/api/v1/monthly-scores/around/{scored_users[0].id}", params={"radius": 1}).json()
+        assert [s["rank_delta"] for s in around["scores"]] == [4, -1]
+
+    def test_snapshot_invalidates_cached_page(self, client, scored_users, db_session):
+        """버전이 같아도 스냅샷이 생기면 ETag가 바뀐다"""
+        from app.api.v1.monthly_scores import snapshot_monthly_ranks
+        _submit_scores(client, scored_users)
+        etag = client.get("/api/v1/monthly-scores").headers["ETag"]
+
+        snapshot_monthly_ranks(db_session)
+        response = client.get("/api/v1/monthly-scores", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["scores"][0]["rank_delta"] == 0
+
+
+class TestAroundMe:
+    """GET /monthly-scores/around/{user_id}"""
+
+    def test_returns_neighbours_within_radius(self, client, scored_users):
+        """300점(3위) 사용자의 radius=1 주변은 2~4위"""
+        _submit_scores(client, scored_users)
+
+        body = client.get(f"/api/v1/monthly-scores/around/{scored_users[2].id}", params={"radius": 1}).json()
+
+        assert [(s["rank"], s["score"]) for s in body["scores"]] == [(2, 400), (3, 300), (4, 200)]
+        assert body["total"] == 5
+
+    def test_window_clipped_at_top(self, client, scored_users):
+        """1위는 위쪽 이웃 없이 본인부터 시작"""
+        _submit_scores(client, scored_users)
+
+        body = client.get(f"/api/v1/monthly-scores/around/{scored_users[4].id}", params={"radius": 2}).json()
+
+        assert [(s["rank"], s["nickname"]) for s in body["scores"]] == [(1, "Player5"), (2, "Player4"), (3, "Player3")]
+
+    def test_db_fallback_matches_redis(self, client, scored_users, monkeypatch):
+        """Redis 장애 시 keyset 쿼리로 같은 구간을 반환한다"""
+        from app.api.v1 import monthly_scores
+        _submit_scores(client, scored_users)
+        expected = client.get(f"/api/v1/monthly-scores/around/{scored_users[1].id}", params={"radius": 2}).json()
+
+        def redis_down(*args):
+            raise ConnectionError("redis down")
+        monkeypatch.setattr(monthly_scores, "_read_rank", redis_down)
+        body = client.get(f"/api/v1/monthly-scores/around/{scored_users[1].id}", params={"radius": 2}).json()
+
+        assert [(s["rank"], s["user_id"]) for s in body["scores"]] == [
+            (s["rank"], s["user_id"]) for s in expected["scores"]
+        ]
+        assert [s["rank"] for s in body["scores"]] == [2, 3, 4, 5]
+
+    def test_without_score_returns_404(self, client, scored_users):
+        response = client.get(f"/api/v1/monthly-scores/around/{scored_users[0].id}")
+        assert response.status_code == 404
+
+
+class TestDistribution:
+    """GET /monthly-scores/distribution"""
+
+    def test_buckets_and_percentile(self, client, scored_users):
+        """100~500점 5명을 2구간으로 나누고, 300점은 하위 40%를 앞선다"""
+        _submit_scores(client, scored_users)
+
+        body = client.get("/api/v1/monthly-scores/distribution", params={"buckets": 2, "score": 300}).json()
+
+        assert body["total"] == 5
+        assert body["buckets"] == [
+            {"min_score": 100, "max_score": 300, "count": 3},
+            {"min_score": 301, "max_score": 501, "count": 2},
+        ]
+        assert body["percentile"] == 40.0
+
+    def test_cached_per_version(self, client, scored_users):
+        """같은 버전이면 캐시된 구간을 쓰고, 점수가 바뀌면 다시 계산한다"""
+        from app.api.v1.monthly_scores import get_distribution_cache_key
+        _submit_scores(client, scored_users)
+        first = client.get("/api/v1/monthly-scores/distribution").json()
+        assert redis_client.exists(get_distribution_cache_key(get_month_label(), first["version"], 10))
+
+        client.post("/api/v1/monthly-scores", json={"user_id": scored_users[0].id, "score": 1000})
+        second = client.get("/api/v1/monthly-scores/distribution").json()
+
+        assert second["version"] > first["version"]
+        assert second["buckets"][-1]["max_score"] >= 1000
+
+    def test_db_fallback_matches_redis(self, client, scored_users, monkeypatch):
+        """Redis 장애 시 DB 집계로 같은 분포를 반환한다"""
+        from app.api.v1 import monthly_scores
+        _submit_scores(client, scored_users)
+        expected = client.get("/api/v1/monthly-scores/distribution", params={"buckets": 3, "score": 250}).json()
+
+        def redis_down(*args):
+            raise ConnectionError("redis down")
+        monkeypatch.setattr(monthly_scores, "_read_distribution_state", redis_down)
+        body = client.get("/api/v1/monthly-scores/distribution", params={"buckets": 3, "score": 250}).json()
+
+        assert body["version"] is None
+        assert body["buckets"] == expected["buckets"]
+        assert body["percentile"] == expected["percentile"] == 40.0
+
+    def test_empty_board(self, client):
+        body = client.get("/api/v1/monthly-scores/distribution", params={"score": 10}).json()
+        assert body["total"] == 0
+        assert body["buckets"] == []
+        assert body["percentile"] is None
+
+
+class TestWriteBehind:
+    """SCORE_WRITE_BEHIND 모드: Redis 우선 기록 + 백그라운드 DB 반영"""
+
+    @pytest.fixture(autouse=True)
+    def write_behind(self, monkeypatch):
+        monkeypatch.setattr(settings, "SCORE_WRITE_BEHIND", True)
+
+    def test_submission_keeps_best_score_without_db_write(self, client, scored_users, db_session):
+        """낮은 점수를 다시 제출해도 최고 점수가 유지되고, 플러시 전에는 DB에 기록되지 않는다"""
+        from models import MonthlyScore
+        user = scored_users[0]
+
+        client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": 700})
+        response = client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": 300})
+
+        assert response.status_code == 200
+        assert response.json()["score"] == 700
+        assert db_session.query(MonthlyScore).count() == 0
+        assert client.get(f"/api/v1/monthly-scores/{user.id}").json()["score"] == 700
+
+    def test_flush_persists_dirty_scores(self, client, scored_users, db_session):
+        """flush_dirty_scores 실행 시 최고 점수가 monthly_scores에 반영된다"""
+        from models import MonthlyScore
+        _submit_scores(client, scored_users)
+        client.post("/api/v1/monthly-scores", json={"user_id": scored_users[0].id, "score": 900})
+
+        flushed = flush_dirty_scores(db_session, get_month_label(), batch_size=100)
+
+        assert flushed == 5
+        rows = {row.user_id: row.score for row in db_session.query(MonthlyScore).all()}
+        assert rows[scored_users[0].id] == 900
+        assert rows[scored_users[4].id] == 500
+        assert redis_client.scard(get_dirty_key()) == 0
+
+
+class TestMonthlyHistory:
+    """GET /monthly-scores/history/{yyyy-mm}"""
+
+    def test_finished_month_is_archived_and_served(self, client, scored_users, db_session):
+        """지난달 점수는 스냅샷으로 고정되어 순위대로 반환되고 무기한 캐시 헤더가 붙는다"""
+        from models import MonthlyScore, MonthlyScoreSnapshot
+        month = get_previous_month_label()
+        for i, user in enumerate(scored_users, start=1):
+            db_session.add(MonthlyScore(
+                user_id=user.id, nickname=user.nickname, score=i * 100, month=get_month_start(month)
+            ))
+        db_session.commit()
+
+        response = client.get(f"/api/v1/monthly-scores/history/{month}", params={"limit": 3})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 5
+        assert [(s["rank"], s["score"]) for s in body["scores"]] == [(1, 500), (2, 400), (3, 300)]
+        assert "immutable" in response.headers["Cache-Control"]
+        assert db_session.query(MonthlyScoreSnapshot).count() == 5
+
+    def test_offset_past_end_reports_real_total(self, client, scored_users, db_session):
+        """마지막 순위를 넘는 offset도 빈 페이지와 함께 실제 total을 반환한다"""
+        from models import MonthlyScore
+        month = get_previous_month_label()
+        for i, user in enumerate(scored_users, start=1):
+            db_session.add(MonthlyScore(
+                user_id=user.id, nickname=user.nickname, score=i * 100, month=get_month_start(month)
+            ))
+        db_session.commit()
+
+        response = client.get(f"/api/v1/monthly-scores/history/{month}", params={"offset": 10})
+
+        assert response.status_code == 200
+        assert response.json()["scores"] == []
+        assert response.json()["total"] == 5
+
+    def test_concurrent_archival_waits_then_503(self, client, scored_users, db_session, monkeypatch):
+        """다른 워커가 보관 중(락 보유)이면 직접 스캔하지 않고 기다렸다가 503"""
+        from models import MonthlyScore
+        from app.api.v1 import monthly_scores
+        month = get_previous_month_label()
+        db_session.add(MonthlyScore(
+            user_id=scored_users[0].id, nickname=scored_users[0].nickname, score=100, month=get_month_start(month)
+        ))
+        db_session.commit()
+        monkeypatch.setattr(monthly_scores, "WARM_UP_WAIT_SECONDS", 0.1)
+        lock_key = monthly_scores.get_archive_lock_key(month)
+        redis_client.set(lock_key, "other-worker", px=5000)
+
+        def must_not_archive(*args):
+            raise AssertionError("archived without the lock")
+
+        monkeypatch.setattr(monthly_scores, "archive_month", must_not_archive)
+        try:
+            response = client.get(f"/api/v1/monthly-scores/history/{month}")
+        finally:
+            redis_client.delete(lock_key)
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+    def test_archive_job_shares_the_history_lock(self, scored_users, db_session, monkeypatch):
+        """월 전환 작업도 history와 같은 락을 따르므로, 다른 워커가 보관 중이면 스캔하지 않고 넘어간다"""
+        import main
+        from app.api.v1 import monthly_scores
+        from tests.conftest import TestSessionLocal
+        month = get_previous_month_label()
+        monkeypatch.setattr(main, "SessionLocal", TestSessionLocal)
+        monkeypatch.setattr(monthly_scores, "WARM_UP_WAIT_SECONDS", 0.1)
+        lock_key = monthly_scores.get_archive_lock_key(month)
+        redis_client.set(lock_key, "other-worker", px=5000)
+
+        def must_not_archive(*args):
+            raise AssertionError("archived without the lock")
+
+        monkeypatch.setattr(monthly_scores, "archive_month", must_not_archive)
+        try:
+            main.archive_previous_month_job()
+        finally:
+            redis_client.delete(lock_key)
+
+    def test_current_month_returns_400(self, client):
+        """진행 중인 달은 400"""
+        response = client.get(f"/api/v1/monthly-scores/history/{get_month_label()}")
+        assert response.status_code == 400
+
+    def test_month_without_scores_returns_404(self, client):
+        """점수가 없는 달은 404"""
+        response = client.get("/api/v1/monthly-scores/history/2001-01")
+        assert response.status_code == 404
+
+
+class TestFriendsLeaderboard:
+    """GET /monthly-scores/friends/{user_id}"""
+
+    @pytest.fixture(autouse=True)
+    def cleanup_friend_sets(self, scored_users):
+        from app.api.v1.friends import get_friends_key
+        keys = [get_friends_key(user.id) for user in scored_users]
+        redis_client.delete(*keys)
+        yield
+        redis_client.delete(*keys)
+
+    def _befriend(self, client, requester, receiver):
+        client.post("/api/friend-requests", json={"requester_id": requester.id, "receiver_id": receiver.id})
+        response = client.post("/api/friend-requests/accept", json={"requester_id": requester.id, "receiver_id": receiver.id})
+        assert response.status_code == 200
+
+    def test_board_contains_only_self_and_accepted_friends(self, client, scored_users):
+        """본인과 수락된 친구만 점수 순으로 반환한다 (대기 중인 요청은 제외)"""
+        me, friend1, friend2, pending, _ = scored_users
+        _submit_scores(client, scored_users)
+        self._befriend(client, me, friend1)
+        self._befriend(client, friend2, me)
+        client.post("/api/friend-requests", json={"requester_id": me.id, "receiver_id": pending.id})
+
+        response = client.get(f"/api/v1/monthly-scores/friends/{me.id}")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [(s["user_id"], s["rank"]) for s in body["scores"]] == [(friend2.id, 1), (friend1.id, 2), (me.id, 3)]
+        assert body["total"] == 3
+
+    def test_accept_updates_cached_friend_set(self, client, scored_users):
+        """친구 SET이 캐시된 뒤 수락한 친구도 다음 조회에 포함된다"""
+        me, friend1, friend2 = scored_users[:3]
+        _submit_scores(client, scored_users)
+        self._befriend(client, me, friend1)
+        client.get(f"/api/v1/monthly-scores/friends/{me.id}")  # 친구 SET 캐시
+
+        self._befriend(client, me, friend2)
+        response = client.get(f"/api/v1/monthly-scores/friends/{me.id}")
+
+        assert {s["user_id"] for s in response.json()["scores"]} == {me.id, friend1.id, friend2.id}
+
+
+class TestLiveStream:
+    """점수 변경 pub/sub 이벤트와 SSE 브로드캐스터"""
+
+    def test_score_submission_publishes_event(self, client, scored_users):
+        """점수 제출 시 이벤트 채널로 변경이 발행된다 (최고 점수가 바뀌지 않으면 발행하지 않음)"""
+        user = scored_users[0]
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(LEADERBOARD_EVENTS_CHANNEL)
+        try:
+            pubsub.get_message(timeout=1)  # 구독 확인 메시지 소비
+            client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": 300})
+            client.post("/api/v1/monthly-scores", json={"user_id": user.id, "score": 100})
+
+            message = pubsub.get_message(timeout=2)
+            event = json.loads(message["data"])
+            assert (event["month"], event["user_id"], event["score"]) == (get_month_label(), user.id, 300)
+            assert pubsub.get_message(timeout=0.3) is None
+        finally:
+            pubsub.close()
+
+    def test_broadcaster_coalesces_changes_into_one_diff(self, client, scored_users):
+        """interval 안의 여러 변경은 순위가 포함된 diff 하나로 합쳐져 전달된다"""
+        broadcaster = LeaderboardBroadcaster(
+            LEADERBOARD_EVENTS_CHANNEL, get_cache_key, get_nickname_key(), interval=0.5
+        )
+
+        async def receive_one():
+            queue = broadcaster.subscribe()
+            await asyncio.sleep(0.2)  # pub/sub 구독 완료 대기
+            _submit_scores(client, scored_users)
+            try:
+                return await asyncio.wait_for(queue.get(), timeout=3)
+            finally:
+                broadcaster.unsubscribe(queue)
+                await broadcaster._task
+                await async_redis_client.connection_pool.disconnect()
+
+        event = asyncio.run(receive_one())
+
+        assert event["type"] == "diff"
+        changes = event["data"]["changes"]
+        assert [(c["nickname"], c["rank"]) for c in changes] == [
+            ("Player5", 1), ("Player4", 2), ("Player3", 3), ("Player2", 4), ("Player1", 5)
+        ]
+        assert event["data"]["total"] == 5
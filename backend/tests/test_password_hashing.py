@@ -0,0 +1,66 @@
+"""비밀번호 해싱 프로세스 풀 테스트"""
+import asyncio
+
+import anyio
+import pytest
+from app.core.security import PasswordHashingBusy, PasswordHashingPool, password_hasher
+
+
+def test_hash_and_verify_in_process_pool():
+    """풀에서 만든 해시를 풀에서 검증할 수 있다"""
+    pool = PasswordHashingPool(workers=1, max_pending=0)
+
+    async def run():
+        hashed = await pool.hash("secret")
+        return await pool.verify("secret", hashed), await pool.verify("wrong", hashed)
+
+    try:
+        assert asyncio.run(run()) == (True, False)
+    finally:
+        pool.shutdown()
+
+
+def test_pending_hashes_do_not_hold_threadpool_threads():
+    """해싱을 기다리는 동안 AnyIO threadpool 토큰을 빌리지 않는다 (다른 def 엔드포인트가 굶지 않음)"""
+    pool = PasswordHashingPool(workers=1, max_pending=3)
+
+    async def run():
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        tasks = [asyncio.ensure_future(pool.hash("secret")) for _ in range(4)]
+        await asyncio.sleep(0)
+        borrowed = limiter.borrowed_tokens
+        await asyncio.gather(*tasks)
+        return borrowed
+
+    try:
+        assert asyncio.run(run()) == 0
+    finally:
+        pool.shutdown()
+
+
+def test_full_pool_rejects_immediately():
+    """실행 + 대기 슬롯이 모두 차 있으면 기다리지 않고 PasswordHashingBusy"""
+    pool = PasswordHashingPool(workers=1, max_pending=0)
+    pool._slots.acquire()
+
+    with pytest.raises(PasswordHashingBusy):
+        asyncio.run(pool.hash("secret"))
+
+
+def test_login_uses_pool(client, sample_users):
+    response = client.post("/api/v1/login", json={"email": "user1@test.com", "password": "password1"})
+    assert response.status_code == 200
+
+    response = client.post("/api/v1/login", json={"email": "user1@test.com", "password": "nope"})
+    assert response.status_code == 401
+
+
+def test_login_sheds_load_when_pool_full(client, sample_users, monkeypatch):
+    """해싱 대기열이 가득 차면 로그인은 즉시 503 + Retry-After"""
+    monkeypatch.setattr(password_hasher, "_slots", PasswordHashingPool(1, 0)._slots)
+    password_hasher._slots.acquire()
+
+    response = client.post("/api/v1/login", json={"email": "user1@test.com", "password": "password1"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,60 @@
+"""Redis 서킷 브레이커 테스트"""
+import pytest
+from app.redis_client import redis_client, redis_breaker, RedisUnavailable
+
+
+@pytest.fixture(autouse=True)
+def reset_breaker():
+    """각 테스트 후 브레이커를 닫힌 상태로 복구"""
+    redis_breaker.close()
+    yield
+    redis_breaker.close()
+
+
+def _trip():
+    for _ in range(redis_breaker.failure_threshold):
+        redis_breaker.record_failure()
+
+
+def test_breaker_opens_after_consecutive_failures():
+    """연속 실패가 임계치에 도달하면 Redis 호출이 즉시 실패한다"""
+    _trip()
+
+    assert redis_breaker.is_open
+    with pytest.raises(RedisUnavailable):
+        redis_client.get("any-key")
+    with pytest.raises(RedisUnavailable):
+        redis_client.pipeline().get("any-key").execute()
+
+
+def test_success_resets_failure_count():
+    """성공 호출이 연속 실패 횟수를 초기화한다"""
+    redis_breaker.record_failure()
+    redis_client.ping()
+    assert redis_breaker.consecutive_failures == 0
+
+
+def test_health_endpoint_reports_state(client):
+    """/api/health/redis는 닫힘 200, 열림 503"""
+    assert client.get("/api/health/redis").json()["state"] == "closed"
+
+    _trip()
+    response = client.get("/api/health/redis")
+
+    assert response.status_code == 503
+    assert response.json()["state"] == "open"
+
+
+def test_open_breaker_returns_503_for_redis_only_endpoint(auth_client):
+    """DB 폴백이 없는 게임 세션 조회는 열린 동안 즉시 503"""
+    _trip()
+    response = auth_client.get("/api/v1/game-sessions/999")
+    assert response.status_code == 503
+
+
+def test_open_breaker_falls_back_to_db_for_leaderboard(client):
+    """리더보드 조회는 열린 동안 DB 폴백으로 응답"""
+    _trip()
+    response = client.get("/api/v1/monthly-scores")
+    assert response.status_code == 200
+    assert response.json()["version"] is None
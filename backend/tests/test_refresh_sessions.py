@@ -0,0 +1,193 @@
+"""refresh 세션 (클레임 HASH + 사용자별 인덱스) 테스트"""
+import pytest
+from jose import jwt
+
+from app.core.config import settings
+from app.redis_client import redis_client
+from app.api.v1.auth import get_refresh_session_id, get_refresh_session_key, get_user_sessions_key
+
+
+def _login(client, email="user1@test.com", password="password1"):
+    response = client.post("/api/v1/login", json={"email": email, "password": password})
+    assert response.status_code == 200
+    return response.cookies["refresh_token"]
+
+
+def _refresh(client, token):
+    return client.post("/api/v1/auth/refresh", cookies={"refresh_token": token})
+
+
+def _claims(response):
+    return jwt.decode(response.json()["access_token"], settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+
+
+@pytest.fixture(autouse=True)
+def cleanup_sessions():
+    """user_id가 테스트마다 1부터 다시 시작하므로 이전 테스트의 세션 인덱스/세션 key 삭제"""
+    keys = list(redis_client.scan_iter("refresh_sessions:*")) + list(redis_client.scan_iter("refresh_session:*"))
+    if keys:
+        redis_client.delete(*keys)
+    yield
+
+
+@pytest.fixture
+def signed_in(client):
+    """get_current_user를 지정한 사용자로 고정하는 헬퍼"""
+    from main import app
+    from app.api.deps import get_current_user
+
+    def sign_in(user_id):
+        app.dependency_overrides[get_current_user] = lambda: {"sub": str(user_id), "role": "user"}
+    return sign_in
+
+
+@pytest.fixture
+def as_user(client):
+    """require_self_or_admin을 통과시키는 헬퍼"""
+    from main import app
+    from app.api.deps import require_self_or_admin
+
+    def allow(user_id, role="user"):
+        app.dependency_overrides[require_self_or_admin] = lambda: {"sub": str(user_id), "role": role}
+    return allow
+
+
+def test_refresh_uses_session_hash_without_db(client, sample_users, monkeypatch):
+    """재발급은 세션 HASH의 클레임으로 만들고 DB 세션을 열지 않는다"""
+    token = _login(client)
+    session_id = get_refresh_session_id(token)
+    assert redis_client.hget(get_refresh_session_key(session_id), "email") == "user1@test.com"
+    assert redis_client.zscore(get_user_sessions_key(sample_users[0].id), session_id) is not None
+
+    from main import app
+    from app.api.deps import get_db
+
+    class NoDB:
+        def __getattr__(self, name):
+            raise AssertionError("database used")
+
+    monkeypatch.setitem(app.dependency_overrides, get_db, NoDB)
+    response = _refresh(client, token)
+
+    assert response.status_code == 200
+    claims = _claims(response)
+    assert (claims["sub"], claims["nickname"], claims["role"]) == (str(sample_users[0].id), "User1", "user")
+
+
+def test_update_user_syncs_session_claims(client, sample_users, as_user):
+    token = _login(client)
+    as_user(sample_users[0].id, role="admin")
+
+    response = client.put(f"/api/v1/users/{sample_users[0].id}", json={"nickname": "Renamed", "role": "admin"})
+    assert response.status_code == 200
+
+    claims = _claims(_refresh(client, token))
+    assert (claims["nickname"], claims["role"]) == ("Renamed", "admin")
+
+
+def test_delete_user_revokes_sessions(client, sample_users, as_user):
+    user_id = sample_users[0].id
+    tokens = [_login(client), _login(client)]
+    as_user(user_id)
+
+    assert client.delete(f"/api/v1/users/{user_id}").status_code == 200
+
+    for token in tokens:
+        assert _refresh(client, token).status_code == 401
+    assert not redis_client.exists(get_user_sessions_key(user_id))
+
+
+def test_logout_removes_session_from_index(client, sample_users):
+    token = _login(client)
+
+    client.post("/api/v1/auth/logout", cookies={"refresh_token": token})
+
+    assert _refresh(client, token).status_code == 401
+    assert redis_client.zscore(get_user_sessions_key(sample_users[0].id), get_refresh_session_id(token)) is None
+
+
+def test_legacy_refresh_token_still_accepted(client, sample_users):
+    """배포 전 형식(`refresh:{token}` = user_id)은 DB 조회로 계속 재발급된다"""
+    redis_client.setex("refresh:legacy-token", 60, str(sample_users[1].id))
+
+    response = _refresh(client, "legacy-token")
+
+    assert response.status_code == 200
+    assert _claims(response)["email"] == "user2@test.com"
+
+
+class TestSessionIndex:
+    """사용자별 세션 인덱스 ZSET (score = 만료 시각)"""
+
+    def test_list_sessions_marks_current(self, client, sample_users, signed_in):
+        first, second = _login(client), _login(client)
+        _login(client, email="user2@test.com", password="password2")
+        signed_in(sample_users[0].id)
+
+        data = client.get("/api/v1/auth/sessions", cookies={"refresh_token": second}).json()
+
+        assert data["total"] == 2
+        assert {s["session_id"]: s["current"] for s in data["sessions"]} == {
+            get_refresh_session_id(first): False, get_refresh_session_id(second): True,
+        }
+
+    def test_expired_entries_are_pruned(self, client, sample_users, signed_in):
+        key = get_user_sessions_key(sample_users[0].id)
+        redis_client.zadd(key, {"expired-session": 1})
+        _login(client)
+        signed_in(sample_users[0].id)
+
+        assert client.get("/api/v1/auth/sessions").json()["total"] == 1
+        assert redis_client.zscore(key, "expired-session") is None
+
+    def test_logout_all_revokes_every_session(self, client, sample_users, signed_in):
+        tokens = [_login(client), _login(client)]
+        other = _login(client, email="user2@test.com", password="password2")
+        signed_in(sample_users[0].id)
+
+        response = client.post("/api/v1/auth/logout-all")
+
+        assert response.json()["revoked"] == 2
+        assert all(_refresh(client, token).status_code == 401 for token in tokens)
+        assert _refresh(client, other).status_code == 200
+        assert client.get("/api/v1/auth/sessions").json()["total"] == 0
+
+    def test_password_change_revokes_sessions(self, client, sample_users, as_user):
+        token = _login(client)
+        as_user(sample_users[0].id)
+
+        assert client.put(f"/api/v1/users/{sample_users[0].id}", json={"password": "changed"}).status_code == 200
+
+        assert _refresh(client, token).status_code == 401
+
+    def test_sessions_require_login(self, client):
+        assert client.get("/api/v1/auth/sessions").status_code == 401
+        assert client.post("/api/v1/auth/logout-all").status_code == 401
+
+
+class TestLegacyTokens:
+    """배포 전 `refresh:{token}` 토큰도 일괄 폐기 대상"""
+
+    def test_legacy_token_migrated_to_session_on_use(self, client, sample_users, signed_in):
+        from app.api.v1.auth import REFRESH_TTL
+        user_id = sample_users[0].id
+        redis_client.setex("refresh:legacy-a", REFRESH_TTL, str(user_id))
+
+        assert _refresh(client, "legacy-a").status_code == 200
+
+        assert not redis_client.exists("refresh:legacy-a")
+        assert redis_client.zscore(get_user_sessions_key(user_id), get_refresh_session_id("legacy-a")) is not None
+        signed_in(user_id)
+        assert client.post("/api/v1/auth/logout-all").json()["revoked"] == 1
+        assert _refresh(client, "legacy-a").status_code == 401
+
+    def test_unused_legacy_token_rejected_after_password_change(self, client, sample_users, as_user):
+        from app.api.v1.auth import REFRESH_TTL
+        user_id = sample_users[0].id
+        redis_client.setex("refresh:legacy-b", REFRESH_TTL - 60, str(user_id))  # 1분 전 발급
+        as_user(user_id)
+
+        assert client.put(f"/api/v1/users/{user_id}", json={"password": "changed"}).status_code == 200
+
+        assert _refresh(client, "legacy-b").status_code == 401
+        assert not redis_client.exists("refresh:legacy-b")
@@ -0,0 +1,77 @@
+"""Access Token 검증 캐시 테스트"""
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from app.api import deps
+from app.api.deps import get_current_user, token_cache
+from app.core.config import settings
+from app.core.security import create_access_token
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+def _bearer(token):
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _token(exp):
+    return jwt.encode({"sub": "1", "role": "user", "exp": exp}, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
+def test_repeat_request_skips_signature_check(monkeypatch):
+    """같은 토큰은 두 번째부터 jwt.decode 없이 캐시된 payload를 반환"""
+    token = create_access_token({"sub": "7", "role": "user"})
+    first = get_current_user(_bearer(token))
+
+    def must_not_decode(*args, **kwargs):
+        raise AssertionError("token decoded again")
+
+    monkeypatch.setattr(deps.jwt, "decode", must_not_decode)
+    second = get_current_user(_bearer(token))
+
+    assert second == first
+    assert second is not first  # 호출자가 수정해도 캐시가 오염되지 않음
+    assert token_cache.hits == 1
+
+
+def test_cached_token_still_expires(monkeypatch):
+    """캐시에 있어도 exp가 지나면 다시 검증해 401"""
+    exp = int(time.time()) + 60
+    token = _token(exp)
+    get_current_user(_bearer(token))
+
+    def expired(*args, **kwargs):
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    monkeypatch.setattr(deps.time, "time", lambda: exp + 1)
+    monkeypatch.setattr(deps.jwt, "decode", expired)
+    with pytest.raises(HTTPException) as exc:
+        get_current_user(_bearer(token))
+
+    assert exc.value.status_code == 401
+    assert token_cache.snapshot()["size"] == 0
+
+
+def test_invalid_token_not_cached():
+    with pytest.raises(HTTPException):
+        get_current_user(_bearer("not-a-jwt"))
+    assert token_cache.snapshot()["size"] == 0
+
+
+def test_cache_stats_endpoint(client):
+    token = create_access_token({"sub": "1", "role": "user"})
+    for _ in range(3):
+        client.get("/api/v1/users", headers={"Authorization": f"Bearer {token}"})
+
+    data = client.get("/api/health/jwt-cache").json()
+    assert data["size"] == 1
+    assert data["hits"] >= 2